@@ -6,6 +6,7 @@ from starlette.middleware.cors import CORSMiddleware
 from init_app import create_app
 from settings.config import PREFIX
 from v2.main import app as v2_app
+from v3.grpc_config.dataflow_to_dataview.client import DataviewClient
 from v3.main import app as v3_app
 from services.security.security_factory import security
 from settings import config
@@ -15,6 +16,7 @@ from settings import config
 async def lifespan(app: FastAPI):
     print("startup")
     yield
+    await DataviewClient.close()
 
 
 if config.DEBUG:
@@ -24,6 +24,9 @@ AIRFLOW_PASS = os.environ.get("AIRFLOW_PASS", None)
 
 # cryptography.fernet Fernet.generate_key()
 CRYPTO_KEY = os.environ.get("CRYPTO_KEY", None)
+# decrypted con_data of sources and destinations kept in memory, 0 turns the
+# cache off
+CON_DATA_CACHE_SIZE = int(os.environ.get("CON_DATA_CACHE_SIZE", 1024))
 
 # MinIO settings
 MINIO_URL = os.environ.get("MINIO_URL", "minio:9000")
@@ -45,3 +48,84 @@ DATAVIEW_MANAGER_GRPC_PORT = os.environ.get(
     "DATAVIEW_MANAGER_GRPC_PORT", "50051"
 )
 DATAVIEW_GRPC_URL = f"{DATAVIEW_MANAGER_HOST}:{DATAVIEW_MANAGER_GRPC_PORT}"
+
+# split loads into several InsertData calls, only for DATAVIEW MANAGER
+# versions which append segments of one load and drop replayed rows by
+# sequence, otherwise the whole load is sent by one call
+DATAVIEW_SEGMENTED_INSERT = os.environ.get(
+    "DATAVIEW_SEGMENTED_INSERT", "False"
+).upper() in (
+    "TRUE",
+    "Y",
+    "YES",
+    "1",
+)
+# DATAVIEW MANAGER applies DataRequest.operation (insert, update or delete)
+# to rows of previous loads instead of replacing source data by every load.
+# Only then delta loads send changed rows and incremental loads send new
+# rows marked as inserted, otherwise sources with delta_load or
+# watermark_column are loaded completely
+DATAVIEW_ROW_OPERATIONS = os.environ.get(
+    "DATAVIEW_ROW_OPERATIONS", "False"
+).upper() in (
+    "TRUE",
+    "Y",
+    "YES",
+    "1",
+)
+# rows sent to DATAVIEW MANAGER per InsertData call, the load is checkpointed
+# after every acknowledged call
+DATAVIEW_INSERT_SEGMENT_SIZE = int(
+    os.environ.get("DATAVIEW_INSERT_SEGMENT_SIZE", 100_000)
+)
+
+# External DB sources
+# number of engines (connection pools) kept open for DB sources
+DB_SOURCE_ENGINE_CACHE_SIZE = int(
+    os.environ.get("DB_SOURCE_ENGINE_CACHE_SIZE", 32)
+)
+# default pool size of one DB source, may be overridden by con_data.pool_size
+DB_SOURCE_POOL_SIZE = int(os.environ.get("DB_SOURCE_POOL_SIZE", 5))
+DB_SOURCE_MAX_OVERFLOW = int(os.environ.get("DB_SOURCE_MAX_OVERFLOW", 5))
+# seconds reflected table definitions of DB sources are cached for
+DB_SOURCE_REFLECTION_TTL = int(os.environ.get("DB_SOURCE_REFLECTION_TTL", 300))
+# extract PostgreSQL sources with COPY ... TO STDOUT instead of SELECT,
+# used only for tables of integer, numeric, text, boolean and date columns
+DB_SOURCE_POSTGRES_COPY = os.environ.get(
+    "DB_SOURCE_POSTGRES_COPY", "False"
+).upper() in (
+    "TRUE",
+    "Y",
+    "YES",
+    "1",
+)
+
+# REST API sources
+# hard limit of pages requested from one paginated API source
+API_SOURCE_MAX_PAGES = int(os.environ.get("API_SOURCE_MAX_PAGES", 10_000))
+# pages of one API source requested at the same time when number of pages is
+# known, may be overridden by pagination.concurrency
+API_SOURCE_CONCURRENCY = int(os.environ.get("API_SOURCE_CONCURRENCY", 4))
+# connections kept open by HTTP client shared by API sources
+API_SOURCE_MAX_CONNECTIONS = int(
+    os.environ.get("API_SOURCE_MAX_CONNECTIONS", 100)
+)
+# number of API sources which HTTP sessions and OAuth tokens are kept for
+API_SOURCE_SESSION_CACHE_SIZE = int(
+    os.environ.get("API_SOURCE_SESSION_CACHE_SIZE", 64)
+)
+# seconds to wait for response of API source
+API_SOURCE_TIMEOUT = float(os.environ.get("API_SOURCE_TIMEOUT", 60))
+# use HTTP/2 for concurrent requests, requires h2 package (httpx[http2])
+API_SOURCE_HTTP2 = os.environ.get("API_SOURCE_HTTP2", "False").upper() in (
+    "TRUE",
+    "Y",
+    "YES",
+    "1",
+)
+
+# Source preview
+# seconds previews of source data are cached for
+SOURCE_PREVIEW_CACHE_TTL = int(os.environ.get("SOURCE_PREVIEW_CACHE_TTL", 30))
+# max rows one preview may return
+SOURCE_PREVIEW_MAX_ROWS = int(os.environ.get("SOURCE_PREVIEW_MAX_ROWS", 1000))
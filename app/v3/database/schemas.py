@@ -2,6 +2,8 @@ import json
 from typing import Any
 
 from sqlalchemy import (
+    BigInteger,
+    Boolean,
     Column,
     Integer,
     String,
@@ -15,7 +17,7 @@ from sqlalchemy.orm import declarative_base, synonym, validates, relationship
 from v3.routers.destinations.enums import ConType
 from v3.routers.groups.models import SourceMappingTypes
 from v3.routers.sources.models.general_model import SourceType
-from v3.utils.encryption_utils import encrypt_data, decrypt_data
+from v3.utils.encryption_utils import encrypt_data, decrypt_json
 
 from v3.routers.sources.utils.exceptions import ValidationError
 
@@ -74,7 +76,7 @@ class Source(Base):
         """Returns __dict__ with decrypted con_data"""
         def_dict = dict()
         def_dict.update(self.__dict__)
-        def_dict["con_data"] = json.loads(decrypt_data(def_dict["_con_data"]))
+        def_dict["con_data"] = decrypt_json(def_dict["_con_data"])
         del def_dict["_con_data"]
         return def_dict
 
@@ -115,7 +117,7 @@ class Destination(Base):
         """Returns __dict__ with decrypted con_data"""
         def_dict = dict()
         def_dict.update(self.__dict__)
-        def_dict["con_data"] = json.loads(decrypt_data(def_dict["_con_data"]))
+        def_dict["con_data"] = decrypt_json(def_dict["_con_data"])
         del def_dict["_con_data"]
         return def_dict
 
@@ -125,3 +127,38 @@ class Destination(Base):
             raise ValidationError("Unsupported connection type!")
 
         return value
+
+
+class SourceLoadState(Base):
+    """State of the last data load of source into MS DATAVIEW MANAGER"""
+
+    __tablename__ = "source_load_states"
+
+    source_id: int = Column(
+        "source_id",
+        Integer,
+        ForeignKey("sources.id", onupdate="cascade", ondelete="cascade"),
+        primary_key=True,
+    )
+    load_id: str = Column("load_id", String(36), nullable=False)
+    con_data_digest: str = Column("con_data_digest", String(64), nullable=False)
+    acked_offset: int = Column(
+        "acked_offset", BigInteger, nullable=False, default=0
+    )
+    is_finished: bool = Column(
+        "is_finished", Boolean, nullable=False, default=False
+    )
+    # incremental extraction: rows with watermark_column value greater than
+    # watermark were not loaded yet, pending_watermark is the upper bound of
+    # the current load and becomes watermark when the load is finished
+    watermark_column: str | None = Column(
+        "watermark_column", String(128), nullable=True
+    )
+    watermark: str | None = Column("watermark", Text, nullable=True)
+    pending_watermark: str | None = Column(
+        "pending_watermark", Text, nullable=True
+    )
+    # conditional load: validators of source data of the last finished load
+    # (e.g. ETag of response or size and mtime of file), the load is skipped
+    # while the source returns the same validators
+    validators: str | None = Column("validators", Text, nullable=True)
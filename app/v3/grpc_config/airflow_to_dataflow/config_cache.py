@@ -0,0 +1,71 @@
+import threading
+from dataclasses import dataclass
+from typing import Hashable
+
+from cachetools import LRUCache
+
+
+@dataclass
+class ConfigCacheStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+
+class ConfigCache:
+    """Process-wide LRU cache of serialized configurations of sources and
+    destinations. Every value is stored with version of con_data it was
+    built from (see get_data_digest), value of other version is dropped, so
+    configuration changed by another process (REST API) is never returned.
+    Nothing is cached if maxsize is 0"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._values: LRUCache | None = (
+            LRUCache(maxsize=maxsize) if maxsize > 0 else None
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable, version: str) -> str | None:
+        with self._lock:
+            cached = None if self._values is None else self._values.get(key)
+            if cached is not None and cached[0] == version:
+                self._hits += 1
+                return cached[1]
+            self._misses += 1
+            if cached is not None:
+                self._invalidations += 1
+                del self._values[key]
+            return None
+
+    def put(self, key: Hashable, version: str, value: str):
+        if self._values is None:
+            return
+        with self._lock:
+            self._values[key] = (version, value)
+
+    def invalidate(self, key: Hashable | None = None):
+        """Drops value of key (e.g. of deleted source) or all values if key
+        is None"""
+        if self._values is None:
+            return
+        with self._lock:
+            if key is None:
+                self._invalidations += len(self._values)
+                self._values.clear()
+            elif self._values.pop(key, None) is not None:
+                self._invalidations += 1
+
+    @property
+    def stats(self) -> ConfigCacheStats:
+        with self._lock:
+            return ConfigCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                size=0 if self._values is None else len(self._values),
+            )
@@ -13,13 +13,17 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x19\x61irflow_to_dataflow.proto\x12\x13\x61irflow_to_dataflow\"2\n\x1dRequestGetSourceConfiguration\x12\x11\n\tsource_id\x18\x01 \x01(\x05\"5\n\x1eResponseGetSourceConfiguration\x12\x13\n\x0bsource_data\x18\x01 \x01(\t\"3\n\x19RequestGetDestinationData\x12\x16\n\x0e\x64\x65stination_id\x18\x01 \x01(\x05\"6\n\x1aResponseGetDestinationData\x12\x18\n\x10\x64\x65stination_data\x18\x01 \x01(\t2\x92\x02\n\x11\x41irflowToDataflow\x12\x83\x01\n\x16GetSourceConfiguration\x12\x32.airflow_to_dataflow.RequestGetSourceConfiguration\x1a\x33.airflow_to_dataflow.ResponseGetSourceConfiguration\"\x00\x12w\n\x12GetDestinationData\x12..airflow_to_dataflow.RequestGetDestinationData\x1a/.airflow_to_dataflow.ResponseGetDestinationData\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x19\x61irflow_to_dataflow.proto\x12\x13\x61irflow_to_dataflow\"2\n\x1dRequestGetSourceConfiguration\x12\x11\n\tsource_id\x18\x01 \x01(\x05\"5\n\x1eResponseGetSourceConfiguration\x12\x13\n\x0bsource_data\x18\x01 \x01(\t\"3\n\x19RequestGetDestinationData\x12\x16\n\x0e\x64\x65stination_id\x18\x01 \x01(\x05\"6\n\x1aResponseGetDestinationData\x12\x18\n\x10\x64\x65stination_data\x18\x01 \x01(\t\"G\n\x18RequestGetConfigurations\x12\x12\n\nsource_ids\x18\x01 \x03(\x05\x12\x17\n\x0f\x64\x65stination_ids\x18\x02 \x03(\x05\"\xba\x02\n\x19ResponseGetConfigurations\x12S\n\x0bsource_data\x18\x01 \x03(\x0b\x32>.airflow_to_dataflow.ResponseGetConfigurations.SourceDataEntry\x12]\n\x10\x64\x65stination_data\x18\x02 \x03(\x0b\x32\x43.airflow_to_dataflow.ResponseGetConfigurations.DestinationDataEntry\x1a\x31\n\x0fSourceDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x36\n\x14\x44\x65stinationDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"#\n!RequestGetConfigurationCacheStats\"g\n\"ResponseGetConfigurationCacheStats\x12\x0c\n\x04hits\x18\x01 \x01(\x03\x12\x0e\n\x06misses\x18\x02 \x01(\x03\x12\x15\n\rinvalidations\x18\x03 \x01(\x03\x12\x0c\n\x04size\x18\x04 \x01(\x03\x32\x9a\x04\n\x11\x41irflowToDataflow\x12\x83\x01\n\x16GetSourceConfiguration\x12\x32.airflow_to_dataflow.RequestGetSourceConfiguration\x1a\x33.airflow_to_dataflow.ResponseGetSourceConfiguration\"\x00\x12w\n\x12GetDestinationData\x12..airflow_to_dataflow.RequestGetDestinationData\x1a/.airflow_to_dataflow.ResponseGetDestinationData\"\x00\x12t\n\x11GetConfigurations\x12-.airflow_to_dataflow.RequestGetConfigurations\x1a..airflow_to_dataflow.ResponseGetConfigurations\"\x00\x12\x8f\x01\n\x1aGetConfigurationCacheStats\x12\x36.airflow_to_dataflow.RequestGetConfigurationCacheStats\x1a\x37.airflow_to_dataflow.ResponseGetConfigurationCacheStats\"\x00\x62\x06proto3')
 
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'airflow_to_dataflow_pb2', globals())
 if _descriptor._USE_C_DESCRIPTORS == False:
 
   DESCRIPTOR._options = None
+  _RESPONSEGETCONFIGURATIONS_SOURCEDATAENTRY._options = None
+  _RESPONSEGETCONFIGURATIONS_SOURCEDATAENTRY._serialized_options = b'8\001'
+  _RESPONSEGETCONFIGURATIONS_DESTINATIONDATAENTRY._options = None
+  _RESPONSEGETCONFIGURATIONS_DESTINATIONDATAENTRY._serialized_options = b'8\001'
   _REQUESTGETSOURCECONFIGURATION._serialized_start=50
   _REQUESTGETSOURCECONFIGURATION._serialized_end=100
   _RESPONSEGETSOURCECONFIGURATION._serialized_start=102
@@ -28,6 +32,18 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _REQUESTGETDESTINATIONDATA._serialized_end=208
   _RESPONSEGETDESTINATIONDATA._serialized_start=210
   _RESPONSEGETDESTINATIONDATA._serialized_end=264
-  _AIRFLOWTODATAFLOW._serialized_start=267
-  _AIRFLOWTODATAFLOW._serialized_end=541
+  _REQUESTGETCONFIGURATIONS._serialized_start=266
+  _REQUESTGETCONFIGURATIONS._serialized_end=337
+  _RESPONSEGETCONFIGURATIONS._serialized_start=340
+  _RESPONSEGETCONFIGURATIONS._serialized_end=654
+  _RESPONSEGETCONFIGURATIONS_SOURCEDATAENTRY._serialized_start=549
+  _RESPONSEGETCONFIGURATIONS_SOURCEDATAENTRY._serialized_end=598
+  _RESPONSEGETCONFIGURATIONS_DESTINATIONDATAENTRY._serialized_start=600
+  _RESPONSEGETCONFIGURATIONS_DESTINATIONDATAENTRY._serialized_end=654
+  _REQUESTGETCONFIGURATIONCACHESTATS._serialized_start=656
+  _REQUESTGETCONFIGURATIONCACHESTATS._serialized_end=691
+  _RESPONSEGETCONFIGURATIONCACHESTATS._serialized_start=693
+  _RESPONSEGETCONFIGURATIONCACHESTATS._serialized_end=796
+  _AIRFLOWTODATAFLOW._serialized_start=799
+  _AIRFLOWTODATAFLOW._serialized_end=1337
 # @@protoc_insertion_point(module_scope)
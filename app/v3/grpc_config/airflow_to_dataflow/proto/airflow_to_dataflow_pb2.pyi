@@ -1,9 +1,22 @@
+from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from typing import ClassVar as _ClassVar, Optional as _Optional
+from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Mapping, Optional as _Optional
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
+class RequestGetConfigurationCacheStats(_message.Message):
+    __slots__ = []
+    def __init__(self) -> None: ...
+
+class RequestGetConfigurations(_message.Message):
+    __slots__ = ["destination_ids", "source_ids"]
+    DESTINATION_IDS_FIELD_NUMBER: _ClassVar[int]
+    SOURCE_IDS_FIELD_NUMBER: _ClassVar[int]
+    destination_ids: _containers.RepeatedScalarFieldContainer[int]
+    source_ids: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, source_ids: _Optional[_Iterable[int]] = ..., destination_ids: _Optional[_Iterable[int]] = ...) -> None: ...
+
 class RequestGetDestinationData(_message.Message):
     __slots__ = ["destination_id"]
     DESTINATION_ID_FIELD_NUMBER: _ClassVar[int]
@@ -16,6 +29,40 @@ class RequestGetSourceConfiguration(_message.Message):
     source_id: int
     def __init__(self, source_id: _Optional[int] = ...) -> None: ...
 
+class ResponseGetConfigurationCacheStats(_message.Message):
+    __slots__ = ["hits", "invalidations", "misses", "size"]
+    HITS_FIELD_NUMBER: _ClassVar[int]
+    INVALIDATIONS_FIELD_NUMBER: _ClassVar[int]
+    MISSES_FIELD_NUMBER: _ClassVar[int]
+    SIZE_FIELD_NUMBER: _ClassVar[int]
+    hits: int
+    invalidations: int
+    misses: int
+    size: int
+    def __init__(self, hits: _Optional[int] = ..., misses: _Optional[int] = ..., invalidations: _Optional[int] = ..., size: _Optional[int] = ...) -> None: ...
+
+class ResponseGetConfigurations(_message.Message):
+    __slots__ = ["destination_data", "source_data"]
+    class DestinationDataEntry(_message.Message):
+        __slots__ = ["key", "value"]
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: int
+        value: str
+        def __init__(self, key: _Optional[int] = ..., value: _Optional[str] = ...) -> None: ...
+    class SourceDataEntry(_message.Message):
+        __slots__ = ["key", "value"]
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: int
+        value: str
+        def __init__(self, key: _Optional[int] = ..., value: _Optional[str] = ...) -> None: ...
+    DESTINATION_DATA_FIELD_NUMBER: _ClassVar[int]
+    SOURCE_DATA_FIELD_NUMBER: _ClassVar[int]
+    destination_data: _containers.ScalarMap[int, str]
+    source_data: _containers.ScalarMap[int, str]
+    def __init__(self, source_data: _Optional[_Mapping[int, str]] = ..., destination_data: _Optional[_Mapping[int, str]] = ...) -> None: ...
+
 class ResponseGetDestinationData(_message.Message):
     __slots__ = ["destination_data"]
     DESTINATION_DATA_FIELD_NUMBER: _ClassVar[int]
@@ -24,6 +24,16 @@ class AirflowToDataflowStub(object):
                 request_serializer=airflow__to__dataflow__pb2.RequestGetDestinationData.SerializeToString,
                 response_deserializer=airflow__to__dataflow__pb2.ResponseGetDestinationData.FromString,
                 )
+        self.GetConfigurations = channel.unary_unary(
+                '/airflow_to_dataflow.AirflowToDataflow/GetConfigurations',
+                request_serializer=airflow__to__dataflow__pb2.RequestGetConfigurations.SerializeToString,
+                response_deserializer=airflow__to__dataflow__pb2.ResponseGetConfigurations.FromString,
+                )
+        self.GetConfigurationCacheStats = channel.unary_unary(
+                '/airflow_to_dataflow.AirflowToDataflow/GetConfigurationCacheStats',
+                request_serializer=airflow__to__dataflow__pb2.RequestGetConfigurationCacheStats.SerializeToString,
+                response_deserializer=airflow__to__dataflow__pb2.ResponseGetConfigurationCacheStats.FromString,
+                )
 
 
 class AirflowToDataflowServicer(object):
@@ -41,6 +51,18 @@ class AirflowToDataflowServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetConfigurations(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetConfigurationCacheStats(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_AirflowToDataflowServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -54,6 +76,16 @@ def add_AirflowToDataflowServicer_to_server(servicer, server):
                     request_deserializer=airflow__to__dataflow__pb2.RequestGetDestinationData.FromString,
                     response_serializer=airflow__to__dataflow__pb2.ResponseGetDestinationData.SerializeToString,
             ),
+            'GetConfigurations': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetConfigurations,
+                    request_deserializer=airflow__to__dataflow__pb2.RequestGetConfigurations.FromString,
+                    response_serializer=airflow__to__dataflow__pb2.ResponseGetConfigurations.SerializeToString,
+            ),
+            'GetConfigurationCacheStats': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetConfigurationCacheStats,
+                    request_deserializer=airflow__to__dataflow__pb2.RequestGetConfigurationCacheStats.FromString,
+                    response_serializer=airflow__to__dataflow__pb2.ResponseGetConfigurationCacheStats.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'airflow_to_dataflow.AirflowToDataflow', rpc_method_handlers)
@@ -97,3 +129,37 @@ class AirflowToDataflow(object):
             airflow__to__dataflow__pb2.ResponseGetDestinationData.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetConfigurations(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/airflow_to_dataflow.AirflowToDataflow/GetConfigurations',
+            airflow__to__dataflow__pb2.RequestGetConfigurations.SerializeToString,
+            airflow__to__dataflow__pb2.ResponseGetConfigurations.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetConfigurationCacheStats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/airflow_to_dataflow.AirflowToDataflow/GetConfigurationCacheStats',
+            airflow__to__dataflow__pb2.RequestGetConfigurationCacheStats.SerializeToString,
+            airflow__to__dataflow__pb2.ResponseGetConfigurationCacheStats.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
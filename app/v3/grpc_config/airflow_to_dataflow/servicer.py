@@ -1,4 +1,5 @@
 import json
+from typing import Callable
 
 import grpc.aio
 from sqlalchemy import select
@@ -6,15 +7,71 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from v3.database.database import engine
 from v3.database.schemas import Source, Destination
+from v3.grpc_config.airflow_to_dataflow.config_cache import ConfigCache
 from v3.grpc_config.airflow_to_dataflow.proto.airflow_to_dataflow_pb2 import (
     RequestGetSourceConfiguration,
     ResponseGetSourceConfiguration,
     RequestGetDestinationData,
     ResponseGetDestinationData,
+    RequestGetConfigurations,
+    ResponseGetConfigurations,
+    RequestGetConfigurationCacheStats,
+    ResponseGetConfigurationCacheStats,
 )
 from v3.grpc_config.airflow_to_dataflow.proto.airflow_to_dataflow_pb2_grpc import (
     AirflowToDataflowServicer,
 )
+from v3.grpc_config.config import AIRFLOW_CONFIG_CACHE_SIZE
+from v3.utils.encryption_utils import decrypt_json, get_data_digest
+
+CONFIG_CACHE = ConfigCache(maxsize=AIRFLOW_CONFIG_CACHE_SIZE)
+
+
+def serialize_source_data(source_id: int, source_data: dict) -> str:
+    if source_data.get("import_type", None) == "Manual":
+        if source_data.get("file_name"):
+            key_for_file_name = "file_name"
+        else:
+            key_for_file_name = "filename"
+        source_data[key_for_file_name] = (
+            f"{source_id}/{source_data[key_for_file_name]}"
+        )
+    return json.dumps(source_data)
+
+
+def serialize_destination_data(
+    destination_id: int, destination_data: dict
+) -> str:
+    return json.dumps(destination_data)
+
+
+async def get_configurations(
+    session: AsyncSession,
+    model: type[Source] | type[Destination],
+    ids: set[int],
+    serialize: Callable[[int, dict], str],
+) -> dict[int, str]:
+    """Returns serialized con_data of found rows of model by id. Only id
+    and encrypted con_data are selected, con_data is decrypted and
+    serialized again only if it was changed since it was cached"""
+    if not ids:
+        return {}
+    query = select(model.id, model.con_data).where(model.id.in_(ids))
+    rows = (await session.execute(query)).all()
+
+    result = {}
+    for row_id, con_data in rows:
+        key = (model.__tablename__, row_id)
+        version = get_data_digest(con_data)
+        data = CONFIG_CACHE.get(key, version)
+        if data is None:
+            data = serialize(row_id, decrypt_json(con_data))
+            CONFIG_CACHE.put(key, version, data)
+        result[row_id] = data
+
+    for deleted_id in ids.difference(result):
+        CONFIG_CACHE.invalidate((model.__tablename__, deleted_id))
+    return result
 
 
 class AirflowToDataflowManager(AirflowToDataflowServicer):
@@ -24,46 +81,83 @@ class AirflowToDataflowManager(AirflowToDataflowServicer):
         context: grpc.aio.ServicerContext,
     ) -> ResponseGetSourceConfiguration:
         async with AsyncSession(engine) as session:
-            query = select(Source).where(Source.id == request.source_id)
-            source = await session.execute(query)
-            source = source.scalar()
-
-            if not source:
-                context.set_code(grpc.StatusCode.NOT_FOUND)
-                context.set_details("Source with given id not found!")
-                return context
-
-            source_data = source.decoded_data()["con_data"]
-            if source_data.get("import_type", None) == "Manual":
-                if source_data.get("file_name"):
-                    key_for_file_name = "file_name"
-                else:
-                    key_for_file_name = "filename"
-                source_data[key_for_file_name] = (
-                    f"{request.source_id}/{source_data[key_for_file_name]}"
-                )
-            return ResponseGetSourceConfiguration(
-                source_data=json.dumps(source_data)
+            configurations = await get_configurations(
+                session, Source, {request.source_id}, serialize_source_data
             )
 
+        if request.source_id not in configurations:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details("Source with given id not found!")
+            return context
+
+        return ResponseGetSourceConfiguration(
+            source_data=configurations[request.source_id]
+        )
+
     async def GetDestinationData(
         self,
         request: RequestGetDestinationData,
         context: grpc.aio.ServicerContext,
     ) -> ResponseGetDestinationData:
         async with AsyncSession(engine) as session:
-            query = select(Destination).where(
-                Destination.id == request.destination_id
+            configurations = await get_configurations(
+                session,
+                Destination,
+                {request.destination_id},
+                serialize_destination_data,
             )
-            destination = await session.execute(query)
-            destination = destination.scalar()
 
-            if not destination:
-                context.set_code(grpc.StatusCode.NOT_FOUND)
-                context.set_details("Source with given id not found!")
-                return context
+        if request.destination_id not in configurations:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details("Source with given id not found!")
+            return context
 
-            destination_data = destination.decoded_data()["con_data"]
-            return ResponseGetDestinationData(
-                destination_data=json.dumps(destination_data)
+        return ResponseGetDestinationData(
+            destination_data=configurations[request.destination_id]
+        )
+
+    async def GetConfigurations(
+        self,
+        request: RequestGetConfigurations,
+        context: grpc.aio.ServicerContext,
+    ) -> ResponseGetConfigurations:
+        """Returns configurations of many sources and destinations in one
+        call, by one query per table"""
+        source_ids = set(request.source_ids)
+        destination_ids = set(request.destination_ids)
+        async with AsyncSession(engine) as session:
+            source_data = await get_configurations(
+                session, Source, source_ids, serialize_source_data
+            )
+            destination_data = await get_configurations(
+                session,
+                Destination,
+                destination_ids,
+                serialize_destination_data,
             )
+
+        missing_sources = source_ids.difference(source_data)
+        missing_destinations = destination_ids.difference(destination_data)
+        if missing_sources or missing_destinations:
+            await context.abort(
+                grpc.StatusCode.NOT_FOUND,
+                f"Sources not found: {sorted(missing_sources)}, "
+                f"destinations not found: {sorted(missing_destinations)}",
+            )
+
+        return ResponseGetConfigurations(
+            source_data=source_data, destination_data=destination_data
+        )
+
+    async def GetConfigurationCacheStats(
+        self,
+        request: RequestGetConfigurationCacheStats,
+        context: grpc.aio.ServicerContext,
+    ) -> ResponseGetConfigurationCacheStats:
+        stats = CONFIG_CACHE.stats
+        return ResponseGetConfigurationCacheStats(
+            hits=stats.hits,
+            misses=stats.misses,
+            invalidations=stats.invalidations,
+            size=stats.size,
+        )
@@ -3,3 +3,26 @@ import os
 INVENTORY_HOST = os.environ.get("INVENTORY_HOST", "inventory")
 INVENTORY_GRPC_PORT = os.environ.get("INVENTORY_GRPC_PORT", "50051")
 INVENTORY_GRPC_URL = f"{INVENTORY_HOST}:{INVENTORY_GRPC_PORT}"
+
+# number of objects requested from inventory by one GetObjWithParamsLimited call
+INVENTORY_PAGE_SIZE = int(os.environ.get("INVENTORY_PAGE_SIZE", 5000))
+# request next page while the current one is being processed
+INVENTORY_PAGE_PREFETCH = os.environ.get(
+    "INVENTORY_PAGE_PREFETCH", "True"
+).upper() in (
+    "TRUE",
+    "Y",
+    "YES",
+    "1",
+)
+
+# seconds TMO columns and type mappers are cached for, the cache is kept
+# per process (uvicorn worker), so it also bounds how long other workers
+# return metadata changed in inventory
+TMO_METADATA_CACHE_TTL = int(os.environ.get("TMO_METADATA_CACHE_TTL", 300))
+
+# serialized source and destination configurations kept in memory by
+# AirflowToDataflow servicer, 0 disables the cache
+AIRFLOW_CONFIG_CACHE_SIZE = int(
+    os.environ.get("AIRFLOW_CONFIG_CACHE_SIZE", 4096)
+)
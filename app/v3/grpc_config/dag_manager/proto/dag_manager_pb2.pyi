@@ -14,10 +14,18 @@ class RequestCheckDestination(_message.Message):
     def __init__(self, destination_id: _Optional[int] = ..., con_type: _Optional[str] = ...) -> None: ...
 
 class RequestSourceConData(_message.Message):
-    __slots__ = ["sources"]
+    __slots__ = ["sources", "without_content"]
     SOURCES_FIELD_NUMBER: _ClassVar[int]
+    WITHOUT_CONTENT_FIELD_NUMBER: _ClassVar[int]
     sources: _containers.RepeatedScalarFieldContainer[int]
-    def __init__(self, sources: _Optional[_Iterable[int]] = ...) -> None: ...
+    without_content: bool
+    def __init__(self, sources: _Optional[_Iterable[int]] = ..., without_content: bool = ...) -> None: ...
+
+class RequestSourceFileContent(_message.Message):
+    __slots__ = ["source_id"]
+    SOURCE_ID_FIELD_NUMBER: _ClassVar[int]
+    source_id: int
+    def __init__(self, source_id: _Optional[int] = ...) -> None: ...
 
 class ResponseCheckDestination(_message.Message):
     __slots__ = []
@@ -35,3 +43,9 @@ class ResponseSourceConData(_message.Message):
     CON_DATA_FIELD_NUMBER: _ClassVar[int]
     con_data: _containers.ScalarMap[int, str]
     def __init__(self, con_data: _Optional[_Mapping[int, str]] = ...) -> None: ...
+
+class ResponseSourceFileContent(_message.Message):
+    __slots__ = ["content"]
+    CONTENT_FIELD_NUMBER: _ClassVar[int]
+    content: bytes
+    def __init__(self, content: _Optional[bytes] = ...) -> None: ...
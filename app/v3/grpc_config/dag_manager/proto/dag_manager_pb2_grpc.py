@@ -19,6 +19,11 @@ class DagManagerStub(object):
                 request_serializer=dag__manager__pb2.RequestSourceConData.SerializeToString,
                 response_deserializer=dag__manager__pb2.ResponseSourceConData.FromString,
                 )
+        self.GetSourceFileContent = channel.unary_stream(
+                '/dag_manager.DagManager/GetSourceFileContent',
+                request_serializer=dag__manager__pb2.RequestSourceFileContent.SerializeToString,
+                response_deserializer=dag__manager__pb2.ResponseSourceFileContent.FromString,
+                )
         self.CheckDestination = channel.unary_unary(
                 '/dag_manager.DagManager/CheckDestination',
                 request_serializer=dag__manager__pb2.RequestCheckDestination.SerializeToString,
@@ -35,6 +40,12 @@ class DagManagerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetSourceFileContent(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def CheckDestination(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -49,6 +60,11 @@ def add_DagManagerServicer_to_server(servicer, server):
                     request_deserializer=dag__manager__pb2.RequestSourceConData.FromString,
                     response_serializer=dag__manager__pb2.ResponseSourceConData.SerializeToString,
             ),
+            'GetSourceFileContent': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetSourceFileContent,
+                    request_deserializer=dag__manager__pb2.RequestSourceFileContent.FromString,
+                    response_serializer=dag__manager__pb2.ResponseSourceFileContent.SerializeToString,
+            ),
             'CheckDestination': grpc.unary_unary_rpc_method_handler(
                     servicer.CheckDestination,
                     request_deserializer=dag__manager__pb2.RequestCheckDestination.FromString,
@@ -81,6 +97,23 @@ class DagManager(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def GetSourceFileContent(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/dag_manager.DagManager/GetSourceFileContent',
+            dag__manager__pb2.RequestSourceFileContent.SerializeToString,
+            dag__manager__pb2.ResponseSourceFileContent.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def CheckDestination(request,
             target,
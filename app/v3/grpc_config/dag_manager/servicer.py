@@ -1,6 +1,6 @@
+import asyncio
 import base64
 import pickle
-from io import BytesIO
 
 import grpc
 from sqlalchemy import select
@@ -13,46 +13,115 @@ from v3.file_server.minio_client_manager import minio_client
 from v3.grpc_config.dag_manager.proto.dag_manager_pb2 import (
     ResponseSourceConData,
     RequestSourceConData,
+    RequestSourceFileContent,
+    ResponseSourceFileContent,
     RequestCheckDestination,
     ResponseCheckDestination,
 )
 from v3.grpc_config.dag_manager.proto.dag_manager_pb2_grpc import (
     DagManagerServicer,
 )
+from v3.grpc_config.utils import iterate_in_thread
+from v3.routers.sources.models.file_model import FileImportType
+from v3.routers.sources.models.general_model import SourceType
 from v3.routers.sources.sources_managers.file_manager import (
     ManualFileSourceManager,
 )
+from v3.routers.sources.utils.exceptions import (
+    CustomException,
+    ResourceNotFoundError,
+)
+
+# max bytes of file content sent in one message, less than default gRPC
+# message size limit
+FILE_CONTENT_MESSAGE_SIZE = 1024 * 1024
+
+
+def is_manual_file_source(source: Source, con_data: dict) -> bool:
+    return (
+        source.con_type == SourceType.FILE.value
+        and con_data.get("import_type") == FileImportType.MANUAL.value
+    )
+
+
+def get_manual_file_content(source_id: int, con_data: dict) -> str:
+    """Returns data of Manual file source as base64 of CSV"""
+    manager = ManualFileSourceManager(source_id, con_data, minio_client())
+    content = b"".join(manager.iter_csv_content())
+    return base64.b64encode(content).decode("utf-8")
 
 
 class DagManager(DagManagerServicer):
     async def GetSourceConData(
         self, request: RequestSourceConData, context: grpc.aio.ServicerContext
     ) -> ResponseSourceConData:
-        result = {}
+        """Returns con_data of sources by one query. Data of Manual file
+        sources is added as base64 of CSV, unless without_content is set
+        (the data is streamed by GetSourceFileContent then)"""
+        source_ids = set(request.sources)
         async with AsyncSession(engine) as session:
-            for source_id in request.sources:
-                query = select(Source).where(Source.id == source_id)
-                response: Result = await session.execute(query)
-                response: Source = response.scalars().one()
-                decoded_data = response.decoded_data()
-                con_data = decoded_data.get("con_data")
-                con_data["con_type"] = decoded_data.get("con_type")
-                if con_data["con_type"] == "File":
-                    if con_data["import_type"] == "Manual":
-                        manager = ManualFileSourceManager(
-                            source_id, con_data, minio_client()
-                        )
-                        buf = BytesIO()
-                        manager.get_source_all_data().to_csv(
-                            path_or_buf=buf, index=False
-                        )
-                        buf.seek(0)
-                        content = base64.b64encode(buf.read()).decode("utf-8")
-                        con_data["content"] = content
-                result[source_id] = pickle.dumps(con_data).hex()
+            query = select(Source).where(Source.id.in_(source_ids))
+            response: Result = await session.execute(query)
+            sources = response.scalars().all()
+
+        missing = source_ids.difference(source.id for source in sources)
+        if missing:
+            await context.abort(
+                grpc.StatusCode.NOT_FOUND,
+                f"Sources not found: {sorted(missing)}",
+            )
+
+        result = {}
+        for source in sources:
+            decoded_data = source.decoded_data()
+            con_data = decoded_data.get("con_data")
+            con_data["con_type"] = decoded_data.get("con_type")
+            if not request.without_content and is_manual_file_source(
+                source, con_data
+            ):
+                con_data["content"] = await asyncio.to_thread(
+                    get_manual_file_content, source.id, con_data
+                )
+            result[source.id] = pickle.dumps(con_data).hex()
 
         return ResponseSourceConData(con_data=result)
 
+    async def GetSourceFileContent(
+        self,
+        request: RequestSourceFileContent,
+        context: grpc.aio.ServicerContext,
+    ):
+        """Streams data of Manual file source as CSV in parts of at most
+        FILE_CONTENT_MESSAGE_SIZE bytes, the file is read by chunks, so it
+        is never kept in memory as a whole"""
+        async with AsyncSession(engine) as session:
+            source = await session.get(Source, request.source_id)
+        if source is None:
+            await context.abort(grpc.StatusCode.NOT_FOUND, "Source not found!")
+
+        con_data = source.decoded_data()["con_data"]
+        if not is_manual_file_source(source, con_data):
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "File content is available only for Manual file sources!",
+            )
+
+        manager = ManualFileSourceManager(source.id, con_data, minio_client())
+        try:
+            async for content in iterate_in_thread(
+                manager.iter_csv_content(), chunk_size=1
+            ):
+                for start in range(0, len(content), FILE_CONTENT_MESSAGE_SIZE):
+                    yield ResponseSourceFileContent(
+                        content=content[
+                            start : start + FILE_CONTENT_MESSAGE_SIZE
+                        ]
+                    )
+        except ResourceNotFoundError as exc:
+            await context.abort(grpc.StatusCode.NOT_FOUND, str(exc))
+        except CustomException as exc:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+
     async def CheckDestination(
         self,
         request: RequestCheckDestination,
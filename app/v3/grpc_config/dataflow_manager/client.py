@@ -7,6 +7,7 @@ from v3.grpc_config.dataflow_manager.proto import dataflow_manager_pb2
 from v3.grpc_config.dataflow_manager.proto.dataflow_manager_pb2_grpc import (
     DataflowManagerStub,
 )
+from v3.grpc_config.object_batch import ACCEPT_ENCODINGS, decode_objects
 
 
 class DataflowManagerClient:
@@ -47,11 +48,11 @@ class DataflowManagerClient:
         ) as channel:
             stub = DataflowManagerStub(channel)
             msg = dataflow_manager_pb2.RequestGetObjectsWithParams(
-                tmo_id=tmo_id, tprm_names=columns, limit=limit, offset=offset
+                tmo_id=tmo_id,
+                tprm_names=columns,
+                limit=limit,
+                offset=offset,
+                accept_encodings=ACCEPT_ENCODINGS,
             )
             response = stub.GetObjectsWithParams(msg)
-            result = []
-            for res in response:
-                result.append(json.loads(res.data))
-
-        return result
+            return decode_objects(response, json.loads)
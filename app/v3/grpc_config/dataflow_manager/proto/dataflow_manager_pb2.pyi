@@ -6,16 +6,18 @@ from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Map
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class RequestGetObjectsWithParams(_message.Message):
-    __slots__ = ["limit", "offset", "tmo_id", "tprm_names"]
+    __slots__ = ["accept_encodings", "limit", "offset", "tmo_id", "tprm_names"]
+    ACCEPT_ENCODINGS_FIELD_NUMBER: _ClassVar[int]
     LIMIT_FIELD_NUMBER: _ClassVar[int]
     OFFSET_FIELD_NUMBER: _ClassVar[int]
     TMO_ID_FIELD_NUMBER: _ClassVar[int]
     TPRM_NAMES_FIELD_NUMBER: _ClassVar[int]
+    accept_encodings: _containers.RepeatedScalarFieldContainer[str]
     limit: int
     offset: int
     tmo_id: int
     tprm_names: _containers.RepeatedScalarFieldContainer[str]
-    def __init__(self, tmo_id: _Optional[int] = ..., tprm_names: _Optional[_Iterable[str]] = ..., limit: _Optional[int] = ..., offset: _Optional[int] = ...) -> None: ...
+    def __init__(self, tmo_id: _Optional[int] = ..., tprm_names: _Optional[_Iterable[str]] = ..., limit: _Optional[int] = ..., offset: _Optional[int] = ..., accept_encodings: _Optional[_Iterable[str]] = ...) -> None: ...
 
 class RequestGetTPRMNameToTypeMapper(_message.Message):
     __slots__ = ["columns", "tmo_id"]
@@ -32,10 +34,14 @@ class RequestGetTPRMNamesOfTMO(_message.Message):
     def __init__(self, tmo_id: _Optional[int] = ...) -> None: ...
 
 class ResponseGetObjectsWithParams(_message.Message):
-    __slots__ = ["data"]
+    __slots__ = ["data", "data_batch", "encoding"]
+    DATA_BATCH_FIELD_NUMBER: _ClassVar[int]
     DATA_FIELD_NUMBER: _ClassVar[int]
+    ENCODING_FIELD_NUMBER: _ClassVar[int]
     data: str
-    def __init__(self, data: _Optional[str] = ...) -> None: ...
+    data_batch: bytes
+    encoding: str
+    def __init__(self, data: _Optional[str] = ..., encoding: _Optional[str] = ..., data_batch: _Optional[bytes] = ...) -> None: ...
 
 class ResponseGetTPRMNameToTypeMapper(_message.Message):
     __slots__ = ["mapper"]
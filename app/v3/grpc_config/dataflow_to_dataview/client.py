@@ -1,9 +1,20 @@
+import asyncio
+from typing import AsyncIterable
+
 import grpc
 
 from v3.config import DATAVIEW_GRPC_URL
 from v3.grpc_config.dataflow_to_dataview.proto.data_carrier_pb2 import (
+    ConfigRequest,
+    ConfigWithTypesRequest,
+    DataRequest,
+    GroupDeleteRequest,
+    GroupRequest,
     RequestIsDestinationUsed,
+    Response,
     ResponseIsDestinationUsed,
+    SourceDeleteRequest,
+    SourceRequest,
 )
 from v3.grpc_config.dataflow_to_dataview.proto.data_carrier_pb2_grpc import (
     DataCarrierStub,
@@ -11,11 +22,76 @@ from v3.grpc_config.dataflow_to_dataview.proto.data_carrier_pb2_grpc import (
 
 
 class DataviewClient:
-    @staticmethod
-    def is_destination_used(destination_id: int):
-        with grpc.insecure_channel(DATAVIEW_GRPC_URL) as channel:
-            stub = DataCarrierStub(channel)
-            msg = RequestIsDestinationUsed(destination_id=destination_id)
-
-            response: ResponseIsDestinationUsed = stub.IsDestinationUsed(msg)
-            return response.is_used
+    """Async client for MS DATAVIEW MANAGER.
+
+    All calls made from one worker share a single grpc.aio channel, which is
+    created lazily on first use and bound to the running event loop.
+    """
+
+    _channel: grpc.aio.Channel | None = None
+    _loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def _get_stub(cls) -> DataCarrierStub:
+        loop = asyncio.get_running_loop()
+        if cls._channel is None or cls._loop is not loop:
+            cls._channel = grpc.aio.insecure_channel(DATAVIEW_GRPC_URL)
+            cls._loop = loop
+        return DataCarrierStub(cls._channel)
+
+    @classmethod
+    async def close(cls):
+        """Closes shared channel if it was opened by the current event loop"""
+        channel, loop = cls._channel, cls._loop
+        cls._channel = None
+        cls._loop = None
+        if channel is not None and loop is asyncio.get_running_loop():
+            await channel.close()
+
+    @classmethod
+    async def is_destination_used(cls, destination_id: int) -> bool:
+        msg = RequestIsDestinationUsed(destination_id=destination_id)
+        response: ResponseIsDestinationUsed = await (
+            cls._get_stub().IsDestinationUsed(msg)
+        )
+        return response.is_used
+
+    @classmethod
+    async def create_source_group(cls, group_id: int, name: str) -> Response:
+        msg = GroupRequest(group_id=group_id, name=name)
+        return await cls._get_stub().CreateSourceGroup(msg)
+
+    @classmethod
+    async def create_source(
+        cls, group_id: int, source_id: int, name: str
+    ) -> Response:
+        msg = SourceRequest(source_id=source_id, group_id=group_id, name=name)
+        return await cls._get_stub().CreateSource(msg)
+
+    @classmethod
+    async def config_source(cls, source_id: int, columns: list) -> Response:
+        msg = ConfigRequest(source_id=source_id, columns=columns)
+        return await cls._get_stub().ConfigSource(msg)
+
+    @classmethod
+    async def config_source_with_types(
+        cls, source_id: int, columns: dict[str, str]
+    ) -> Response:
+        msg = ConfigWithTypesRequest(source_id=source_id, columns=columns)
+        return await cls._get_stub().ConfigSourceWithTypes(msg)
+
+    @classmethod
+    async def insert_data(
+        cls, request_iterator: AsyncIterable[DataRequest]
+    ) -> Response:
+        return await cls._get_stub().InsertData(request_iterator)
+
+    @classmethod
+    async def delete_group(cls, group_id: int) -> Response:
+        msg = GroupDeleteRequest(group_id=group_id)
+        return await cls._get_stub().DeleteGroup(msg)
+
+    @classmethod
+    async def delete_source(cls, source_id: int) -> Response:
+        msg = SourceDeleteRequest(source_id=source_id)
+        return await cls._get_stub().DeleteSource(msg)
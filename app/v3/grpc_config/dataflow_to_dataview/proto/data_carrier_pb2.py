@@ -13,7 +13,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x12\x64\x61ta_carrier.proto\x12\x0bsource_data\".\n\x0cGroupRequest\x12\x10\n\x08group_id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\"&\n\x12GroupDeleteRequest\x12\x10\n\x08group_id\x18\x01 \x01(\x05\"<\n\x08Response\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x14\n\x07message\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\n\n\x08_message\"B\n\rSourceRequest\x12\x11\n\tsource_id\x18\x01 \x01(\x05\x12\x10\n\x08group_id\x18\x02 \x01(\x05\x12\x0c\n\x04name\x18\x03 \x01(\t\"(\n\x13SourceDeleteRequest\x12\x11\n\tsource_id\x18\x01 \x01(\x05\"3\n\rConfigRequest\x12\x11\n\tsource_id\x18\x01 \x01(\x05\x12\x0f\n\x07\x63olumns\x18\x02 \x03(\t\"\x9e\x01\n\x16\x43onfigWithTypesRequest\x12\x11\n\tsource_id\x18\x01 \x01(\x05\x12\x41\n\x07\x63olumns\x18\x02 \x03(\x0b\x32\x30.source_data.ConfigWithTypesRequest.ColumnsEntry\x1a.\n\x0c\x43olumnsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x98\x01\n\x0b\x44\x61taRequest\x12\x11\n\tsource_id\x18\x01 \x01(\x05\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\x12\x37\n\x08\x64\x61ta_row\x18\x03 \x03(\x0b\x32%.source_data.DataRequest.DataRowEntry\x1a.\n\x0c\x44\x61taRowEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"2\n\x18RequestIsDestinationUsed\x12\x16\n\x0e\x64\x65stination_id\x18\x01 \x01(\x05\",\n\x19ResponseIsDestinationUsed\x12\x0f\n\x07is_used\x18\x01 \x01(\x08\x32\xf4\x04\n\x0b\x44\x61taCarrier\x12G\n\x11\x43reateSourceGroup\x12\x19.source_data.GroupRequest\x1a\x15.source_data.Response\"\x00\x12\x43\n\x0c\x43reateSource\x12\x1a.source_data.SourceRequest\x1a\x15.source_data.Response\"\x00\x12\x43\n\x0c\x43onfigSource\x12\x1a.source_data.ConfigRequest\x1a\x15.source_data.Response\"\x00\x12U\n\x15\x43onfigSourceWithTypes\x12#.source_data.ConfigWithTypesRequest\x1a\x15.source_data.Response\"\x00\x12\x41\n\nInsertData\x12\x18.source_data.DataRequest\x1a\x15.source_data.Response\"\x00(\x01\x12G\n\x0b\x44\x65leteGroup\x12\x1f.source_data.GroupDeleteRequest\x1a\x15.source_data.Response\"\x00\x12I\n\x0c\x44\x65leteSource\x12 .source_data.SourceDeleteRequest\x1a\x15.source_data.Response\"\x00\x12\x64\n\x11IsDestinationUsed\x12%.source_data.RequestIsDestinationUsed\x1a&.source_data.ResponseIsDestinationUsed\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x12\x64\x61ta_carrier.proto\x12\x0bsource_data\".\n\x0cGroupRequest\x12\x10\n\x08group_id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\"&\n\x12GroupDeleteRequest\x12\x10\n\x08group_id\x18\x01 \x01(\x05\"<\n\x08Response\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x14\n\x07message\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\n\n\x08_message\"B\n\rSourceRequest\x12\x11\n\tsource_id\x18\x01 \x01(\x05\x12\x10\n\x08group_id\x18\x02 \x01(\x05\x12\x0c\n\x04name\x18\x03 \x01(\t\"(\n\x13SourceDeleteRequest\x12\x11\n\tsource_id\x18\x01 \x01(\x05\"3\n\rConfigRequest\x12\x11\n\tsource_id\x18\x01 \x01(\x05\x12\x0f\n\x07\x63olumns\x18\x02 \x03(\t\"\x9e\x01\n\x16\x43onfigWithTypesRequest\x12\x11\n\tsource_id\x18\x01 \x01(\x05\x12\x41\n\x07\x63olumns\x18\x02 \x03(\x0b\x32\x30.source_data.ConfigWithTypesRequest.ColumnsEntry\x1a.\n\x0c\x43olumnsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x84\x02\n\x0b\x44\x61taRequest\x12\x11\n\tsource_id\x18\x01 \x01(\x05\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\x12\x37\n\x08\x64\x61ta_row\x18\x03 \x03(\x0b\x32%.source_data.DataRequest.DataRowEntry\x12\x15\n\x08sequence\x18\x04 \x01(\x03H\x00\x88\x01\x01\x12\x14\n\x07load_id\x18\x05 \x01(\tH\x01\x88\x01\x01\x12\x16\n\toperation\x18\x06 \x01(\tH\x02\x88\x01\x01\x1a.\n\x0c\x44\x61taRowEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x42\x0b\n\t_sequenceB\n\n\x08_load_idB\x0c\n\n_operation\"2\n\x18RequestIsDestinationUsed\x12\x16\n\x0e\x64\x65stination_id\x18\x01 \x01(\x05\",\n\x19ResponseIsDestinationUsed\x12\x0f\n\x07is_used\x18\x01 \x01(\x08\x32\xf4\x04\n\x0b\x44\x61taCarrier\x12G\n\x11\x43reateSourceGroup\x12\x19.source_data.GroupRequest\x1a\x15.source_data.Response\"\x00\x12\x43\n\x0c\x43reateSource\x12\x1a.source_data.SourceRequest\x1a\x15.source_data.Response\"\x00\x12\x43\n\x0c\x43onfigSource\x12\x1a.source_data.ConfigRequest\x1a\x15.source_data.Response\"\x00\x12U\n\x15\x43onfigSourceWithTypes\x12#.source_data.ConfigWithTypesRequest\x1a\x15.source_data.Response\"\x00\x12\x41\n\nInsertData\x12\x18.source_data.DataRequest\x1a\x15.source_data.Response\"\x00(\x01\x12G\n\x0b\x44\x65leteGroup\x12\x1f.source_data.GroupDeleteRequest\x1a\x15.source_data.Response\"\x00\x12I\n\x0c\x44\x65leteSource\x12 .source_data.SourceDeleteRequest\x1a\x15.source_data.Response\"\x00\x12\x64\n\x11IsDestinationUsed\x12%.source_data.RequestIsDestinationUsed\x1a&.source_data.ResponseIsDestinationUsed\"\x00\x62\x06proto3')
 
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'data_carrier_pb2', globals())
@@ -41,13 +41,13 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _CONFIGWITHTYPESREQUEST_COLUMNSENTRY._serialized_start=461
   _CONFIGWITHTYPESREQUEST_COLUMNSENTRY._serialized_end=507
   _DATAREQUEST._serialized_start=510
-  _DATAREQUEST._serialized_end=662
-  _DATAREQUEST_DATAROWENTRY._serialized_start=616
-  _DATAREQUEST_DATAROWENTRY._serialized_end=662
-  _REQUESTISDESTINATIONUSED._serialized_start=664
-  _REQUESTISDESTINATIONUSED._serialized_end=714
-  _RESPONSEISDESTINATIONUSED._serialized_start=716
-  _RESPONSEISDESTINATIONUSED._serialized_end=760
-  _DATACARRIER._serialized_start=763
-  _DATACARRIER._serialized_end=1391
+  _DATAREQUEST._serialized_end=770
+  _DATAREQUEST_DATAROWENTRY._serialized_start=685
+  _DATAREQUEST_DATAROWENTRY._serialized_end=731
+  _REQUESTISDESTINATIONUSED._serialized_start=772
+  _REQUESTISDESTINATIONUSED._serialized_end=822
+  _RESPONSEISDESTINATIONUSED._serialized_start=824
+  _RESPONSEISDESTINATIONUSED._serialized_end=868
+  _DATACARRIER._serialized_start=871
+  _DATACARRIER._serialized_end=1499
 # @@protoc_insertion_point(module_scope)
@@ -29,7 +29,7 @@ class ConfigWithTypesRequest(_message.Message):
     def __init__(self, source_id: _Optional[int] = ..., columns: _Optional[_Mapping[str, str]] = ...) -> None: ...
 
 class DataRequest(_message.Message):
-    __slots__ = ["count", "data_row", "source_id"]
+    __slots__ = ["count", "data_row", "load_id", "operation", "sequence", "source_id"]
     class DataRowEntry(_message.Message):
         __slots__ = ["key", "value"]
         KEY_FIELD_NUMBER: _ClassVar[int]
@@ -39,11 +39,17 @@ class DataRequest(_message.Message):
         def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
     COUNT_FIELD_NUMBER: _ClassVar[int]
     DATA_ROW_FIELD_NUMBER: _ClassVar[int]
+    LOAD_ID_FIELD_NUMBER: _ClassVar[int]
+    OPERATION_FIELD_NUMBER: _ClassVar[int]
+    SEQUENCE_FIELD_NUMBER: _ClassVar[int]
     SOURCE_ID_FIELD_NUMBER: _ClassVar[int]
     count: int
     data_row: _containers.ScalarMap[str, str]
+    load_id: str
+    operation: str
+    sequence: int
     source_id: int
-    def __init__(self, source_id: _Optional[int] = ..., count: _Optional[int] = ..., data_row: _Optional[_Mapping[str, str]] = ...) -> None: ...
+    def __init__(self, source_id: _Optional[int] = ..., count: _Optional[int] = ..., data_row: _Optional[_Mapping[str, str]] = ..., sequence: _Optional[int] = ..., load_id: _Optional[str] = ..., operation: _Optional[str] = ...) -> None: ...
 
 class GroupDeleteRequest(_message.Message):
     __slots__ = ["group_id"]
@@ -1,123 +1,284 @@
+import asyncio
+import itertools
 from enum import Enum
-from typing import List
+from typing import Iterable, Iterator, List
+
 import grpc
 import sqlalchemy.exc
 from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from v3.grpc_config.dataflow_to_dataview.proto import (
-    data_carrier_pb2_grpc,
-    data_carrier_pb2,
+from v3.config import (
+    DATAVIEW_INSERT_SEGMENT_SIZE,
+    DATAVIEW_ROW_OPERATIONS,
+    DATAVIEW_SEGMENTED_INSERT,
 )
-from v3.config import DATAVIEW_MANAGER_HOST, DATAVIEW_MANAGER_GRPC_PORT
 from v3.database.schemas import SourceGroup, Source
+from v3.grpc_config.dataflow_to_dataview.client import DataviewClient
 from v3.grpc_config.dataflow_to_dataview.proto.data_carrier_pb2 import (
     DataRequest,
+    Response,
+)
+from v3.grpc_config.delta_load import (
+    DeltaLoadFilter,
+    RowOperation,
+    read_row_hash_snapshot,
+    save_row_hash_snapshot,
+)
+from v3.grpc_config.load_state import (
+    get_loaded_validators,
+    load_watermark,
+    save_pending_watermark,
+    start_or_resume_load,
+    save_checkpoint,
+    finish_load,
 )
+from v3.grpc_config.utils import iterate_in_thread
 from v3.routers.sources.sources_managers.utils import get_source_manager
 from v3.routers.sources.utils.exceptions import InternalError, CustomException
 
+# number of rows pulled from a source manager per worker thread hop
+REQUESTS_CHUNK_SIZE = 1000
+
+NO_DATA_DETAIL = "No data were provided! Check data source contains data or check configuration to be correct!"
+
 
 class GRPCResponseStatus(Enum):
     ERROR = "ERROR"
     OK = "OK"
 
 
-def crete_source_group(group_id: int, group_name: str):
-    """Creates group in MS DATAVIEW MANAGER, otherwise raises error"""
-    with grpc.insecure_channel(
-        f"{DATAVIEW_MANAGER_HOST}:{DATAVIEW_MANAGER_GRPC_PORT}"
-    ) as channel:
-        stub = data_carrier_pb2_grpc.DataCarrierStub(channel)
-        request = data_carrier_pb2.GroupRequest(
-            group_id=group_id, name=group_name
-        )
-        response = stub.CreateSourceGroup(request)
+def raise_for_status(response: Response):
+    """Raises error if MS DATAVIEW MANAGER responded with error status"""
+    if response.status == GRPCResponseStatus.ERROR.value:
+        raise ValueError(response.message)
+
 
-        if response.status == GRPCResponseStatus.ERROR.value:
-            raise ValueError(response.message)
+async def crete_source_group(group_id: int, group_name: str):
+    """Creates group in MS DATAVIEW MANAGER, otherwise raises error"""
+    response = await DataviewClient.create_source_group(group_id, group_name)
+    raise_for_status(response)
 
 
-def create_source(group_id: int, source_id: int, source_name: str):
+async def create_source(group_id: int, source_id: int, source_name: str):
     """Creates source in MS DATAVIEW MANAGER, otherwise raises error"""
-    with grpc.insecure_channel(
-        f"{DATAVIEW_MANAGER_HOST}:{DATAVIEW_MANAGER_GRPC_PORT}"
-    ) as channel:
-        stub = data_carrier_pb2_grpc.DataCarrierStub(channel)
-        request = data_carrier_pb2.SourceRequest(
-            source_id=source_id, group_id=group_id, name=source_name
-        )
-        response = stub.CreateSource(request)
-        if response.status == GRPCResponseStatus.ERROR.value:
-            raise ValueError(response.message)
+    response = await DataviewClient.create_source(
+        group_id, source_id, source_name
+    )
+    raise_for_status(response)
 
 
-def config_source(source_id: int, columns: List):
+async def config_source(source_id: int, columns: List):
     """Set source columns names for further import data into MS DATAVIEW MANAGER"""
-    with grpc.insecure_channel(
-        f"{DATAVIEW_MANAGER_HOST}:{DATAVIEW_MANAGER_GRPC_PORT}"
-    ) as channel:
-        stub = data_carrier_pb2_grpc.DataCarrierStub(channel)
-        request = data_carrier_pb2.ConfigRequest(
-            source_id=source_id, columns=columns
-        )
-        response = stub.ConfigSource(request)
+    response = await DataviewClient.config_source(source_id, columns)
+    raise_for_status(response)
 
-        if response.status == GRPCResponseStatus.ERROR.value:
-            raise ValueError(response.message)
 
+async def config_source_with_types(source_id: int, columns: dict[str, str]):
+    response = await DataviewClient.config_source_with_types(source_id, columns)
+    raise_for_status(response)
 
-def config_source_with_types(source_id: int, columns: dict[str, str]):
-    with grpc.insecure_channel(
-        f"{DATAVIEW_MANAGER_HOST}:{DATAVIEW_MANAGER_GRPC_PORT}"
-    ) as channel:
-        stub = data_carrier_pb2_grpc.DataCarrierStub(channel)
-        response = stub.ConfigSourceWithTypes(
-            data_carrier_pb2.ConfigWithTypesRequest(
-                source_id=source_id, columns=columns
-            )
-        )
 
-        if response.status == GRPCResponseStatus.ERROR.value:
-            raise ValueError(response.message)
+async def load_data_into_dataview_manager(
+    request_iterator: Iterable[DataRequest],
+):
+    """Load data into MS DATAVIEW MANAGER"""
+    iteration_errors = []
 
+    async def requests():
+        try:
+            async for request in iterate_in_thread(
+                request_iterator, REQUESTS_CHUNK_SIZE
+            ):
+                yield request
+        except Exception as exc:
+            iteration_errors.append(exc)
+            raise
 
-def load_data_into_dataview_manager(request_iterator: list[DataRequest]):
-    """Load data into MS DATAVIEW MANAGER"""
     try:
-        with grpc.insecure_channel(
-            f"{DATAVIEW_MANAGER_HOST}:{DATAVIEW_MANAGER_GRPC_PORT}"
-        ) as channel:
-            stub = data_carrier_pb2_grpc.DataCarrierStub(channel)
-            response_future = stub.InsertData.future(request_iterator)
-            response = response_future.result()
-            if response.status == GRPCResponseStatus.ERROR.value:
-                raise ValueError(response.message)
-    except grpc.RpcError as exc:
-        if exc.details() == "Exception iterating requests!":
+        response = await DataviewClient.insert_data(requests())
+    except (grpc.RpcError, asyncio.CancelledError) as exc:
+        # grpc.aio cancels the call when request iterator fails
+        if iteration_errors:
             raise HTTPException(
-                status_code=422,
-                detail="No data were provided! Check data source contains data or check configuration to be correct!",
+                status_code=422, detail=NO_DATA_DETAIL
+            ) from iteration_errors[0]
+        raise exc
+    raise_for_status(response)
+
+
+class SentRequestsCounter:
+    """Iterator wrapper counting requests consumed by gRPC call"""
+
+    def __init__(self, request_iterator: Iterable[DataRequest]):
+        self._iterator = iter(request_iterator)
+        self.count = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> DataRequest:
+        request = next(self._iterator)
+        self.count += 1
+        return request
+
+
+def sequence_requests(
+    request_iterator: Iterable[DataRequest], load_id: str, start: int
+) -> Iterator[DataRequest]:
+    """Marks requests with load id and position of the row within the load"""
+    for sequence, request in enumerate(request_iterator, start=start):
+        request.sequence = sequence
+        request.load_id = load_id
+        yield request
+
+
+async def load_data_with_checkpoints(
+    session: AsyncSession,
+    source: Source,
+    request_iterator: Iterable[DataRequest],
+    segment_size: int | None = None,
+    validators: dict | None = None,
+):
+    """Load data into MS DATAVIEW MANAGER in segments of segment_size rows.
+    Offset of the last acknowledged segment is persisted, so a retry of the
+    failed load skips rows that were already sent.
+
+    If segment_size is not set, segments of DATAVIEW_INSERT_SEGMENT_SIZE rows
+    are used only if DATAVIEW_SEGMENTED_INSERT is on, otherwise all rows are
+    sent by one call and a failed load is sent again from the first row.
+    Nothing is sent if there are no rows. validators of the loaded data are
+    saved when the load is finished"""
+    if segment_size is None and DATAVIEW_SEGMENTED_INSERT:
+        segment_size = DATAVIEW_INSERT_SEGMENT_SIZE
+    state = await start_or_resume_load(session, source)
+    # offset of the previous attempt is kept only by segmented loads
+    acked_offset = state.acked_offset if segment_size is not None else 0
+    requests = sequence_requests(
+        itertools.islice(request_iterator, acked_offset, None),
+        load_id=state.load_id,
+        start=acked_offset,
+    )
+
+    while True:
+        try:
+            first_request = await asyncio.to_thread(next, requests, None)
+        except CustomException as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=422, detail=NO_DATA_DETAIL) from exc
+        if first_request is None:
+            break
+
+        rest = None if segment_size is None else segment_size - 1
+        segment = itertools.chain(
+            [first_request], itertools.islice(requests, rest)
+        )
+        sent = SentRequestsCounter(segment)
+        await load_data_into_dataview_manager(sent)
+        acked_offset += sent.count
+        await save_checkpoint(session, state, acked_offset)
+
+    await finish_load(session, state, validators)
+
+
+def mark_inserted(
+    request_iterator: Iterable[DataRequest],
+) -> Iterator[DataRequest]:
+    """Marks requests as inserted rows, so DATAVIEW MANAGER appends them to
+    rows of the previous loads"""
+    for request in request_iterator:
+        request.operation = RowOperation.INSERT.value
+        yield request
+
+
+async def get_incremental_data(
+    session: AsyncSession,
+    source: Source,
+    source_manager,
+    watermark_column: str,
+    full: bool = False,
+) -> Iterable[DataRequest]:
+    """Returns rows added since the last finished load. Upper bound of the
+    rows is fixed when the load starts, so a resumed load sends the same rows,
+    and becomes the watermark when the load is finished. If full is set, all
+    rows up to the upper bound are returned"""
+    state = await start_or_resume_load(session, source)
+    if state.watermark_column != watermark_column or state.acked_offset == 0:
+        watermark = None
+        if not full and state.watermark_column == watermark_column:
+            watermark = load_watermark(state.watermark)
+        try:
+            upper_bound = await asyncio.to_thread(
+                source_manager.get_watermark_upper_bound, watermark
             )
-        else:
-            raise exc
+        except (sqlalchemy.exc.OperationalError, CustomException) as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        await save_pending_watermark(
+            session, state, watermark_column, upper_bound
+        )
 
+    if state.pending_watermark is None:
+        # no rows after the watermark
+        return iter(())
+    source_manager.watermark = None if full else load_watermark(state.watermark)
+    source_manager.watermark_upper_bound = load_watermark(
+        state.pending_watermark
+    )
+    return source_manager.get_source_data_for_grpc(source.id)
 
-def load_data_process(group: SourceGroup, source: Source):
-    create_source(group.id, source.id, source.name)
 
+async def get_modified_validators(
+    session: AsyncSession, source: Source, source_manager, force: bool = False
+) -> tuple[bool, dict | None]:
+    """Returns whether source data was modified since the last finished load
+    and validators of the current data. Data without validators is always
+    considered modified, as well as any data if force is set"""
+    previous = None
+    if not force:
+        previous = await get_loaded_validators(session, source)
+    try:
+        validators = await asyncio.to_thread(
+            source_manager.get_data_validators, previous
+        )
+    except CustomException as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return validators is None or validators != previous, validators
+
+
+async def load_data_process(
+    group: SourceGroup,
+    source: Source,
+    session: AsyncSession,
+    force: bool = False,
+) -> bool:
+    """Loads source data into MS DATAVIEW MANAGER. Returns False if the data
+    was not modified since the last load, so nothing was loaded, unless
+    force is set"""
     source_manager = get_source_manager(source)
+    modified, validators = await get_modified_validators(
+        session, source, source_manager, force
+    )
+    if not modified:
+        return False
+
+    await create_source(group.id, source.id, source.name)
     con_data = source.decoded_data().get("con_data")
     try:
-        columns_with_types = source_manager.get_columns_with_types()
-        config_source_with_types(
+        columns_with_types = await asyncio.to_thread(
+            source_manager.get_columns_with_types
+        )
+        await config_source_with_types(
             source_id=source.id, columns=columns_with_types
         )
     except NotImplementedError:
         columns = con_data.get("source_data_columns")
         if not columns:
-            columns = source_manager.get_source_data_columns()
+            columns = await asyncio.to_thread(
+                source_manager.get_source_data_columns
+            )
 
-        config_source(source.id, columns)
+        await config_source(source.id, columns)
     except InternalError as exc:
         raise HTTPException(
             status_code=500, detail="Something went wrong..."
@@ -129,31 +290,59 @@ def load_data_process(group: SourceGroup, source: Source):
     ) as exc:
         raise HTTPException(status_code=400, detail=str(exc.details()))
 
-    res = source_manager.get_source_data_for_grpc(source.id)
-    load_data_into_dataview_manager(res)
+    watermark_column = con_data.get("watermark_column")
+    if watermark_column:
+        # DATAVIEW MANAGER without row operations replaces source data by
+        # every load, so all rows are sent and the watermark only advances
+        res = await get_incremental_data(
+            session,
+            source,
+            source_manager,
+            watermark_column,
+            full=not DATAVIEW_ROW_OPERATIONS,
+        )
+        if DATAVIEW_ROW_OPERATIONS:
+            res = mark_inserted(res)
+    else:
+        res = source_manager.get_source_data_for_grpc(source.id)
+    delta_load = con_data.get("delta_load")
+    if not delta_load:
+        await load_data_with_checkpoints(
+            session, source, res, validators=validators
+        )
+        return True
 
+    previous_snapshot = await asyncio.to_thread(
+        read_row_hash_snapshot, source.id
+    )
+    delta_filter = DeltaLoadFilter(
+        source_id=source.id,
+        key_columns=delta_load["key_columns"],
+        previous=previous_snapshot,
+    )
+    if DATAVIEW_ROW_OPERATIONS:
+        # send only rows changed since the previous successful load
+        res = delta_filter.filter(res)
+    else:
+        # DATAVIEW MANAGER replaces source data by every load, so all rows
+        # are sent, snapshot of them is kept for the next delta load
+        res = delta_filter.track(res)
+    await load_data_with_checkpoints(
+        session, source, res, validators=validators
+    )
+    await asyncio.to_thread(
+        save_row_hash_snapshot, source.id, delta_filter.snapshot
+    )
+    return True
 
-def delete_group_in_dataview_manager(group_id: int):
-    """Deletes group in DATAVIEW MANAGER"""
-    with grpc.insecure_channel(
-        f"{DATAVIEW_MANAGER_HOST}:{DATAVIEW_MANAGER_GRPC_PORT}"
-    ) as channel:
-        stub = data_carrier_pb2_grpc.DataCarrierStub(channel)
-        request = data_carrier_pb2.GroupDeleteRequest(group_id=group_id)
-        response = stub.DeleteGroup(request)
 
-        if response.status == GRPCResponseStatus.ERROR.value:
-            raise ValueError(response.message)
+async def delete_group_in_dataview_manager(group_id: int):
+    """Deletes group in DATAVIEW MANAGER"""
+    response = await DataviewClient.delete_group(group_id)
+    raise_for_status(response)
 
 
-def delete_source_in_dataview_manager(source_id: int):
+async def delete_source_in_dataview_manager(source_id: int):
     """Deletes source in DATAVIEW MANAGER"""
-    with grpc.insecure_channel(
-        f"{DATAVIEW_MANAGER_HOST}:{DATAVIEW_MANAGER_GRPC_PORT}"
-    ) as channel:
-        stub = data_carrier_pb2_grpc.DataCarrierStub(channel)
-        request = data_carrier_pb2.SourceDeleteRequest(source_id=source_id)
-        response = stub.DeleteSource(request)
-
-        if response.status == GRPCResponseStatus.ERROR.value:
-            raise ValueError(response.message)
+    response = await DataviewClient.delete_source(source_id)
+    raise_for_status(response)
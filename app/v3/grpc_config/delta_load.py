@@ -0,0 +1,312 @@
+import io
+import itertools
+import json
+from enum import Enum
+from typing import Iterable, Iterator
+
+import minio
+import numpy as np
+import pandas as pd
+
+from v3.config import MINIO_BUCKET
+from v3.file_server.minio_client_manager import minio_client
+from v3.grpc_config.dataflow_to_dataview.proto.data_carrier_pb2 import (
+    DataRequest,
+)
+from v3.routers.sources.utils.exceptions import ValidationError
+
+DELTA_LOAD_CHUNK_SIZE = 10_000
+
+
+class RowOperation(Enum):
+    INSERT = "insert"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+def encode_keys(df: pd.DataFrame, key_columns: list[str]) -> np.ndarray:
+    """Returns object array of key values of each row encoded as JSON list,
+    null values are kept as null"""
+    values = df[key_columns].astype(object)
+    values = values.where(values.notna(), None)
+    return np.array(
+        [
+            json.dumps([None if value is None else str(value) for value in row])
+            for row in values.itertuples(index=False, name=None)
+        ],
+        dtype=object,
+    )
+
+
+def pack_keys(keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Packs variable length keys into one byte buffer and offsets of keys,
+    so they can be stored by numpy without pickle and without padding"""
+    encoded = [key.encode() for key in keys]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(key) for key in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def unpack_keys(data: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    buffer = data.tobytes()
+    return np.array(
+        [
+            buffer[start:end].decode()
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ],
+        dtype=object,
+    )
+
+
+class RowHashSnapshot:
+    """Hashes of rows sent by the previous load, sorted by key hash.
+    keys holds key values (JSON lists, see encode_keys) to build delete
+    requests"""
+
+    def __init__(
+        self,
+        key_columns: list[str],
+        key_hashes: np.ndarray,
+        row_hashes: np.ndarray,
+        keys: np.ndarray,
+    ):
+        self.key_columns = list(key_columns)
+        self.key_hashes = key_hashes
+        self.row_hashes = row_hashes
+        self.keys = keys
+
+    def __len__(self):
+        return len(self.key_hashes)
+
+    @classmethod
+    def empty(cls, key_columns: list[str]) -> "RowHashSnapshot":
+        return cls(
+            key_columns=key_columns,
+            key_hashes=np.empty(0, dtype=np.uint64),
+            row_hashes=np.empty(0, dtype=np.uint64),
+            keys=np.empty(0, dtype=object),
+        )
+
+    def to_bytes(self) -> bytes:
+        keys_data, keys_offsets = pack_keys(self.keys)
+        buf = io.BytesIO()
+        np.savez_compressed(
+            buf,
+            key_columns=np.array(self.key_columns, dtype=str),
+            key_hashes=self.key_hashes,
+            row_hashes=self.row_hashes,
+            keys_data=keys_data,
+            keys_offsets=keys_offsets,
+        )
+        return buf.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "RowHashSnapshot":
+        with np.load(io.BytesIO(data), allow_pickle=False) as arrays:
+            if "keys_data" in arrays:
+                keys = unpack_keys(arrays["keys_data"], arrays["keys_offsets"])
+            else:
+                # snapshots saved as fixed width string arrays, empty
+                # string was stored instead of null
+                keys = np.array(
+                    [
+                        json.dumps([value or None for value in row])
+                        for row in arrays["keys"].tolist()
+                    ],
+                    dtype=object,
+                )
+            return cls(
+                key_columns=arrays["key_columns"].tolist(),
+                key_hashes=arrays["key_hashes"],
+                row_hashes=arrays["row_hashes"],
+                keys=keys,
+            )
+
+
+def hash_rows(
+    df: pd.DataFrame, key_columns: list[str]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Returns uint64 hashes of key columns and of whole rows.
+    Row hash does not depend on the columns order"""
+    for column in key_columns:
+        if column not in df.columns:
+            df[column] = None
+    key_hashes = pd.util.hash_pandas_object(
+        df[key_columns], index=False
+    ).to_numpy(dtype=np.uint64)
+    row_hashes = pd.util.hash_pandas_object(
+        df[sorted(df.columns)], index=False
+    ).to_numpy(dtype=np.uint64)
+    return key_hashes, row_hashes
+
+
+class DeltaLoadFilter:
+    """Passes only inserted and updated rows compared to the previous load
+    snapshot and appends delete requests for rows that disappeared.
+
+    Rows are passed as soon as their chunk is hashed, only hashes and keys
+    of the new snapshot are kept in memory. Total size of the delta is
+    unknown until the source is read, so count of every request is number
+    of delta requests sent so far. Non-unique keys are detected when the
+    source is read, before delete requests are sent.
+    New snapshot is available in self.snapshot after iteration is finished"""
+
+    def __init__(
+        self,
+        source_id: int,
+        key_columns: list[str],
+        previous: RowHashSnapshot | None,
+        chunk_size: int = DELTA_LOAD_CHUNK_SIZE,
+    ):
+        self.source_id = source_id
+        self.key_columns = list(key_columns)
+        if previous is None or previous.key_columns != self.key_columns:
+            previous = RowHashSnapshot.empty(self.key_columns)
+        self.previous = previous
+        self.chunk_size = chunk_size
+        self.snapshot: RowHashSnapshot | None = None
+
+    def filter(
+        self, request_iterator: Iterable[DataRequest]
+    ) -> Iterator[DataRequest]:
+        previous = self.previous
+        seen = np.zeros(len(previous), dtype=bool)
+        count = 0
+
+        for chunk, positions, found, changed in self._iter_hashed_chunks(
+            request_iterator
+        ):
+            seen[positions[found]] = True
+            for idx in np.flatnonzero(~found | changed):
+                request = chunk[idx]
+                if changed[idx]:
+                    request.operation = RowOperation.UPDATE.value
+                else:
+                    request.operation = RowOperation.INSERT.value
+                count += 1
+                request.count = count
+                yield request
+
+        for idx in np.flatnonzero(~seen):
+            data_row = {
+                column: value
+                for column, value in zip(
+                    self.key_columns, json.loads(previous.keys[idx])
+                )
+                if value is not None
+            }
+            count += 1
+            yield DataRequest(
+                source_id=self.source_id,
+                count=count,
+                data_row=data_row,
+                operation=RowOperation.DELETE.value,
+            )
+
+    def track(
+        self, request_iterator: Iterable[DataRequest]
+    ) -> Iterator[DataRequest]:
+        """Passes all rows unchanged (full load) and builds snapshot of
+        them, so the next delta load is compared to the loaded rows"""
+        for chunk, *_ in self._iter_hashed_chunks(request_iterator):
+            yield from chunk
+
+    def _iter_hashed_chunks(
+        self, request_iterator: Iterable[DataRequest]
+    ) -> Iterator[tuple[list, np.ndarray, np.ndarray, np.ndarray]]:
+        """Yields chunks of requests with positions of their keys in the
+        previous snapshot, masks of found and changed rows. Snapshot of all
+        rows is built when the last chunk is consumed"""
+        previous = self.previous
+        key_hashes, row_hashes, keys = [], [], []
+
+        iterator = iter(request_iterator)
+        while chunk := list(itertools.islice(iterator, self.chunk_size)):
+            df = pd.DataFrame([dict(request.data_row) for request in chunk])
+            chunk_key_hashes, chunk_row_hashes = hash_rows(df, self.key_columns)
+            key_hashes.append(chunk_key_hashes)
+            row_hashes.append(chunk_row_hashes)
+            keys.append(encode_keys(df, self.key_columns))
+
+            positions = np.searchsorted(previous.key_hashes, chunk_key_hashes)
+            positions = np.minimum(positions, max(len(previous) - 1, 0))
+            if len(previous):
+                found = previous.key_hashes[positions] == chunk_key_hashes
+                changed = found & (
+                    previous.row_hashes[positions] != chunk_row_hashes
+                )
+            else:
+                found = np.zeros(len(chunk), dtype=bool)
+                changed = found
+            yield chunk, positions, found, changed
+
+        self.snapshot = self._build_snapshot(key_hashes, row_hashes, keys)
+
+    def _build_snapshot(
+        self,
+        key_hashes: list[np.ndarray],
+        row_hashes: list[np.ndarray],
+        keys: list[np.ndarray],
+    ) -> RowHashSnapshot:
+        if not key_hashes:
+            return RowHashSnapshot.empty(self.key_columns)
+
+        key_hashes = np.concatenate(key_hashes)
+        order = np.argsort(key_hashes, kind="stable")
+        key_hashes = key_hashes[order]
+        keys = np.concatenate(keys)[order]
+        duplicated = np.flatnonzero(key_hashes[1:] == key_hashes[:-1])
+        if len(duplicated):
+            raise ValidationError(
+                f"Key columns {self.key_columns} of delta load are not "
+                f"unique, e.g. key {keys[duplicated[0]]} is duplicated"
+            )
+        return RowHashSnapshot(
+            key_columns=self.key_columns,
+            key_hashes=key_hashes,
+            row_hashes=np.concatenate(row_hashes)[order],
+            keys=keys,
+        )
+
+
+def get_snapshot_object_name(source_id: int) -> str:
+    return f"delta_load/{source_id}.npz"
+
+
+def read_row_hash_snapshot(source_id: int) -> RowHashSnapshot | None:
+    """Returns snapshot of the previous load from MinIO, if it exists"""
+    try:
+        response = minio_client().get_object(
+            bucket_name=MINIO_BUCKET,
+            object_name=get_snapshot_object_name(source_id),
+        )
+    except minio.error.S3Error as e:
+        if e.code == "NoSuchKey":
+            return None
+        raise
+    try:
+        return RowHashSnapshot.from_bytes(response.read())
+    finally:
+        response.close()
+        response.release_conn()
+
+
+def save_row_hash_snapshot(source_id: int, snapshot: RowHashSnapshot):
+    data = snapshot.to_bytes()
+    minio_client().put_object(
+        bucket_name=MINIO_BUCKET,
+        object_name=get_snapshot_object_name(source_id),
+        data=io.BytesIO(data),
+        length=len(data),
+    )
+
+
+def delete_row_hash_snapshot(source_id: int):
+    try:
+        minio_client().remove_object(
+            bucket_name=MINIO_BUCKET,
+            object_name=get_snapshot_object_name(source_id),
+        )
+    except minio.error.S3Error as e:
+        if e.code != "NoSuchKey":
+            raise
@@ -0,0 +1,135 @@
+import datetime
+import decimal
+import json
+import uuid
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from v3.database.schemas import Source, SourceLoadState
+from v3.utils.encryption_utils import get_data_digest
+
+
+async def start_or_resume_load(
+    session: AsyncSession, source: Source
+) -> SourceLoadState:
+    """Returns state of unfinished load of source with the same configuration,
+    otherwise starts new load from the first row"""
+    # digest changes on every source update, so a load of outdated
+    # configuration is not resumed
+    digest = get_data_digest(source.con_data)
+    state = await session.get(SourceLoadState, source.id)
+    if state is None:
+        state = SourceLoadState(source_id=source.id)
+    elif not state.is_finished and state.con_data_digest == digest:
+        return state
+    elif state.con_data_digest != digest:
+        # validators of data of other configuration
+        state.validators = None
+
+    state.load_id = str(uuid.uuid4())
+    state.con_data_digest = digest
+    state.acked_offset = 0
+    state.is_finished = False
+    state.pending_watermark = None
+    session.add(state)
+    await session.commit()
+    return state
+
+
+async def save_checkpoint(
+    session: AsyncSession, state: SourceLoadState, acked_offset: int
+):
+    """Persists number of rows acknowledged by MS DATAVIEW MANAGER"""
+    state.acked_offset = acked_offset
+    session.add(state)
+    await session.commit()
+
+
+async def finish_load(
+    session: AsyncSession,
+    state: SourceLoadState,
+    validators: dict | None = None,
+):
+    """Marks load finished and advances watermark to the upper bound of the
+    load in the same transaction. validators of loaded data are kept for the
+    next load, see get_loaded_validators"""
+    state.is_finished = True
+    state.validators = (
+        None if validators is None else json.dumps(validators, sort_keys=True)
+    )
+    if state.pending_watermark is not None:
+        state.watermark = state.pending_watermark
+        state.pending_watermark = None
+    session.add(state)
+    await session.commit()
+
+
+async def get_loaded_validators(
+    session: AsyncSession, source: Source
+) -> dict | None:
+    """Returns validators of data of the last finished load of source with
+    the current configuration, None if there is no such load"""
+    state = await session.get(SourceLoadState, source.id)
+    if (
+        state is None
+        or not state.is_finished
+        or state.validators is None
+        or state.con_data_digest != get_data_digest(source.con_data)
+    ):
+        return None
+    return json.loads(state.validators)
+
+
+async def save_pending_watermark(
+    session: AsyncSession,
+    state: SourceLoadState,
+    column: str,
+    upper_bound: Any,
+):
+    """Persists upper bound of rows selected by the current load, so resumed
+    load selects the same rows"""
+    if state.watermark_column != column:
+        state.watermark_column = column
+        state.watermark = None
+    state.pending_watermark = dump_watermark(upper_bound)
+    session.add(state)
+    await session.commit()
+
+
+WATERMARK_LOADERS = {
+    "datetime": datetime.datetime.fromisoformat,
+    "date": datetime.date.fromisoformat,
+    "decimal": decimal.Decimal,
+    "int": int,
+    "float": float,
+    "str": str,
+}
+
+
+def dump_watermark(value: Any) -> str | None:
+    """Serializes watermark value keeping its type"""
+    if value is None:
+        return None
+    if isinstance(value, datetime.datetime):
+        type_name, value = "datetime", value.isoformat()
+    elif isinstance(value, datetime.date):
+        type_name, value = "date", value.isoformat()
+    elif isinstance(value, decimal.Decimal):
+        type_name, value = "decimal", str(value)
+    elif isinstance(value, int):
+        type_name = "int"
+    elif isinstance(value, float):
+        type_name = "float"
+    elif isinstance(value, str):
+        type_name = "str"
+    else:
+        raise TypeError(f"Unsupported watermark type {type(value).__name__}")
+    return json.dumps({"type": type_name, "value": value})
+
+
+def load_watermark(data: str | None) -> Any:
+    if data is None:
+        return None
+    data = json.loads(data)
+    return WATERMARK_LOADERS[data["type"]](data["value"])
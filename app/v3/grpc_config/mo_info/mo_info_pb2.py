@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rmo_info.proto\x12\x07mo_info\x1a\x19google/protobuf/any.proto\" \n\x0eTMOInfoRequest\x12\x0e\n\x06tmo_id\x18\x01 \x03(\x05\"\x1f\n\rMOInfoRequest\x12\x0e\n\x06mo_ids\x18\x01 \x03(\x05\"#\n\x0fTMOInfoResponse\x12\x10\n\x08tmo_info\x18\x01 \x01(\t\"2\n\x0bInfoRequest\x12\r\n\x05mo_id\x18\x01 \x01(\x05\x12\x14\n\x08tprm_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\"9\n\x13RequestSeverityMoId\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x12\n\x06mo_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\",\n\x14ResponseSeverityMoId\x12\x14\n\x0cmax_severity\x18\x01 \x01(\x05\"N\n\x15RequestSeverityValues\x12\x17\n\x0f\x64ict_severities\x18\x01 \x01(\t\x12\x1c\n\x14\x64ict_tmo_with_mo_ids\x18\x02 \x01(\t\"4\n\x1cResponseMOQuantityBySeverity\x12\x14\n\x0c\x64ict_mo_info\x18\x01 \x01(\t\":\n\x0bValueOfDict\x12+\n\rmo_tprm_value\x18\x01 \x03(\x0b\x32\x14.google.protobuf.Any\"\x81\x01\n\tInfoReply\x12/\n\x07mo_info\x18\x01 \x03(\x0b\x32\x1e.mo_info.InfoReply.MoInfoEntry\x1a\x43\n\x0bMoInfoEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.mo_info.ValueOfDict:\x02\x38\x01\"&\n\x06MOInfo\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x0c\n\x04p_id\x18\x02 \x01(\x05\"\x1c\n\x0bStringValue\x12\r\n\x05value\x18\x01 \x01(\t\"\x19\n\x08IntValue\x12\r\n\x05value\x18\x01 \x01(\x05\"\x1b\n\nFloatValue\x12\r\n\x05value\x18\x01 \x01(\x02\"\x1a\n\tBoolValue\x12\r\n\x05value\x18\x01 \x01(\x08\"W\n\x16RequestForObjInfoByTMO\x12\x16\n\x0eobject_type_id\x18\x01 \x01(\x05\x12\x14\n\x08tprm_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\x12\x0f\n\x07mo_p_id\x18\x03 \x01(\x05\"!\n\x0fResponseListInt\x12\x0e\n\x06values\x18\x01 \x03(\x05\"\xb2\x01\n\x18ResponseWithObjInfoByTMO\x12\r\n\x05mo_id\x18\x01 \x01(\x05\x12\x46\n\x0btprm_values\x18\x02 \x03(\x0b\x32\x31.mo_info.ResponseWithObjInfoByTMO.TprmValuesEntry\x12\x0c\n\x04p_id\x18\x03 \x01(\x05\x1a\x31\n\x0fTprmValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"5\n\x1eRequestTMOlifecycleByTMOidList\x12\x13\n\x07tmo_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\"E\n\x1fResponseTMOlifecycleByTMOidList\x12\"\n\x16tmo_ids_with_lifecycle\x18\x01 \x03(\x05\x42\x02\x10\x01\"\x89\x01\n\x1eRequestForFilteredObjInfoByTMO\x12\x16\n\x0eobject_type_id\x18\x01 \x01(\x05\x12\x14\n\x0cquery_params\x18\x02 \x01(\t\x12\x10\n\x08order_by\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65\x63oded_jwt\x18\x04 \x01(\t\x12\x12\n\x06mo_ids\x18\x05 \x03(\x05\x42\x02\x10\x01\"1\n\x0eResponseMOdata\x12\x1f\n\x17objects_with_parameters\x18\x01 \x03(\t\"&\n\x0eRequestTPRMIds\x12\x14\n\x08tprm_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\"6\n\x10ResponseTPRMName\x12\x0f\n\x07tprm_id\x18\x01 \x01(\x05\x12\x11\n\ttprm_name\x18\x02 \x01(\t\"=\n\x11ResponseTPRMNames\x12(\n\x05items\x18\x01 \x03(\x0b\x32\x19.mo_info.ResponseTPRMName\"\xd0\x01\n\x1cRequestForFilteredObjSpecial\x12\x16\n\x0eobject_type_id\x18\x01 \x01(\x05\x12\x14\n\x0cquery_params\x18\x02 \x01(\t\x12\x10\n\x08order_by\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65\x63oded_jwt\x18\x04 \x01(\t\x12\x12\n\x06mo_ids\x18\x05 \x03(\x05\x42\x02\x10\x01\x12\r\n\x05p_ids\x18\x06 \x03(\x05\x12\x10\n\x08only_ids\x18\x07 \x01(\x08\x12\x14\n\x08tprm_ids\x18\x08 \x03(\x05\x42\x02\x10\x01\x12\x10\n\x08mo_attrs\x18\t \x03(\t\"F\n\x15ResponseMOdataSpecial\x12\x12\n\x06mo_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\x12\x19\n\x11pickle_mo_dataset\x18\x02 \x03(\t\"2\n\x0bRequestNode\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x12\n\x06mo_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\"\x94\x01\n\x0cRequestLevel\x12(\n\nlevel_data\x18\x01 \x03(\x0b\x32\x14.mo_info.RequestNode\x12\x14\n\x0clevel_tmo_id\x18\x02 \x01(\x05\x12!\n\x15path_of_children_tmos\x18\x03 \x03(\x05\x42\x02\x10\x01\x12!\n\x15\x63ollect_data_for_tmos\x18\x04 \x03(\x05\x42\x02\x10\x01\"9\n\x11RequestListLevels\x12$\n\x05items\x18\x01 \x03(\x0b\x32\x15.mo_info.RequestLevel\"<\n\x0cResponseNode\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x1b\n\x0f\x63hildren_mo_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\"9\n\x11ResponseListNodes\x12$\n\x05items\x18\x01 \x03(\x0b\x32\x15.mo_info.ResponseNode\"/\n\x1dRequestMODetailsWithTPRMNames\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\"0\n\x1eResponseMODetailsWithTPRMNames\x12\x0e\n\x06\x63olumn\x18\x01 \x03(\t\")\n\x17RequestTMOAttrsAndTypes\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\">\n\x0eTMOAttrAndType\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x10\n\x08multiply\x18\x03 \x01(\x08\"B\n\x18ResponseTMOAttrsAndTypes\x12&\n\x05\x61ttrs\x18\x01 \x03(\x0b\x32\x17.mo_info.TMOAttrAndType\"p\n\x1bRequestObjWithParamsLimited\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x12\n\ntprm_names\x18\x02 \x03(\t\x12\r\n\x05limit\x18\x03 \x01(\x05\x12\x13\n\x06offset\x18\x04 \x01(\x05H\x00\x88\x01\x01\x42\t\n\x07_offset\",\n\x1cResponseObjWithParamsLimited\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\t\"\'\n\x0fRequestTPRMData\x12\x14\n\x08tprm_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\"&\n\x10ResponseTPRMData\x12\x12\n\ntprms_data\x18\x01 \x03(\t\"8\n\x15RequestTPRMNameToType\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x0f\n\x07\x63olumns\x18\x02 \x03(\t\"\x84\x01\n\x16ResponseTPRMNameToType\x12;\n\x06mapper\x18\x01 \x03(\x0b\x32+.mo_info.ResponseTPRMNameToType.MapperEntry\x1a-\n\x0bMapperEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x32\xdf\x0b\n\x08Informer\x12\x42\n\x14GetParamsValuesForMO\x12\x14.mo_info.InfoRequest\x1a\x12.mo_info.InfoReply\"\x00\x12\x35\n\rGetTMOidForMo\x12\x11.mo_info.IntValue\x1a\x0f.mo_info.MOInfo\"\x00\x12Z\n\x10GetObjWithParams\x12\x1f.mo_info.RequestForObjInfoByTMO\x1a!.mo_info.ResponseWithObjInfoByTMO\"\x00\x30\x01\x12^\n\x18GetFilteredObjWithParams\x12\'.mo_info.RequestForFilteredObjInfoByTMO\x1a\x17.mo_info.ResponseMOdata\"\x00\x12\x66\n\x0fGetTMOlifecycle\x12\'.mo_info.RequestTMOlifecycleByTMOidList\x1a(.mo_info.ResponseTMOlifecycleByTMOidList\"\x00\x12V\n\x15GetMOSeverityMaxValue\x12\x1c.mo_info.RequestSeverityMoId\x1a\x1d.mo_info.ResponseSeverityMoId\"\x00\x12\x62\n\x17GetMOQuantityBySeverity\x12\x1e.mo_info.RequestSeverityValues\x1a%.mo_info.ResponseMOQuantityBySeverity\"\x00\x12\x45\n\x0cGetTPRMNames\x12\x17.mo_info.RequestTPRMIds\x1a\x1a.mo_info.ResponseTPRMNames\"\x00\x12`\n\x15GetFilteredObjSpecial\x12%.mo_info.RequestForFilteredObjSpecial\x1a\x1e.mo_info.ResponseMOdataSpecial\"\x00\x12U\n\x19GetHierarchyLevelChildren\x12\x1a.mo_info.RequestListLevels\x1a\x1a.mo_info.ResponseListNodes\"\x00\x12n\n\x19GetMODetailsWithTPRMNames\x12&.mo_info.RequestMODetailsWithTPRMNames\x1a\'.mo_info.ResponseMODetailsWithTPRMNames\"\x00\x12\x66\n\x1dGetColumnsForMaterializedView\x12 .mo_info.RequestTMOAttrsAndTypes\x1a!.mo_info.ResponseTMOAttrsAndTypes\"\x00\x12H\n\x11GetTMOInfoByTMOId\x12\x17.mo_info.TMOInfoRequest\x1a\x18.mo_info.TMOInfoResponse\"\x00\x12\x46\n\x10GetTMOInfoByMOId\x12\x16.mo_info.MOInfoRequest\x1a\x18.mo_info.ResponseListInt\"\x00\x12j\n\x17GetObjWithParamsLimited\x12$.mo_info.RequestObjWithParamsLimited\x1a%.mo_info.ResponseObjWithParamsLimited\"\x00\x30\x01\x12\x44\n\x0bGetTPRMData\x12\x18.mo_info.RequestTPRMData\x1a\x19.mo_info.ResponseTPRMData\"\x00\x12\\\n\x17GetTPRMNameToTypeMapper\x12\x1e.mo_info.RequestTPRMNameToType\x1a\x1f.mo_info.ResponseTPRMNameToType\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rmo_info.proto\x12\x07mo_info\x1a\x19google/protobuf/any.proto\" \n\x0eTMOInfoRequest\x12\x0e\n\x06tmo_id\x18\x01 \x03(\x05\"\x1f\n\rMOInfoRequest\x12\x0e\n\x06mo_ids\x18\x01 \x03(\x05\"#\n\x0fTMOInfoResponse\x12\x10\n\x08tmo_info\x18\x01 \x01(\t\"2\n\x0bInfoRequest\x12\r\n\x05mo_id\x18\x01 \x01(\x05\x12\x14\n\x08tprm_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\"9\n\x13RequestSeverityMoId\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x12\n\x06mo_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\",\n\x14ResponseSeverityMoId\x12\x14\n\x0cmax_severity\x18\x01 \x01(\x05\"N\n\x15RequestSeverityValues\x12\x17\n\x0f\x64ict_severities\x18\x01 \x01(\t\x12\x1c\n\x14\x64ict_tmo_with_mo_ids\x18\x02 \x01(\t\"4\n\x1cResponseMOQuantityBySeverity\x12\x14\n\x0c\x64ict_mo_info\x18\x01 \x01(\t\":\n\x0bValueOfDict\x12+\n\rmo_tprm_value\x18\x01 \x03(\x0b\x32\x14.google.protobuf.Any\"\x81\x01\n\tInfoReply\x12/\n\x07mo_info\x18\x01 \x03(\x0b\x32\x1e.mo_info.InfoReply.MoInfoEntry\x1a\x43\n\x0bMoInfoEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.mo_info.ValueOfDict:\x02\x38\x01\"&\n\x06MOInfo\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x0c\n\x04p_id\x18\x02 \x01(\x05\"\x1c\n\x0bStringValue\x12\r\n\x05value\x18\x01 \x01(\t\"\x19\n\x08IntValue\x12\r\n\x05value\x18\x01 \x01(\x05\"\x1b\n\nFloatValue\x12\r\n\x05value\x18\x01 \x01(\x02\"\x1a\n\tBoolValue\x12\r\n\x05value\x18\x01 \x01(\x08\"W\n\x16RequestForObjInfoByTMO\x12\x16\n\x0eobject_type_id\x18\x01 \x01(\x05\x12\x14\n\x08tprm_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\x12\x0f\n\x07mo_p_id\x18\x03 \x01(\x05\"!\n\x0fResponseListInt\x12\x0e\n\x06values\x18\x01 \x03(\x05\"\xb2\x01\n\x18ResponseWithObjInfoByTMO\x12\r\n\x05mo_id\x18\x01 \x01(\x05\x12\x46\n\x0btprm_values\x18\x02 \x03(\x0b\x32\x31.mo_info.ResponseWithObjInfoByTMO.TprmValuesEntry\x12\x0c\n\x04p_id\x18\x03 \x01(\x05\x1a\x31\n\x0fTprmValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"5\n\x1eRequestTMOlifecycleByTMOidList\x12\x13\n\x07tmo_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\"E\n\x1fResponseTMOlifecycleByTMOidList\x12\"\n\x16tmo_ids_with_lifecycle\x18\x01 \x03(\x05\x42\x02\x10\x01\"\x89\x01\n\x1eRequestForFilteredObjInfoByTMO\x12\x16\n\x0eobject_type_id\x18\x01 \x01(\x05\x12\x14\n\x0cquery_params\x18\x02 \x01(\t\x12\x10\n\x08order_by\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65\x63oded_jwt\x18\x04 \x01(\t\x12\x12\n\x06mo_ids\x18\x05 \x03(\x05\x42\x02\x10\x01\"1\n\x0eResponseMOdata\x12\x1f\n\x17objects_with_parameters\x18\x01 \x03(\t\"&\n\x0eRequestTPRMIds\x12\x14\n\x08tprm_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\"6\n\x10ResponseTPRMName\x12\x0f\n\x07tprm_id\x18\x01 \x01(\x05\x12\x11\n\ttprm_name\x18\x02 \x01(\t\"=\n\x11ResponseTPRMNames\x12(\n\x05items\x18\x01 \x03(\x0b\x32\x19.mo_info.ResponseTPRMName\"\xd0\x01\n\x1cRequestForFilteredObjSpecial\x12\x16\n\x0eobject_type_id\x18\x01 \x01(\x05\x12\x14\n\x0cquery_params\x18\x02 \x01(\t\x12\x10\n\x08order_by\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65\x63oded_jwt\x18\x04 \x01(\t\x12\x12\n\x06mo_ids\x18\x05 \x03(\x05\x42\x02\x10\x01\x12\r\n\x05p_ids\x18\x06 \x03(\x05\x12\x10\n\x08only_ids\x18\x07 \x01(\x08\x12\x14\n\x08tprm_ids\x18\x08 \x03(\x05\x42\x02\x10\x01\x12\x10\n\x08mo_attrs\x18\t \x03(\t\"F\n\x15ResponseMOdataSpecial\x12\x12\n\x06mo_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\x12\x19\n\x11pickle_mo_dataset\x18\x02 \x03(\t\"2\n\x0bRequestNode\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x12\n\x06mo_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\"\x94\x01\n\x0cRequestLevel\x12(\n\nlevel_data\x18\x01 \x03(\x0b\x32\x14.mo_info.RequestNode\x12\x14\n\x0clevel_tmo_id\x18\x02 \x01(\x05\x12!\n\x15path_of_children_tmos\x18\x03 \x03(\x05\x42\x02\x10\x01\x12!\n\x15\x63ollect_data_for_tmos\x18\x04 \x03(\x05\x42\x02\x10\x01\"9\n\x11RequestListLevels\x12$\n\x05items\x18\x01 \x03(\x0b\x32\x15.mo_info.RequestLevel\"<\n\x0cResponseNode\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x1b\n\x0f\x63hildren_mo_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\"9\n\x11ResponseListNodes\x12$\n\x05items\x18\x01 \x03(\x0b\x32\x15.mo_info.ResponseNode\"/\n\x1dRequestMODetailsWithTPRMNames\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\"0\n\x1eResponseMODetailsWithTPRMNames\x12\x0e\n\x06\x63olumn\x18\x01 \x03(\t\")\n\x17RequestTMOAttrsAndTypes\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\">\n\x0eTMOAttrAndType\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x10\n\x08multiply\x18\x03 \x01(\x08\"B\n\x18ResponseTMOAttrsAndTypes\x12&\n\x05\x61ttrs\x18\x01 \x03(\x0b\x32\x17.mo_info.TMOAttrAndType\"\x8a\x01\n\x1bRequestObjWithParamsLimited\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x12\n\ntprm_names\x18\x02 \x03(\t\x12\r\n\x05limit\x18\x03 \x01(\x05\x12\x13\n\x06offset\x18\x04 \x01(\x05H\x00\x88\x01\x01\x12\x18\n\x10\x61\x63\x63\x65pt_encodings\x18\x05 \x03(\tB\t\n\x07_offset\"\x96\x01\n\x1cResponseObjWithParamsLimited\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\t\x12\x15\n\x08\x65ncoding\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x17\n\ndata_batch\x18\x03 \x01(\x0cH\x01\x88\x01\x01\x12\x12\n\x05total\x18\x04 \x01(\x05H\x02\x88\x01\x01\x42\x0b\n\t_encodingB\r\n\x0b_data_batchB\x08\n\x06_total\"\'\n\x0fRequestTPRMData\x12\x14\n\x08tprm_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\"&\n\x10ResponseTPRMData\x12\x12\n\ntprms_data\x18\x01 \x03(\t\"8\n\x15RequestTPRMNameToType\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x0f\n\x07\x63olumns\x18\x02 \x03(\t\"\x84\x01\n\x16ResponseTPRMNameToType\x12;\n\x06mapper\x18\x01 \x03(\x0b\x32+.mo_info.ResponseTPRMNameToType.MapperEntry\x1a-\n\x0bMapperEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x32\xdf\x0b\n\x08Informer\x12\x42\n\x14GetParamsValuesForMO\x12\x14.mo_info.InfoRequest\x1a\x12.mo_info.InfoReply\"\x00\x12\x35\n\rGetTMOidForMo\x12\x11.mo_info.IntValue\x1a\x0f.mo_info.MOInfo\"\x00\x12Z\n\x10GetObjWithParams\x12\x1f.mo_info.RequestForObjInfoByTMO\x1a!.mo_info.ResponseWithObjInfoByTMO\"\x00\x30\x01\x12^\n\x18GetFilteredObjWithParams\x12\'.mo_info.RequestForFilteredObjInfoByTMO\x1a\x17.mo_info.ResponseMOdata\"\x00\x12\x66\n\x0fGetTMOlifecycle\x12\'.mo_info.RequestTMOlifecycleByTMOidList\x1a(.mo_info.ResponseTMOlifecycleByTMOidList\"\x00\x12V\n\x15GetMOSeverityMaxValue\x12\x1c.mo_info.RequestSeverityMoId\x1a\x1d.mo_info.ResponseSeverityMoId\"\x00\x12\x62\n\x17GetMOQuantityBySeverity\x12\x1e.mo_info.RequestSeverityValues\x1a%.mo_info.ResponseMOQuantityBySeverity\"\x00\x12\x45\n\x0cGetTPRMNames\x12\x17.mo_info.RequestTPRMIds\x1a\x1a.mo_info.ResponseTPRMNames\"\x00\x12`\n\x15GetFilteredObjSpecial\x12%.mo_info.RequestForFilteredObjSpecial\x1a\x1e.mo_info.ResponseMOdataSpecial\"\x00\x12U\n\x19GetHierarchyLevelChildren\x12\x1a.mo_info.RequestListLevels\x1a\x1a.mo_info.ResponseListNodes\"\x00\x12n\n\x19GetMODetailsWithTPRMNames\x12&.mo_info.RequestMODetailsWithTPRMNames\x1a\'.mo_info.ResponseMODetailsWithTPRMNames\"\x00\x12\x66\n\x1dGetColumnsForMaterializedView\x12 .mo_info.RequestTMOAttrsAndTypes\x1a!.mo_info.ResponseTMOAttrsAndTypes\"\x00\x12H\n\x11GetTMOInfoByTMOId\x12\x17.mo_info.TMOInfoRequest\x1a\x18.mo_info.TMOInfoResponse\"\x00\x12\x46\n\x10GetTMOInfoByMOId\x12\x16.mo_info.MOInfoRequest\x1a\x18.mo_info.ResponseListInt\"\x00\x12j\n\x17GetObjWithParamsLimited\x12$.mo_info.RequestObjWithParamsLimited\x1a%.mo_info.ResponseObjWithParamsLimited\"\x00\x30\x01\x12\x44\n\x0bGetTPRMData\x12\x18.mo_info.RequestTPRMData\x1a\x19.mo_info.ResponseTPRMData\"\x00\x12\\\n\x17GetTPRMNameToTypeMapper\x12\x1e.mo_info.RequestTPRMNameToType\x1a\x1f.mo_info.ResponseTPRMNameToType\"\x00\x62\x06proto3')
 
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'mo_info_pb2', globals())
@@ -135,20 +135,20 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _TMOATTRANDTYPE._serialized_end=2445
   _RESPONSETMOATTRSANDTYPES._serialized_start=2447
   _RESPONSETMOATTRSANDTYPES._serialized_end=2513
-  _REQUESTOBJWITHPARAMSLIMITED._serialized_start=2515
-  _REQUESTOBJWITHPARAMSLIMITED._serialized_end=2627
-  _RESPONSEOBJWITHPARAMSLIMITED._serialized_start=2629
-  _RESPONSEOBJWITHPARAMSLIMITED._serialized_end=2673
-  _REQUESTTPRMDATA._serialized_start=2675
-  _REQUESTTPRMDATA._serialized_end=2714
-  _RESPONSETPRMDATA._serialized_start=2716
-  _RESPONSETPRMDATA._serialized_end=2754
-  _REQUESTTPRMNAMETOTYPE._serialized_start=2756
-  _REQUESTTPRMNAMETOTYPE._serialized_end=2812
-  _RESPONSETPRMNAMETOTYPE._serialized_start=2815
-  _RESPONSETPRMNAMETOTYPE._serialized_end=2947
-  _RESPONSETPRMNAMETOTYPE_MAPPERENTRY._serialized_start=2902
-  _RESPONSETPRMNAMETOTYPE_MAPPERENTRY._serialized_end=2947
-  _INFORMER._serialized_start=2950
-  _INFORMER._serialized_end=4453
+  _REQUESTOBJWITHPARAMSLIMITED._serialized_start=2516
+  _REQUESTOBJWITHPARAMSLIMITED._serialized_end=2654
+  _RESPONSEOBJWITHPARAMSLIMITED._serialized_start=2657
+  _RESPONSEOBJWITHPARAMSLIMITED._serialized_end=2807
+  _REQUESTTPRMDATA._serialized_start=2809
+  _REQUESTTPRMDATA._serialized_end=2848
+  _RESPONSETPRMDATA._serialized_start=2850
+  _RESPONSETPRMDATA._serialized_end=2888
+  _REQUESTTPRMNAMETOTYPE._serialized_start=2890
+  _REQUESTTPRMNAMETOTYPE._serialized_end=2946
+  _RESPONSETPRMNAMETOTYPE._serialized_start=2949
+  _RESPONSETPRMNAMETOTYPE._serialized_end=3081
+  _RESPONSETPRMNAMETOTYPE_MAPPERENTRY._serialized_start=3036
+  _RESPONSETPRMNAMETOTYPE_MAPPERENTRY._serialized_end=3081
+  _INFORMER._serialized_start=3084
+  _INFORMER._serialized_end=4587
 # @@protoc_insertion_point(module_scope)
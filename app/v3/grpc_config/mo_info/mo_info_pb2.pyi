@@ -138,16 +138,18 @@ class RequestNode(_message.Message):
     def __init__(self, node_id: _Optional[str] = ..., mo_ids: _Optional[_Iterable[int]] = ...) -> None: ...
 
 class RequestObjWithParamsLimited(_message.Message):
-    __slots__ = ["limit", "offset", "tmo_id", "tprm_names"]
+    __slots__ = ["accept_encodings", "limit", "offset", "tmo_id", "tprm_names"]
+    ACCEPT_ENCODINGS_FIELD_NUMBER: _ClassVar[int]
     LIMIT_FIELD_NUMBER: _ClassVar[int]
     OFFSET_FIELD_NUMBER: _ClassVar[int]
     TMO_ID_FIELD_NUMBER: _ClassVar[int]
     TPRM_NAMES_FIELD_NUMBER: _ClassVar[int]
+    accept_encodings: _containers.RepeatedScalarFieldContainer[str]
     limit: int
     offset: int
     tmo_id: int
     tprm_names: _containers.RepeatedScalarFieldContainer[str]
-    def __init__(self, tmo_id: _Optional[int] = ..., tprm_names: _Optional[_Iterable[str]] = ..., limit: _Optional[int] = ..., offset: _Optional[int] = ...) -> None: ...
+    def __init__(self, tmo_id: _Optional[int] = ..., tprm_names: _Optional[_Iterable[str]] = ..., limit: _Optional[int] = ..., offset: _Optional[int] = ..., accept_encodings: _Optional[_Iterable[str]] = ...) -> None: ...
 
 class RequestSeverityMoId(_message.Message):
     __slots__ = ["mo_ids", "tmo_id"]
@@ -244,10 +246,16 @@ class ResponseNode(_message.Message):
     def __init__(self, node_id: _Optional[str] = ..., children_mo_ids: _Optional[_Iterable[int]] = ...) -> None: ...
 
 class ResponseObjWithParamsLimited(_message.Message):
-    __slots__ = ["data"]
+    __slots__ = ["data", "data_batch", "encoding", "total"]
+    DATA_BATCH_FIELD_NUMBER: _ClassVar[int]
     DATA_FIELD_NUMBER: _ClassVar[int]
+    ENCODING_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_FIELD_NUMBER: _ClassVar[int]
     data: str
-    def __init__(self, data: _Optional[str] = ...) -> None: ...
+    data_batch: bytes
+    encoding: str
+    total: int
+    def __init__(self, data: _Optional[str] = ..., encoding: _Optional[str] = ..., data_batch: _Optional[bytes] = ..., total: _Optional[int] = ...) -> None: ...
 
 class ResponseSeverityMoId(_message.Message):
     __slots__ = ["max_severity"]
@@ -1,36 +1,110 @@
-import pickle
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
 
 import grpc
 
-from v3.grpc_config.config import INVENTORY_GRPC_URL
+from v3.grpc_config.config import (
+    INVENTORY_GRPC_URL,
+    INVENTORY_PAGE_PREFETCH,
+    INVENTORY_PAGE_SIZE,
+    TMO_METADATA_CACHE_TTL,
+)
+from v3.grpc_config.object_batch import (
+    ACCEPT_ENCODINGS,
+    decode_objects,
+    loads_hex_pickle,
+)
 from v3.grpc_config.mo_info.mo_info_pb2 import (
     RequestMODetailsWithTPRMNames,
     RequestObjWithParamsLimited,
     RequestTPRMNameToType,
 )
 from v3.grpc_config.mo_info.mo_info_pb2_grpc import InformerStub
+from v3.grpc_config.tmo_metadata_cache import CacheStats, TMOMetadataCache
+
+
+DATA_CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", 100 * 1024 * 1024),
+    ("grpc.max_receive_message_length", 100 * 1024 * 1024),
+]
 
 
 class MOInfoClient:
+    _metadata_cache = TMOMetadataCache(ttl=TMO_METADATA_CACHE_TTL)
+
+    @classmethod
+    def get_columns(cls, tmo_id: int) -> list[str]:
+        return cls._metadata_cache.get_or_load(
+            (tmo_id, "columns"), lambda: cls._get_columns(tmo_id)
+        )
+
+    @classmethod
+    def get_columns_with_types(
+        cls, tmo_id: int, columns: list[str] | None
+    ) -> dict[str, str]:
+        columns = sorted(set(columns or []))
+        return cls._metadata_cache.get_or_load(
+            (tmo_id, "columns_with_types", tuple(columns)),
+            lambda: cls._get_columns_with_types(tmo_id, columns),
+        )
+
+    @classmethod
+    def invalidate_metadata(cls, tmo_id: int | None = None):
+        """Drops cached columns and type mappers of tmo_id or of all TMOs
+        in the current process only"""
+        cls._metadata_cache.invalidate(tmo_id)
+
+    @classmethod
+    def get_metadata_cache_stats(cls) -> CacheStats:
+        return cls._metadata_cache.stats
+
     @staticmethod
-    def get_columns(tmo_id: int):
+    def _get_columns(tmo_id: int) -> list[str]:
         with grpc.insecure_channel(f"{INVENTORY_GRPC_URL}") as channel:
             stub = InformerStub(channel)
             result = stub.GetMODetailsWithTPRMNames(
                 RequestMODetailsWithTPRMNames(tmo_id=tmo_id)
             )
 
-            return result.column
+            return list(result.column)
 
     @staticmethod
-    def get_columns_with_types(tmo_id: int, columns: list[str]):
+    def _get_columns_with_types(
+        tmo_id: int, columns: list[str]
+    ) -> dict[str, str]:
         with grpc.insecure_channel(f"{INVENTORY_GRPC_URL}") as channel:
             stub = InformerStub(channel)
             result = stub.GetTPRMNameToTypeMapper(
                 RequestTPRMNameToType(tmo_id=tmo_id, columns=columns)
             )
 
-            return result.mapper
+            return dict(result.mapper)
+
+    @staticmethod
+    def _get_page(
+        stub: InformerStub,
+        tmo_id: int,
+        columns: list[str],
+        limit: int,
+        offset: int | None,
+    ) -> tuple[list, int | None]:
+        """Returns objects of page and number of objects of TMO if inventory
+        sends it"""
+        responses = list(
+            stub.GetObjWithParamsLimited(
+                RequestObjWithParamsLimited(
+                    tmo_id=tmo_id,
+                    tprm_names=columns,
+                    limit=limit,
+                    offset=offset,
+                    accept_encodings=ACCEPT_ENCODINGS,
+                )
+            )
+        )
+        total = next(
+            (item.total for item in responses if item.HasField("total")), None
+        )
+        return decode_objects(responses, loads_hex_pickle), total
 
     @staticmethod
     def get_data(
@@ -40,23 +114,68 @@ class MOInfoClient:
         offset: int | None = None,
     ):
         with grpc.insecure_channel(
-            f"{INVENTORY_GRPC_URL}",
-            options=[
-                ("grpc.max_send_message_length", 100 * 1024 * 1024),
-                ("grpc.max_receive_message_length", 100 * 1024 * 1024),
-            ],
+            f"{INVENTORY_GRPC_URL}", options=DATA_CHANNEL_OPTIONS
         ) as channel:
             stub = InformerStub(channel)
-            response = stub.GetObjWithParamsLimited(
-                RequestObjWithParamsLimited(
-                    tmo_id=tmo_id,
-                    tprm_names=columns,
-                    limit=limit,
-                    offset=offset,
-                )
+            objects, _ = MOInfoClient._get_page(
+                stub, tmo_id, columns, limit, offset
             )
-            result = []
-            for res in response:
-                result.append(pickle.loads(bytes.fromhex(res.data)))
+            return objects
+
+    @staticmethod
+    def iter_data_pages(
+        tmo_id: int,
+        columns: list[str],
+        page_size: int = INVENTORY_PAGE_SIZE,
+        prefetch: bool = INVENTORY_PAGE_PREFETCH,
+    ) -> Iterator[tuple[list, int | None]]:
+        """Yields all objects of TMO page by page until a short page is
+        returned, with number of objects of TMO. The number is None unless
+        inventory sends it or the first page is the last one. If prefetch is
+        True, the next page is requested in a background thread while the
+        current one is being consumed.
+
+        Pages are requested by offset, so inventory must return objects of
+        GetObjWithParamsLimited in a stable order (e.g. ORDER BY id),
+        otherwise objects may be skipped or repeated between pages. Objects
+        created or deleted during paging shift the following pages too"""
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+
+        with (
+            grpc.insecure_channel(
+                f"{INVENTORY_GRPC_URL}", options=DATA_CHANNEL_OPTIONS
+            ) as channel,
+            ThreadPoolExecutor(max_workers=1) as executor,
+        ):
+            stub = InformerStub(channel)
+
+            def get_page(page_offset: int):
+                return MOInfoClient._get_page(
+                    stub, tmo_id, columns, page_size, page_offset
+                )
 
-        return result
+            offset = 0
+            total = None
+            next_page = executor.submit(get_page, offset) if prefetch else None
+            try:
+                while True:
+                    if next_page is not None:
+                        page, page_total = next_page.result()
+                    else:
+                        page, page_total = get_page(offset)
+                    is_last = len(page) < page_size
+                    if page_total is not None:
+                        total = page_total
+                    elif offset == 0 and is_last:
+                        total = len(page)
+                    offset += len(page)
+                    if prefetch and not is_last:
+                        next_page = executor.submit(get_page, offset)
+                    if page:
+                        yield page, total
+                    if is_last:
+                        return
+            finally:
+                if next_page is not None:
+                    next_page.cancel()
@@ -0,0 +1,42 @@
+import pickle
+from typing import Callable, Iterable
+
+import msgpack
+
+from v3.routers.sources.utils.exceptions import InternalError
+
+MSGPACK_ENCODING = "msgpack"
+# batch encodings sent in accept_encodings, in order of preference
+ACCEPT_ENCODINGS = [MSGPACK_ENCODING]
+
+
+def loads_hex_pickle(data: str):
+    return pickle.loads(bytes.fromhex(data))
+
+
+def decode_objects(
+    responses: Iterable, loads_single: Callable[[str], dict]
+) -> list:
+    """Returns objects from stream of responses with data_batch, encoding and
+    data fields. Servers that do not support any of ACCEPT_ENCODINGS send
+    one object per response in data, it is decoded with loads_single"""
+    result = []
+    for response in responses:
+        if not response.HasField("data_batch"):
+            result.append(loads_single(response.data))
+            continue
+        if response.encoding != MSGPACK_ENCODING:
+            raise InternalError(
+                f"Unsupported objects batch encoding '{response.encoding}'"
+            )
+        result.extend(
+            msgpack.unpackb(response.data_batch, raw=False, timestamp=3)
+        )
+    return result
+
+
+def encode_msgpack_batch(objects: list[dict]) -> bytes:
+    """Counterpart of decode_objects used by servers and benchmarks.
+    Timezone-aware datetimes are packed as msgpack timestamps, values
+    msgpack can not pack (e.g. naive datetimes) are packed as strings"""
+    return msgpack.packb(objects, datetime=True, default=str)
@@ -0,0 +1,88 @@
+import copy
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+from cachetools import TTLCache
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+
+class TMOMetadataCache:
+    """Thread-safe TTL cache for TMO metadata loaded from inventory.
+
+    Keys are tuples starting with tmo_id. Concurrent misses of the same key
+    are de-duplicated: only the first caller runs the loader, the others
+    wait for its result. Callers always receive a copy of the cached value.
+    """
+
+    def __init__(self, ttl: int, maxsize: int = 1024):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, Future] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_load(self, key: tuple, loader: Callable[[], Any]):
+        with self._lock:
+            try:
+                value = self._cache[key]
+            except KeyError:
+                pass
+            else:
+                self._hits += 1
+                return copy.copy(value)
+
+            self._misses += 1
+            future = self._in_flight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not is_owner:
+            return copy.copy(future.result())
+
+        try:
+            value = loader()
+        except BaseException as exc:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            # value loaded before invalidation is still returned to waiters
+            # but is not stored if key was invalidated meanwhile
+            if self._in_flight.pop(key, None) is future:
+                self._cache[key] = value
+        future.set_result(value)
+        return copy.copy(value)
+
+    def invalidate(self, tmo_id: int | None = None):
+        """Drops cached metadata of tmo_id or of all TMOs if tmo_id is None"""
+        with self._lock:
+            if tmo_id is None:
+                self._cache.clear()
+                self._in_flight.clear()
+                return
+            for key in [key for key in self._cache if key[0] == tmo_id]:
+                self._cache.pop(key, None)
+            for key in [key for key in self._in_flight if key[0] == tmo_id]:
+                del self._in_flight[key]
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            self._cache.expire()
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=self._cache.currsize,
+            )
@@ -0,0 +1,19 @@
+import asyncio
+import itertools
+from typing import AsyncIterator, Iterable
+
+
+async def iterate_in_thread(
+    iterator: Iterable, chunk_size: int
+) -> AsyncIterator:
+    """Yields items of blocking iterator, pulling them in chunks from
+    worker thread so the event loop is not blocked by source reading"""
+    iterator = iter(iterator)
+    while True:
+        chunk = await asyncio.to_thread(
+            list, itertools.islice(iterator, chunk_size)
+        )
+        if not chunk:
+            break
+        for item in chunk:
+            yield item
@@ -1,5 +1,5 @@
 import grpc.aio
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from fastapi.params import Depends
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -137,14 +137,19 @@ async def delete_group(
     group_id = group_from_db.id
     await session.delete(group_from_db)
     await session.commit()
-    delete_group_in_dataview_manager(group_id=group_id)
+    await delete_group_in_dataview_manager(group_id=group_id)
     return {"msg": "Group deleted successfully"}
 
 
 @router.get("/{group_id}/load_data", status_code=200)
 async def load_group_data(
-    group_id: int, session: AsyncSession = Depends(get_session)
+    group_id: int,
+    force: bool = Query(default=False),
+    session: AsyncSession = Depends(get_session),
 ):
+    """Loads data of group sources into MS DATAVIEW MANAGER. Sources which
+    data was not modified since the last load are skipped, unless force is
+    set"""
     stmt = select(SourceGroup).where(SourceGroup.id == group_id)
     group_from_db = await session.execute(stmt)
     group_from_db = group_from_db.scalars().first()
@@ -158,11 +163,15 @@ async def load_group_data(
     group_sources = await session.execute(stmt)
     group_sources = group_sources.scalars().all()
 
+    not_modified = []
     try:
-        crete_source_group(group_from_db.id, group_from_db.name)
+        await crete_source_group(group_from_db.id, group_from_db.name)
 
         for source in group_sources:
-            load_data_process(group_from_db, source)
+            if not await load_data_process(
+                group_from_db, source, session, force
+            ):
+                not_modified.append(source.id)
     except grpc.RpcError as exc:
         if exc.code() == grpc.StatusCode.UNAVAILABLE:
             raise HTTPException(
@@ -170,7 +179,7 @@ async def load_group_data(
                 detail="Service unavailable! Try again later...",
             )
 
-    return {"msg": "Data uploaded successfully"}
+    return {"msg": "Data uploaded successfully", "not_modified": not_modified}
 
 
 @router.get("/{group_id}/sources", status_code=200)
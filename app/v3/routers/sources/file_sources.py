@@ -43,7 +43,10 @@ from v3.routers.sources.utils.exceptions import (
     ValidationError,
     SourceConnectionError,
 )
-from v3.routers.sources.utils.file_utils import validate_file_extension
+from v3.routers.sources.utils.file_utils import (
+    parse_filters_form,
+    validate_file_extension,
+)
 from v3.routers.sources.utils.utils import (
     check_group_exists,
     check_source_name_in_group_exists,
@@ -250,6 +253,10 @@ async def create_file_manual_source(
     name: str = Form(),
     group_id: int = Form(),
     file_columns: Optional[List] = None,
+    filters: Optional[str] = Form(
+        default=None, description="JSON list of row filters"
+    ),
+    limit: Optional[int] = Form(default=None, ge=1),
     file: UploadFile = File(),
     client: Minio = Depends(minio_client),
     session: AsyncSession = Depends(get_session),
@@ -267,6 +274,7 @@ async def create_file_manual_source(
                 )
 
     validate_file_extension(file.filename)
+    source_filters = parse_filters_form(filters)
 
     source = Source(
         name=name,
@@ -276,6 +284,8 @@ async def create_file_manual_source(
             "import_type": FileImportType.MANUAL.value,
             "file_name": file.filename,
             "source_data_columns": file_columns,
+            "filters": source_filters,
+            "limit": limit,
         },
     )
     session.add(source)
@@ -308,6 +318,10 @@ async def full_update_file_manual_source(
     source_id: int = Path(),
     group_id: int = Form(),
     file_columns: Optional[List] = None,
+    filters: Optional[str] = Form(
+        default=None, description="JSON list of row filters"
+    ),
+    limit: Optional[int] = Form(default=None, ge=1),
     file: UploadFile = File(),
     client: Minio = Depends(minio_client),
     session: AsyncSession = Depends(get_session),
@@ -337,6 +351,7 @@ async def full_update_file_manual_source(
         )
 
     validate_file_extension(file.filename)
+    source_filters = parse_filters_form(filters)
 
     source_to_update = await check_source_exists(session, source_id)
 
@@ -360,6 +375,8 @@ async def full_update_file_manual_source(
         "import_type": FileImportType.MANUAL.value,
         "filename": file.filename,
         "source_data_columns": file_columns,
+        "filters": source_filters,
+        "limit": limit,
     }
 
     session.add(source_to_update)
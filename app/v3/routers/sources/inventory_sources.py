@@ -71,3 +71,24 @@ async def read_tmo_fields(
         raise HTTPException(status_code=status_code, detail=exc.details())
 
     return list(res)
+
+
+@router.get("/helpers/cache", tags=["Sources: Inventory-helpers"])
+async def read_tmo_metadata_cache_stats():
+    """Read hit/miss counters and size of tmo columns cache of the worker
+    process that handles the request. Every uvicorn worker has its own cache
+    and counters"""
+    return MOInfoClient.get_metadata_cache_stats()
+
+
+@router.delete(
+    "/helpers/cache", status_code=204, tags=["Sources: Inventory-helpers"]
+)
+async def invalidate_tmo_metadata_cache(
+    tmo_id: Annotated[int | None, Query(gt=0)] = None,
+):
+    """Drop cached columns of tmo_id, or of all tmo if tmo_id is not set, in
+    the worker process that handles the request only. Other uvicorn workers
+    keep their entries until TMO_METADATA_CACHE_TTL expires, so this is not
+    a global cache reset"""
+    MOInfoClient.invalidate_metadata(tmo_id)
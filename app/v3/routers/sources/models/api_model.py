@@ -10,6 +10,7 @@ from v3.routers.sources.models.general_model import (
     SourceModelBaseInfo,
     SourceModelBaseCreate,
     SourceConDataBaseModel,
+    SourceFilteringModel,
 )
 
 
@@ -82,6 +83,84 @@ def validate_restapi_auth_data_depending_on_auth_type(auth_type, auth_data):
             raise NotImplementedError(f"{auth_type} not implemented!.")
 
 
+class APIPaginationType(Enum):
+    OFFSET = "offset"
+    PAGE = "page"
+    CURSOR = "cursor"
+    LINK_HEADER = "link_header"
+
+
+class APIPaginationModel(BaseModel):
+    """How pages of API response are requested. Names of query parameters
+    are set by *_param fields, page size is sent in size_param"""
+
+    type: APIPaginationType = Field(...)
+    page_size: Optional[int] = Field(default=100, ge=1)
+    size_param: Optional[str] = Field(default="limit", min_length=1)
+    # offset: offset of the first record of page
+    offset_param: str = Field(default="offset", min_length=1)
+    # page: number of page, starting from first_page
+    page_param: str = Field(default="page", min_length=1)
+    first_page: int = Field(default=1, ge=0)
+    # cursor: token of the next page taken from response by dot-separated
+    # path, e.g. 'meta.next_cursor'
+    cursor_param: str = Field(default="cursor", min_length=1)
+    cursor_path: Optional[str] = Field(default=None, min_length=1)
+    # stop after max_pages pages, all pages are requested if not set
+    max_pages: Optional[int] = Field(default=None, ge=1)
+    # offset and page: dot-separated path to total number of records
+    # (total_path) or pages (pages_path) in the first response. If it is
+    # known, the rest of pages are requested concurrently
+    total_path: Optional[str] = Field(default=None, min_length=1)
+    pages_path: Optional[str] = Field(default=None, min_length=1)
+    # pages requested at the same time, API_SOURCE_CONCURRENCY if not set
+    concurrency: Optional[int] = Field(default=None, ge=1, le=32)
+    # max requests per second, not limited if not set
+    rate_limit: Optional[float] = Field(default=None, gt=0)
+
+    class Config:
+        use_enum_values = True
+
+    @validator("cursor_path", always=True)
+    def check_cursor_path(cls, value, values):
+        if (
+            value is None
+            and values.get("type") == APIPaginationType.CURSOR.value
+        ):
+            raise ValueError("cursor_path is required for cursor pagination")
+        return value
+
+    @validator("pages_path", always=True)
+    def check_pages_path(cls, value, values):
+        if value is not None and values.get("total_path") is not None:
+            raise ValueError("only one of total_path and pages_path can be set")
+        if (value is not None or values.get("total_path") is not None) and (
+            values.get("type")
+            not in (
+                APIPaginationType.OFFSET.value,
+                APIPaginationType.PAGE.value,
+            )
+        ):
+            raise ValueError(
+                "total_path and pages_path can be used only with offset and "
+                "page pagination"
+            )
+        return value
+
+
+class APIFlattenModel(BaseModel):
+    """How nested objects of records are expanded into columns"""
+
+    # nested objects become columns named by path joined by separator, e.g.
+    # 'address.city', objects deeper than max_level are kept as JSON
+    separator: str = Field(default=".", min_length=1)
+    max_level: Optional[int] = Field(default=None, ge=0)
+    # arrays of these columns are exploded into one row per item, the rest
+    # of arrays are joined by array_separator
+    explode: Optional[list[str]] = None
+    array_separator: str = Field(default=",")
+
+
 class APIConnectionBaseModel(BaseModel):
     end_point: str = Field(min_length=1)
     method: Optional[ApiMethods] = Field(default=ApiMethods.GET.value)
@@ -89,12 +168,39 @@ class APIConnectionBaseModel(BaseModel):
     body_params: Optional[dict]
     auth_type: APIAuthType = Field(...)
     auth_data: dict = Field(...)
+    # dot-separated path to list of records in JSON response, e.g.
+    # 'data.items', the whole response if not set
+    obj_name_from_resp: Optional[str] = Field(default=None, min_length=1)
+    pagination: Optional[APIPaginationModel] = None
+    # if set, JSON response is parsed as it is received and records are read
+    # by chunks of stream_chunk_size rows, so large responses are not kept
+    # in memory. Only for sources without pagination
+    stream_chunk_size: Optional[int] = Field(default=None, ge=1)
+    # flattening of nested objects of records, records are loaded as they
+    # are if not set
+    flatten: Optional[APIFlattenModel] = None
 
     class Config:
         use_enum_values = True
 
+    @validator("stream_chunk_size")
+    def check_stream_chunk_size(cls, value, values):
+        if value is not None and values.get("pagination") is not None:
+            raise ValueError(
+                "stream_chunk_size can be used only without pagination"
+            )
+        return value
+
+
+class APIConnectionModel(
+    SourceConDataBaseModel, SourceFilteringModel, APIConnectionBaseModel
+):
+    # names of query parameters the API filters and limits response by:
+    # eq and in filters of columns in filter_params and limit are sent as
+    # query parameters, the rest is applied to the response
+    filter_params: Optional[dict[str, str]]
+    limit_param: Optional[str] = Field(default=None, min_length=1)
 
-class APIConnectionModel(SourceConDataBaseModel, APIConnectionBaseModel):
     class Config:
         use_enum_values = True
 
@@ -9,6 +9,7 @@ from v3.routers.sources.models.general_model import (
     SourceModelBaseCreate,
     SourceType,
     SourceConDataBaseModel,
+    SourceFilteringModel,
 )
 
 
@@ -38,10 +39,27 @@ class DBConnectionModelCheckColumns(DBConnectionModel):
     db_table: str = Field()
 
 
-class DBConnectionModelCreate(SourceConDataBaseModel, DBConnectionModel):
+class DBPartitioningModel(BaseModel):
+    """Read table in parallel by ranges of numeric or date column values.
+    Primary key is used if column is not set"""
+
+    column: str | None = Field(default=None, min_length=1)
+    partitions: int = Field(default=4, ge=2, le=32)
+    ordered: bool = True
+
+
+class DBConnectionModelCreate(
+    SourceConDataBaseModel, SourceFilteringModel, DBConnectionModel
+):
     db_table: str = Field()
     date_column: str | None = Field(default=None, min_length=1)
     offset: int | None = Field(default=None, ge=0)
+    partitioning: DBPartitioningModel | None = None
+    # connections kept open for this source, DB_SOURCE_POOL_SIZE if not set
+    pool_size: int | None = Field(default=None, ge=1, le=32)
+    # monotonic column (timestamp or id), only rows with value greater than
+    # the one loaded last time are extracted
+    watermark_column: str | None = Field(default=None, min_length=1)
 
     @validator("offset")
     def check_offset(cls, value, values):
@@ -52,6 +70,26 @@ class DBConnectionModelCreate(SourceConDataBaseModel, DBConnectionModel):
 
         return value
 
+    @validator("watermark_column")
+    def check_watermark_column(cls, value, values):
+        if value is not None and values.get("date_column"):
+            raise ValueError(
+                "watermark_column can not be used together with date_column"
+            )
+        if value is not None and values.get("limit"):
+            # rows cut off by limit would never be extracted later
+            raise ValueError(
+                "watermark_column can not be used together with limit"
+            )
+        if value is not None and values.get("delta_load"):
+            # delta snapshot of incremental load would hold only new rows,
+            # so all other rows would be deleted
+            raise ValueError(
+                "watermark_column can not be used together with delta_load"
+            )
+
+        return value
+
 
 class DBModelBase(BaseModel):
     con_type: Optional[str] = Field(
@@ -9,6 +9,7 @@ from v3.routers.sources.models.general_model import (
     SourceModelBaseCreate,
     SourceType,
     SourceConDataBaseModel,
+    SourceFilteringModel,
 )
 
 
@@ -83,7 +84,7 @@ class SFTPConnectionModelCheckPath(BaseModel):
     file: RemoteFileCheck
 
 
-class SFTPConnectionModel(SourceConDataBaseModel, BaseModel):
+class SFTPConnectionModel(SourceConDataBaseModel, SourceFilteringModel):
     import_type: Optional[str] = Field(
         default=FileImportType.SFTP.value,
         regex=rf"^{FileImportType.SFTP.value}$",
@@ -107,7 +108,7 @@ class SFTPModelCreate(SFTPModel, SourceModelBaseCreate):
     pass
 
 
-class ManualConnectionModelInfo(SourceConDataBaseModel, BaseModel):
+class ManualConnectionModelInfo(SourceConDataBaseModel, SourceFilteringModel):
     import_type: Optional[str] = Field(
         default=FileImportType.MANUAL.value,
         regex=rf"^{FileImportType.MANUAL.value}$",
@@ -119,7 +120,7 @@ class ManualModelInfo(FileBaseModel, SourceModelBaseInfo):
     con_data: ManualConnectionModelInfo = Field(...)
 
 
-class FTPConnectionModel(SourceConDataBaseModel, BaseModel):
+class FTPConnectionModel(SourceConDataBaseModel, SourceFilteringModel):
     import_type: Optional[str] = Field(
         default=FileImportType.FTP.value, regex=rf"^{FileImportType.FTP.value}$"
     )
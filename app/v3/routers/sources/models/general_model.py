@@ -1,7 +1,15 @@
 from enum import Enum
 from typing import Optional, Union
 
-from pydantic import BaseModel, Field, validator
+from pydantic import (
+    BaseModel,
+    Field,
+    StrictBool,
+    StrictFloat,
+    StrictInt,
+    StrictStr,
+    validator,
+)
 
 
 class DBLocalHost(Enum):
@@ -15,8 +23,64 @@ class SourceType(Enum):
     INVENTORY = "Inventory"
 
 
+class DeltaLoadModel(BaseModel):
+    """Send only inserted, updated and deleted rows compared to the previous
+    load. Rows are matched by values of key_columns"""
+
+    key_columns: list[str] = Field(min_items=1)
+
+
+class FilterOperator(Enum):
+    EQ = "eq"
+    NE = "ne"
+    GT = "gt"
+    GE = "ge"
+    LT = "lt"
+    LE = "le"
+    IN = "in"
+
+
+FilterValue = StrictBool | StrictInt | StrictFloat | StrictStr
+
+
+class SourceFilterModel(BaseModel):
+    """Row filter 'column operator value'. eq/ne with null value select rows
+    where column is/is not null, in requires list of values"""
+
+    column: str = Field(min_length=1)
+    operator: FilterOperator = Field(default=FilterOperator.EQ.value)
+    value: list[FilterValue] | FilterValue | None = None
+
+    class Config:
+        use_enum_values = True
+
+    @validator("value", always=True)
+    def check_value_matches_operator(cls, value, values):
+        operator = values.get("operator")
+        if operator == FilterOperator.IN.value:
+            if not isinstance(value, list) or not value:
+                raise ValueError("value of 'in' filter must be non-empty list")
+        elif isinstance(value, list):
+            raise ValueError(f"value of '{operator}' filter can not be list")
+        elif value is None and operator not in (
+            FilterOperator.EQ.value,
+            FilterOperator.NE.value,
+        ):
+            raise ValueError(f"value of '{operator}' filter can not be null")
+
+        return value
+
+
+class SourceFilteringModel(BaseModel):
+    """Rows filters and limit, pushed down to source as far as it allows"""
+
+    filters: list[SourceFilterModel] | None = None
+    limit: int | None = Field(default=None, ge=1)
+
+
 class SourceConDataBaseModel(BaseModel):
     source_data_columns: Optional[Union[list, None]] = None
+    delta_load: Optional[DeltaLoadModel] = None
 
     @validator("source_data_columns")
     def check_source_data_columns_not_empty(cls, source_data_columns, values):
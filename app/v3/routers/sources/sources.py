@@ -1,12 +1,17 @@
-from fastapi import APIRouter, HTTPException, Depends
+import asyncio
+
+from cachetools import TTLCache
+from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy import select
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
+from v3.config import SOURCE_PREVIEW_CACHE_TTL, SOURCE_PREVIEW_MAX_ROWS
 from v3.database.database import get_session
 from v3.database.schemas import SourceGroup
 from v3.file_server.minio_client_manager import minio_client
+from v3.grpc_config.delta_load import delete_row_hash_snapshot
 from v3.grpc_config.dataview_manager_utils import (
     load_data_process,
     crete_source_group,
@@ -19,12 +24,21 @@ from v3.routers.sources.sources_managers.file_manager import (
 )
 from v3.routers.sources.sources_managers.utils import get_source_manager
 
+from v3.routers.sources.utils.exceptions import (
+    CustomException,
+    ResourceNotFoundError,
+)
 from v3.routers.sources.utils.utils import check_source_exists
 from v3.routers.sources.models.general_model import SourceType
+from v3.utils.encryption_utils import get_data_digest
 
 
 router = APIRouter(prefix="/sources", tags=["Sources"])
 
+# previews by (source id, limit, digest of encrypted con_data), con_data is
+# encrypted again on every update, so updated source is never served stale
+PREVIEW_CACHE = TTLCache(maxsize=256, ttl=SOURCE_PREVIEW_CACHE_TTL)
+
 
 @router.get("/con_types", status_code=200)
 async def read_all_con_types():
@@ -59,9 +73,12 @@ async def delete_source(
             )
             source_manager.delete_file_from_minio()
     source_id = source.id
+    has_delta_load = bool(source.decoded_data()["con_data"].get("delta_load"))
     await session.delete(source)
     await session.commit()
-    delete_source_in_dataview_manager(source_id=source_id)
+    await delete_source_in_dataview_manager(source_id=source_id)
+    if has_delta_load:
+        await asyncio.to_thread(delete_row_hash_snapshot, source_id)
     return {"msg": "Source deleted successfully"}
 
 
@@ -83,14 +100,49 @@ async def check_connection(
 
 @router.get("/source/{source_id}/load_data", status_code=200)
 async def load_source_data(
-    source_id: int, session: AsyncSession = Depends(get_session)
+    source_id: int,
+    force: bool = Query(default=False),
+    session: AsyncSession = Depends(get_session),
 ):
+    """Loads source data into MS DATAVIEW MANAGER. The load is skipped if
+    source data was not modified since the last load, unless force is set"""
     source = await check_source_exists(session, source_id)
 
     stmt = select(SourceGroup).where(SourceGroup.id == source.group_id)
     res = await session.execute(stmt)
     source_group = res.scalars().first()
-    crete_source_group(source_group.id, source_group.name)
-    load_data_process(source_group, source)
+    await crete_source_group(source_group.id, source_group.name)
+    if not await load_data_process(source_group, source, session, force):
+        return {"ok": "Data was not modified since the last load"}
 
     return {"ok": "Data uploaded successfully"}
+
+
+@router.get("/source/{source_id}/preview", status_code=200)
+async def preview_source_data(
+    source_id: int,
+    limit: int = Query(default=10, ge=1, le=SOURCE_PREVIEW_MAX_ROWS),
+    session: AsyncSession = Depends(get_session),
+):
+    """Returns first limit rows of source data. Only the part of source
+    needed for these rows is read"""
+    source = await check_source_exists(session, source_id)
+    key = (
+        source.id,
+        limit,
+        get_data_digest(source.con_data),
+    )
+    rows = PREVIEW_CACHE.get(key)
+    if rows is not None:
+        return rows
+
+    source_manager = get_source_manager(source)
+    try:
+        rows = await asyncio.to_thread(source_manager.preview, limit)
+    except ResourceNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    except CustomException as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    PREVIEW_CACHE[key] = rows
+    return rows
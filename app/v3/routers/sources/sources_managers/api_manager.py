@@ -1,13 +1,26 @@
+import contextlib
 import io
+import itertools
+from typing import Iterator
 
 import pandas as pd
 import requests
 from oauthlib.oauth2 import LegacyApplicationClient
-from requests.auth import HTTPBasicAuth, HTTPDigestAuth
+from requests import PreparedRequest
+from requests.auth import AuthBase, HTTPBasicAuth, HTTPDigestAuth
+
+from v3.config import (
+    API_SOURCE_CONCURRENCY,
+    API_SOURCE_SESSION_CACHE_SIZE,
+    API_SOURCE_TIMEOUT,
+)
 
 from v3.grpc_config.dataflow_to_dataview.proto.data_carrier_pb2 import (
     DataRequest,
 )
+from v3.routers.sources.sources_managers.api_manager_utils.async_fetch import (
+    HTTP_CLIENT,
+)
 from v3.routers.sources.sources_managers.api_manager_utils.custom_authentications import (
     HTTPTokenAuth,
     HTTPAPIkeyAuth,
@@ -16,12 +29,39 @@ from v3.routers.sources.sources_managers.api_manager_utils.custom_authentication
 from v3.routers.sources.sources_managers.file_manager_utils.utils import (
     get_csv_delimiter_by_one_line,
 )
+from v3.routers.sources.sources_managers.filters import filter_dataframe
 from v3.routers.sources.sources_managers.general import ABCSourceManager
+from v3.routers.sources.sources_managers.preview import (
+    dataframe_to_records,
+    get_preview_limit,
+    to_preview_rows,
+)
 from requests_oauthlib import OAuth2Session
+from v3.routers.sources.models.general_model import FilterOperator
 from v3.routers.sources.models.api_model import (
     APIAuthType,
     validate_restapi_auth_data_depending_on_auth_type,
 )
+from v3.routers.sources.sources_managers.api_manager_utils.flatten import (
+    flatten_records,
+)
+from v3.routers.sources.sources_managers.api_manager_utils.json_stream import (
+    STREAM_READ_SIZE,
+    iter_json_chunks,
+)
+from v3.routers.sources.sources_managers.api_manager_utils.pagination import (
+    PageRequest,
+    get_by_path,
+    get_paginator,
+)
+from v3.routers.sources.sources_managers.api_manager_utils.response_memo import (
+    ResponseMemo,
+)
+from v3.routers.sources.sources_managers.api_manager_utils.sessions import (
+    OAuthTokenCache,
+    SessionRegistry,
+    get_auth_key,
+)
 from v3.routers.sources.sources_managers.api_manager_utils.utils import (
     RESTAPIResponseTypes,
     get_file_reader_by_ext,
@@ -34,6 +74,21 @@ from v3.routers.sources.utils.exceptions import (
     SourceConnectionError,
 )
 
+# auth types which can be applied to a request without a session (digest
+# auth needs server challenge), pages of these sources may be requested
+# concurrently
+CONCURRENT_AUTH_TYPES = (
+    APIAuthType.NOAUTH.value,
+    APIAuthType.APIKEY.value,
+    APIAuthType.MULTIAPIKEY.value,
+    APIAuthType.BASIC.value,
+    APIAuthType.TOKEN.value,
+    APIAuthType.OPENID.value,
+)
+
+SESSIONS = SessionRegistry(maxsize=API_SOURCE_SESSION_CACHE_SIZE)
+TOKENS = OAuthTokenCache(maxsize=API_SOURCE_SESSION_CACHE_SIZE)
+
 
 class APISourceManager(ABCSourceManager):
     def __init__(self, con_data: dict):
@@ -48,6 +103,19 @@ class APISourceManager(ABCSourceManager):
             "obj_name_from_resp", None
         )
         self.source_data_columns = con_data.get("source_data_columns")
+        self.filters = con_data.get("filters")
+        self.limit = con_data.get("limit")
+        self.filter_params = con_data.get("filter_params") or {}
+        self.limit_param = con_data.get("limit_param")
+        self.pagination = con_data.get("pagination")
+        # pages are not streamed, their bodies are needed by paginator
+        self.stream_chunk_size = (
+            None if self.pagination else con_data.get("stream_chunk_size")
+        )
+        self.flatten = con_data.get("flatten")
+        # manager is created for one operation, so responses are memoized
+        # for the operation
+        self._memo = ResponseMemo()
 
     def get_columns_with_types(self) -> dict[str, str]:
         raise NotImplementedError
@@ -149,108 +217,226 @@ class APISourceManager(ABCSourceManager):
                 "body_params must be None or be instance of dict"
             )
 
-    def __get_connection_by_auth_type(self):
+    def __get_pushdown_params(self, limit: int | None) -> dict:
+        """Returns URL query parameters for filters and limit supported by
+        API, see filter_params and limit_param"""
+        params = dict()
+        for source_filter in self.filters or []:
+            param = self.filter_params.get(source_filter["column"])
+            if param is None or source_filter.get("value") is None:
+                continue
+            if source_filter["operator"] in (
+                FilterOperator.EQ.value,
+                FilterOperator.IN.value,
+            ):
+                params[param] = source_filter["value"]
+        if self.limit_param and limit is not None:
+            params[self.limit_param] = limit
+        return params
+
+    def __get_request_options(
+        self, limit: int | None = None, page: PageRequest | None = None
+    ) -> tuple[str, dict]:
+        """Returns url and keyword arguments of request of page"""
+        if page is None:
+            page = PageRequest(url=self.end_point)
         config_data = dict()
         if self.query_params:
             config_data["json"] = self.query_params
         if self.body_params:
             config_data["data"] = self.body_params
+        if page.params is not None:
+            params = {**self.__get_pushdown_params(limit), **page.params}
+            if params:
+                config_data["params"] = params
+        return page.url, config_data
+
+    def __get_auth(self) -> AuthBase | None:
+        """Returns requests auth of static (not token based) auth types"""
+        match self.auth_type:
+            case APIAuthType.APIKEY.value:
+                return HTTPAPIkeyAuth(
+                    key_name=self.auth_data["key_name"],
+                    key_value=self.auth_data["key_value"],
+                )
+            case APIAuthType.MULTIAPIKEY.value:
+                return HTTPMultiAPIkeysAuth(api_keys=self.auth_data["api_keys"])
+            case APIAuthType.BASIC.value:
+                return HTTPBasicAuth(
+                    username=self.auth_data["username"],
+                    password=self.auth_data["password"],
+                )
+            case APIAuthType.DIGEST.value:
+                return HTTPDigestAuth(
+                    username=self.auth_data["username"],
+                    password=self.auth_data["password"],
+                )
+            case APIAuthType.TOKEN.value:
+                return HTTPTokenAuth(token=self.auth_data["token"])
+        return None
+
+    def __get_auth_key(self) -> str:
+        return get_auth_key(self.auth_type, self.auth_data)
+
+    def __get_session(self) -> requests.Session:
+        """Returns pooled session of source, created once per auth config"""
+
+        def create_session() -> requests.Session:
+            session = requests.Session()
+            session.auth = self.__get_auth()
+            return session
+
+        return SESSIONS.get(self.__get_auth_key(), create_session)
+
+    def __get_oauth_client(self) -> OAuth2Session:
+        data_for_session = dict()
+        client_id = self.auth_data.get("client_id")
+        if client_id:
+            data_for_session["client_id"] = client_id
+
+        scope = self.auth_data.get("scope")
+        if scope:
+            data_for_session["scope"] = scope
+
+        return OAuth2Session(client=LegacyApplicationClient(**data_for_session))
+
+    def __get_client_credentials(self) -> dict:
+        data = dict()
+        for key in ("client_id", "client_secret"):
+            if self.auth_data.get(key):
+                data[key] = self.auth_data[key]
+        return data
+
+    def __fetch_oauth_token(self) -> dict:
+        data_for_get_token = self.__get_client_credentials()
+        for key in ("username", "password"):
+            if self.auth_data.get(key):
+                data_for_get_token[key] = self.auth_data[key]
+        data_for_get_token["token_url"] = self.auth_data.get("token_url")
+        return self.__get_oauth_client().fetch_token(**data_for_get_token)
+
+    def __refresh_oauth_token(self, token: dict) -> dict:
+        token_url = self.auth_data.get("refresh_token_url") or (
+            self.auth_data.get("token_url")
+        )
+        return self.__get_oauth_client().refresh_token(
+            token_url,
+            refresh_token=token["refresh_token"],
+            **self.__get_client_credentials(),
+        )
 
-        def get_resp_for_no_auth():
-            request = getattr(requests, self.method)
-            return request(self.end_point, **config_data)
-
-        def get_resp_for_api_key_auth():
-            request = getattr(requests, self.method)
-            auth = HTTPAPIkeyAuth(
-                key_name=self.auth_data["key_name"],
-                key_value=self.auth_data["key_value"],
-            )
-            return request(self.end_point, auth=auth, **config_data)
-
-        def get_resp_for_multi_api_key_auth():
-            request = getattr(requests, self.method)
-            auth = HTTPMultiAPIkeysAuth(api_keys=self.auth_data["api_keys"])
-            return request(self.end_point, auth=auth, **config_data)
-
-        def get_resp_for_basic_auth():
-            request = getattr(requests, self.method)
-            auth = HTTPBasicAuth(
-                username=self.auth_data["username"],
-                password=self.auth_data["password"],
-            )
-            return request(self.end_point, auth=auth, **config_data)
-
-        def get_resp_for_digest_auth():
-            request = getattr(requests, self.method)
-            auth = HTTPDigestAuth(
-                username=self.auth_data["username"],
-                password=self.auth_data["password"],
+    def __get_request_auth(self) -> AuthBase | None:
+        """Returns auth of one request, bearer token of OpenID sources is
+        taken from token cache. Auth of other sources is set in session"""
+        if self.auth_type != APIAuthType.OPENID.value:
+            return None
+        token = TOKENS.get(
+            self.__get_auth_key(),
+            fetch=self.__fetch_oauth_token,
+            refresh=self.__refresh_oauth_token,
+        )
+        return HTTPTokenAuth(token=token["access_token"])
+
+    def __prepare_request(
+        self, limit: int | None, page: PageRequest
+    ) -> PreparedRequest:
+        """Returns request of page with auth applied, for auth types in
+        CONCURRENT_AUTH_TYPES only"""
+        url, config_data = self.__get_request_options(limit, page)
+        auth = self.__get_request_auth() or self.__get_auth()
+        return requests.Request(
+            self.method.upper(), url, auth=auth, **config_data
+        ).prepare()
+
+    def __get_response(
+        self,
+        limit: int | None = None,
+        page: PageRequest | None = None,
+        stream: bool = False,
+        headers: dict | None = None,
+    ):
+        """Returns response of source requested by pooled session. The same
+        request is sent once per manager. If limit is set, it is sent in
+        limit_param instead of self.limit. If page is set, the page is
+        requested instead of end_point. If stream is set, the body is not
+        read and the response is not memoized, so it must be closed.
+        headers (e.g. of a conditional request) are not a part of memo key"""
+        url, config_data = self.__get_request_options(
+            self.limit if limit is None else limit, page
+        )
+        session = self.__get_session()
+
+        def send():
+            return session.request(
+                self.method,
+                url,
+                auth=self.__get_request_auth(),
+                timeout=API_SOURCE_TIMEOUT,
+                stream=stream,
+                headers=headers,
+                **config_data,
             )
-            return request(self.end_point, auth=auth, **config_data)
-
-        def get_resp_for_token_auth():
-            request = getattr(requests, self.method)
-            auth = HTTPTokenAuth(token=self.auth_data["token"])
-            return request(self.end_point, auth=auth, **config_data)
-
-        def get_resp_for_openid_auth():
-            data_for_session = dict()
-            data_for_get_token = dict()
-
-            client_id = self.auth_data.get("client_id")
-            if client_id:
-                data_for_session["client_id"] = client_id
-                data_for_get_token["client_id"] = client_id
-
-            scope = self.auth_data.get("scope")
-            if scope:
-                data_for_session["scope"] = scope
-
-            client_secret = self.auth_data.get("client_secret")
-            if client_secret:
-                data_for_get_token["client_secret"] = client_secret
 
-            username = self.auth_data.get("username")
-            if username:
-                data_for_get_token["username"] = username
-
-            password = self.auth_data.get("password")
-            if password:
-                data_for_get_token["password"] = password
-
-            data_for_get_token["token_url"] = self.auth_data.get("token_url")
-
-            oauth = OAuth2Session(
-                client=LegacyApplicationClient(**data_for_session)
+        def send_with_valid_token():
+            response = send()
+            if (
+                response.status_code == 401
+                and self.auth_type == APIAuthType.OPENID.value
+            ):
+                # cached token may be revoked before it expires
+                TOKENS.invalidate(self.__get_auth_key())
+                if stream:
+                    response.close()
+                response = send()
+            return response
+
+        if stream:
+            return send_with_valid_token()
+        key = ResponseMemo.get_key(self.method, url, config_data)
+        return self._memo.get_response(key, send_with_valid_token)
+
+    def get_data_validators(self, previous: dict | None) -> dict | None:
+        """Returns ETag and Last-Modified of response. previous validators
+        are sent in conditional request, so unchanged data is not sent again
+        by API, and modified response is reused by the load. Paginated
+        sources have no validators, since pages may change independently"""
+        if self.pagination:
+            return None
+
+        headers = dict()
+        if previous:
+            if previous.get("etag"):
+                headers["If-None-Match"] = previous["etag"]
+            if previous.get("last_modified"):
+                headers["If-Modified-Since"] = previous["last_modified"]
+
+        if self.stream_chunk_size:
+            with self.__get_response(stream=True, headers=headers) as response:
+                pass
+        else:
+            response = self.__get_response(headers=headers)
+        if response.status_code == 304:
+            return previous
+        self.__raise_for_status(response)
+
+        validators = {
+            name: response.headers[header]
+            for name, header in (
+                ("etag", "ETag"),
+                ("last_modified", "Last-Modified"),
             )
-            oauth.fetch_token(**data_for_get_token)
-            return oauth.get(self.end_point, **config_data)
-
-        data = {
-            APIAuthType.NOAUTH.value: get_resp_for_no_auth,
-            APIAuthType.APIKEY.value: get_resp_for_api_key_auth,
-            APIAuthType.MULTIAPIKEY.value: get_resp_for_multi_api_key_auth,
-            APIAuthType.BASIC.value: get_resp_for_basic_auth,
-            APIAuthType.DIGEST.value: get_resp_for_digest_auth,
-            APIAuthType.TOKEN.value: get_resp_for_token_auth,
-            APIAuthType.OPENID.value: get_resp_for_openid_auth,
+            if response.headers.get(header)
         }
-        return data.get(self.auth_type, None)
-
-    def __get_response(self):
-        """Return response instance if there are connection function otherwise raises error."""
-        connection_func = self.__get_connection_by_auth_type()
-        res = connection_func()
-        if res is None:
-            raise NotImplementedError(
-                f"No connection function for con_type: {self.auth_type}"
-            )
-        return res
+        return validators or None
 
     def check_connection(self):
         """Returns True if connection is successful or raises error."""
-        res = self.__get_response()
+        if self.stream_chunk_size:
+            # body of large response is not needed to check connection
+            with self.__get_response(stream=True) as res:
+                pass
+        else:
+            res = self.__get_response()
         if res.status_code == 401:
             raise SourceConnectionError("Authentication failed!")
 
@@ -259,19 +445,29 @@ class APISourceManager(ABCSourceManager):
                 f"Service responded with error ({res.status_code})!"
             )
 
+    def __get_records(self, response: Response):
+        """Returns records of JSON response found by obj_name_from_resp path,
+        empty list if there is no such path in response"""
+        records = get_by_path(
+            self._memo.get_json(response), self.obj_name_to_load_from_response
+        )
+        return [] if records is None else records
+
     def get_response_type(self, res_data: Response = None):
         if res_data is None:
             res_data = self.__get_response()
 
-        content_disposition = res_data.headers.get("content-disposition")
-        if content_disposition and content_disposition.startswith("attachment"):
+        if self.__is_file_response(res_data):
             return RESTAPIResponseTypes.FILE.value
 
-        json_data = res_data.json()
+        json_data = self.__get_records(res_data)
         if isinstance(json_data, dict):
             return RESTAPIResponseTypes.OBJECT.value
 
         elif isinstance(json_data, list):
+            if not json_data:
+                # e.g. the page after the last one
+                return RESTAPIResponseTypes.LIST_OF_OBJECTS.value
             first_obj = json_data[0]
             if isinstance(first_obj, dict):
                 return RESTAPIResponseTypes.LIST_OF_OBJECTS.value
@@ -284,18 +480,25 @@ class APISourceManager(ABCSourceManager):
     def get_pandas_data_frame_based_on_response(
         self, response: Response = None
     ):
-        """Returns pandas DataFrame based on response data."""
+        """Returns pandas DataFrame based on response data. DataFrame is
+        built once per response and must not be changed"""
         if response is None:
             response = self.__get_response()
+        return self._memo.get_dataframe(
+            response, lambda: self.__build_data_frame(response)
+        )
 
+    def __build_data_frame(self, response: Response) -> pd.DataFrame:
         res_type = self.get_response_type(response)
         match res_type:
             case RESTAPIResponseTypes.LIST_OF_VALUES.value:
-                df = pd.DataFrame(response.json())
+                df = pd.DataFrame(self.__get_records(response))
             case RESTAPIResponseTypes.LIST_OF_OBJECTS.value:
-                df = pd.DataFrame(response.json())
+                df = self.__records_to_data_frame(self.__get_records(response))
             case RESTAPIResponseTypes.OBJECT.value:
-                df = pd.DataFrame([response.json()])
+                df = self.__records_to_data_frame(
+                    [self.__get_records(response)]
+                )
             case RESTAPIResponseTypes.FILE.value:
                 content_disposition = response.headers.get(
                     "content-disposition"
@@ -322,9 +525,32 @@ class APISourceManager(ABCSourceManager):
                 )
         return df
 
+    def __records_to_data_frame(self, records: list) -> pd.DataFrame:
+        """Returns DataFrame of records, nested objects of records are
+        expanded into columns if flatten is set"""
+        if (
+            self.flatten is None
+            or not records
+            or not isinstance(records[0], dict)
+        ):
+            return pd.DataFrame(records)
+        return flatten_records(records, **self.flatten)
+
     def get_source_data_columns(self):
-        """Returns columns for data from current source."""
-        result = list(self.get_pandas_data_frame_based_on_response().columns)
+        """Returns columns for data from current source, found by the first
+        page (by the first chunk of rows of streamed response)."""
+        if self.stream_chunk_size:
+            with contextlib.closing(
+                self.__iter_streamed_frames(None)
+            ) as frames:
+                return list(next(frames).columns)
+        page = get_paginator(
+            self.pagination, self._memo.get_json
+        ).first_request(self.end_point)
+        response = self.__get_response(page=page)
+        result = list(
+            self.get_pandas_data_frame_based_on_response(response).columns
+        )
         return result
 
     def get_cleaned_columns(self):
@@ -339,21 +565,129 @@ class APISourceManager(ABCSourceManager):
                 if x in set_of_columns_from_db
             ]
 
+    @staticmethod
+    def __raise_for_status(response: Response):
+        if not response.ok:
+            raise SourceConnectionError(
+                f"Service responded with error ({response.status_code})!"
+            )
+
+    @staticmethod
+    def __is_file_response(response: Response) -> bool:
+        content_disposition = response.headers.get("content-disposition")
+        return bool(
+            content_disposition and content_disposition.startswith("attachment")
+        )
+
+    def __iter_streamed_frames(
+        self, limit: int | None
+    ) -> Iterator[pd.DataFrame]:
+        """Yields records of response in DataFrames of stream_chunk_size rows
+        as response body is received, so the whole body and its parsed JSON
+        are never kept in memory. Files are read as usual"""
+        with self.__get_response(limit, stream=True) as response:
+            self.__raise_for_status(response)
+            if self.__is_file_response(response):
+                yield self.__build_data_frame(response)
+                return
+
+            received = False
+            for records in iter_json_chunks(
+                response.iter_content(STREAM_READ_SIZE),
+                self.obj_name_to_load_from_response,
+                self.stream_chunk_size,
+            ):
+                received = True
+                yield self.__records_to_data_frame(records)
+            if not received:
+                yield pd.DataFrame()
+
+    def __iter_responses(
+        self, limit: int | None
+    ) -> Iterator[tuple[Response, pd.DataFrame]]:
+        """Yields responses of pages with their data. If number of pages is
+        known from the first page, the rest of pages are requested
+        concurrently, otherwise one by one until the last page"""
+        paginator = get_paginator(self.pagination, self._memo.get_json)
+        page = paginator.first_request(self.end_point)
+        response = self.__get_response(limit, page)
+        self.__raise_for_status(response)
+
+        rest_pages = None
+        concurrency = (self.pagination or {}).get(
+            "concurrency"
+        ) or API_SOURCE_CONCURRENCY
+        if concurrency > 1 and self.auth_type in CONCURRENT_AUTH_TYPES:
+            rest_pages = paginator.get_rest_requests(page, response)
+        if rest_pages is not None:
+            responses = HTTP_CLIENT.fetch(
+                (self.__prepare_request(limit, item) for item in rest_pages),
+                concurrency=concurrency,
+                rate_limit=self.pagination.get("rate_limit"),
+            )
+            for response in itertools.chain([response], responses):
+                self.__raise_for_status(response)
+                yield (
+                    response,
+                    self.get_pandas_data_frame_based_on_response(response),
+                )
+            return
+
+        while page is not None:
+            if paginator.is_repeated(response):
+                return
+            df = self.get_pandas_data_frame_based_on_response(response)
+            page = paginator.next_request(page, response, len(df))
+            yield response, df
+            if page is not None:
+                response = self.__get_response(limit, page)
+                self.__raise_for_status(response)
+
+    def iter_pages(self, limit: int | None = None) -> Iterator[pd.DataFrame]:
+        """Yields source data page by page as pages are received. Only
+        source_data_columns are kept, filters are applied to every page and
+        at most limit rows are returned in total. Streamed response is read
+        by chunks of stream_chunk_size rows instead of pages"""
+        if self.stream_chunk_size:
+            frames = self.__iter_streamed_frames(limit)
+        else:
+            frames = (df for _, df in self.__iter_responses(limit))
+
+        remaining = limit
+        # stops reading of the rest of response once limit is reached
+        with contextlib.closing(frames):
+            for df in frames:
+                df = filter_dataframe(
+                    df, self.filters, remaining, self.source_data_columns
+                )
+                yield df
+                if remaining is not None:
+                    remaining -= len(df)
+                    if remaining <= 0:
+                        return
+
     def get_source_all_data(self):
-        """Returns pandas DataFrame with only specified columns in self.source_data_columns"""
+        """Returns pandas DataFrame with only specified columns in self.source_data_columns.
+        Filters and limit not sent to API are applied to the response"""
+        return pd.concat(list(self.iter_pages(self.limit)), ignore_index=True)
 
-        df = self.get_pandas_data_frame_based_on_response()
-        columns = self.get_cleaned_columns()
-        print(df)
-        return df[columns]
+    def preview(self, limit: int) -> list[dict[str, str | None]]:
+        """Returns first rows of source data, only pages needed for limit rows
+        are requested. Limit is sent to API if limit_param is set"""
+        limit = get_preview_limit(limit, self.limit)
+        df = pd.concat(list(self.iter_pages(limit)), ignore_index=True)
+        return to_preview_rows(dataframe_to_records(df))
 
     def get_source_data_for_grpc(self, source_id: int):
-        """Returns generator of data converted in grpc message DataRequest"""
-        df = self.get_source_all_data()
-        count = df.shape[0]
-
-        for _, row in df.iterrows():
-            data_row = {k: str(v) for k, v in dict(row).items() if v}
-            yield DataRequest(
-                source_id=source_id, count=count, data_row=data_row
-            )
+        """Returns generator of data converted in grpc message DataRequest.
+        Pages (or chunks of streamed response) are sent as they are
+        received, total number of rows is unknown until the last page, so
+        count holds number of rows received so far"""
+        count = 0
+        for df in self.iter_pages(self.limit):
+            count += df.shape[0]
+            for _, row in df.iterrows():
+                data_row = {k: str(v) for k, v in dict(row).items() if v}
+                yield DataRequest(
+                    source_id=source_id, count=count, data_row=data_row
+                )
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Iterable, Iterator
+
+import httpx
+from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+from v3.config import (
+    API_SOURCE_HTTP2,
+    API_SOURCE_MAX_CONNECTIONS,
+    API_SOURCE_TIMEOUT,
+)
+from v3.routers.sources.utils.exceptions import SourceConnectionError
+
+
+class RateLimiter:
+    """Spaces starts of requests by 1 / rate seconds, not limited if rate
+    is not set. Must be used by coroutines of one event loop"""
+
+    def __init__(self, rate: float | None):
+        self.interval = 1 / rate if rate else 0
+        self._next_start = 0.0
+
+    async def wait(self):
+        if not self.interval:
+            return
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_start)
+        self._next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+def to_requests_response(response: httpx.Response) -> Response:
+    """Converts httpx response to requests one, so responses of both clients
+    are parsed the same way"""
+    result = Response()
+    result.status_code = response.status_code
+    result.reason = response.reason_phrase
+    result.headers = CaseInsensitiveDict(response.headers)
+    result.url = str(response.url)
+    result.encoding = response.encoding
+    result._content = response.content
+    return result
+
+
+class AsyncHTTPClient:
+    """httpx.AsyncClient running on its own event loop in a daemon thread.
+    It is shared by all API sources, so connections are kept alive between
+    loads. Source managers are synchronous and run in worker threads, they
+    submit requests to the loop and get responses in order of requests"""
+
+    def __init__(self, **client_options):
+        self._client_options = client_options
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="api-source-http", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    async def _send(
+        self, request: PreparedRequest, limiter: RateLimiter
+    ) -> Response:
+        if self._client is None:
+            # created on the loop thread only, so no lock is needed
+            self._client = httpx.AsyncClient(**self._client_options)
+        await limiter.wait()
+        try:
+            response = await self._client.request(
+                request.method,
+                request.url,
+                headers=dict(request.headers),
+                content=request.body,
+            )
+        except httpx.HTTPError as exc:
+            raise SourceConnectionError(
+                f"Request to {request.url} failed: {exc}"
+            )
+        return to_requests_response(response)
+
+    def fetch(
+        self,
+        requests: Iterable[PreparedRequest],
+        concurrency: int,
+        rate_limit: float | None = None,
+    ) -> Iterator[Response]:
+        """Yields responses of requests in order of requests. At most
+        concurrency requests are sent at the same time, at most rate_limit
+        requests are started per second"""
+        loop = self._get_loop()
+        limiter = RateLimiter(rate_limit)
+        pending = deque()
+        try:
+            for request in requests:
+                pending.append(
+                    asyncio.run_coroutine_threadsafe(
+                        self._send(request, limiter), loop
+                    )
+                )
+                if len(pending) >= concurrency:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+HTTP_CLIENT = AsyncHTTPClient(
+    http2=API_SOURCE_HTTP2,
+    timeout=API_SOURCE_TIMEOUT,
+    limits=httpx.Limits(
+        max_connections=API_SOURCE_MAX_CONNECTIONS,
+        max_keepalive_connections=API_SOURCE_MAX_CONNECTIONS,
+    ),
+)
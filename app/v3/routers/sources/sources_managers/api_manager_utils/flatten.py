@@ -0,0 +1,71 @@
+import json
+
+import pandas as pd
+
+
+def _to_text(value) -> str:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+def _is_instance(series: pd.Series, value_type: type) -> pd.Series:
+    return series.map(lambda value: isinstance(value, value_type))
+
+
+def join_arrays(df: pd.DataFrame, separator: str) -> pd.DataFrame:
+    """Replaces list values by their items joined by separator, object and
+    list items are joined as JSON. Empty lists become empty strings. Objects
+    left deeper than max_level become JSON"""
+    for column in df.select_dtypes(include="object").columns:
+        is_list = _is_instance(df[column], list)
+        is_object = _is_instance(df[column], dict)
+        if is_object.any():
+            df.loc[is_object, column] = df.loc[is_object, column].map(_to_text)
+        if not is_list.any():
+            continue
+        items = df.loc[is_list, column].explode().dropna().map(_to_text)
+        joined = items.groupby(level=0).agg(separator.join)
+        df.loc[is_list, column] = joined.reindex(
+            df.index[is_list], fill_value=""
+        )
+    return df
+
+
+def explode_column(
+    df: pd.DataFrame, column: str, separator: str, max_level: int | None
+) -> pd.DataFrame:
+    """Returns one row per item of list values of column, object items are
+    flattened into columns prefixed by column name"""
+    if column not in df.columns:
+        return df
+    df = df.explode(column, ignore_index=True)
+    is_object = _is_instance(df[column], dict)
+    if not is_object.any():
+        return df
+    nested = pd.json_normalize(
+        df.loc[is_object, column].tolist(), sep=separator, max_level=max_level
+    )
+    nested.index = df.index[is_object]
+    nested = nested.add_prefix(f"{column}{separator}")
+    df.loc[is_object, column] = None
+    if df[column].isna().all():
+        df = df.drop(columns=column)
+    return df.join(nested)
+
+
+def flatten_records(
+    records: list[dict],
+    separator: str = ".",
+    max_level: int | None = None,
+    explode: list[str] | None = None,
+    array_separator: str = ",",
+) -> pd.DataFrame:
+    """Returns DataFrame of records with nested objects expanded into columns
+    named by path joined by separator (e.g. 'address.city') up to max_level
+    levels. Arrays of explode columns are exploded into one row per item,
+    the rest of arrays are joined by array_separator"""
+    df = pd.json_normalize(records, sep=separator, max_level=max_level)
+    for column in explode or []:
+        df = explode_column(df, column, separator, max_level)
+    return join_arrays(df, array_separator)
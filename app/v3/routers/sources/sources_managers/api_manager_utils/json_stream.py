@@ -0,0 +1,206 @@
+import codecs
+import itertools
+import json
+import re
+from typing import Any, Iterable, Iterator
+
+# bytes of response body read at once
+STREAM_READ_SIZE = 64 * 1024
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_STRUCTURAL = re.compile(r'["\[\]{}]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_NUMBER_START = "-0123456789"
+_NUMBER_END = re.compile(r"[\s,\]}]")
+
+
+class JSONStreamReader:
+    """Reads JSON document from chunks of bytes as they are received. Only
+    not yet parsed part of received chunks is kept in memory, values which
+    are not needed are skipped without building Python objects"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read_more(self) -> bool:
+        """Appends next chunk to not parsed part of buffer, returns False at
+        the end of document"""
+        while not self._eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._eof = True
+                text = self._decoder.decode(b"", final=True)
+            else:
+                text = self._decoder.decode(chunk)
+            if text:
+                self._buffer = self._buffer[self._pos :] + text
+                self._pos = 0
+                return True
+        return False
+
+    def peek(self) -> str:
+        """Returns next not whitespace character, '' at the end of document"""
+        while True:
+            while (
+                self._pos < len(self._buffer)
+                and self._buffer[self._pos] in _WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read_more():
+                return ""
+
+    def advance(self):
+        self._pos += 1
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in JSON, got '{found}'")
+        self.advance()
+
+    def read_value(self) -> Any:
+        """Returns next value of document"""
+        char = self.peek()
+        if char and char in _NUMBER_START:
+            # number at the end of buffer may continue in the next chunk
+            while (
+                not _NUMBER_END.search(self._buffer, self._pos)
+                and self._read_more()
+            ):
+                pass
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._read_more():
+                    continue
+                raise
+            self._pos = end
+            return value
+
+    def skip_value(self):
+        """Skips next value, arrays and objects are skipped by scanning
+        brackets and strings without decoding them"""
+        if self.peek() not in "[{":
+            self.read_value()
+            return
+
+        depth, in_string, pos = 0, False, self._pos
+        while True:
+            buffer = self._buffer
+            while pos < len(buffer):
+                if in_string:
+                    match = _STRING_SPECIAL.search(buffer, pos)
+                    if match is None:
+                        pos = len(buffer)
+                    elif match.group() == "\\":
+                        # escaped character may be in the next chunk
+                        pos = match.end() + 1
+                    else:
+                        in_string = False
+                        pos = match.end()
+                    continue
+
+                match = _STRUCTURAL.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    continue
+                pos = match.end()
+                char = match.group()
+                if char == '"':
+                    in_string = True
+                elif char in "[{":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        self._pos = pos
+                        return
+
+            overflow = pos - len(buffer)
+            self._pos = len(buffer)
+            if not self._read_more():
+                raise ValueError("Unexpected end of JSON")
+            pos = self._pos + overflow
+
+    def find(self, key: str) -> bool:
+        """Moves to value of key of the next object (or to item with index
+        key of the next array), returns False if there is no such key"""
+        char = self.peek()
+        if char == "{":
+            self.advance()
+            while True:
+                char = self.peek()
+                if char in ("}", ""):
+                    return False
+                if char == ",":
+                    self.advance()
+                    continue
+                name = self.read_value()
+                self.expect(":")
+                if name == key:
+                    return True
+                self.skip_value()
+        if char == "[" and key.isdigit():
+            self.advance()
+            index = 0
+            while True:
+                char = self.peek()
+                if char in ("]", ""):
+                    return False
+                if char == ",":
+                    self.advance()
+                    continue
+                if index == int(key):
+                    return True
+                self.skip_value()
+                index += 1
+        return False
+
+
+def iter_json_records(chunks: Iterable[bytes], path: str | None) -> Iterator:
+    """Yields records of JSON document found by dot-separated path (see
+    get_by_path): items of array one by one or the object itself. Nothing
+    is returned if there is no such path or its value is null"""
+    reader = JSONStreamReader(chunks)
+    for key in path.split(".") if path else []:
+        if not reader.find(key):
+            return
+
+    if reader.peek() != "[":
+        value = reader.read_value()
+        if isinstance(value, dict):
+            yield value
+        elif value is not None:
+            raise NotImplementedError(
+                f"Not implemented parser for response type = {type(value)}"
+            )
+        return
+
+    reader.advance()
+    while True:
+        char = reader.peek()
+        if char == "]":
+            return
+        if char == "":
+            raise ValueError("Unexpected end of JSON")
+        if char == ",":
+            reader.advance()
+            continue
+        yield reader.read_value()
+
+
+def iter_json_chunks(
+    chunks: Iterable[bytes], path: str | None, size: int
+) -> Iterator[list]:
+    """Yields records found by path in lists of at most size records"""
+    records = iter_json_records(chunks, path)
+    while chunk := list(itertools.islice(records, size)):
+        yield chunk
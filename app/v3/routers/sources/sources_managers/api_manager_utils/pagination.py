@@ -0,0 +1,271 @@
+import hashlib
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable
+from urllib.parse import urljoin
+
+from pydantic import ValidationError as PydanticValidationError
+from requests import Response
+
+from v3.config import API_SOURCE_MAX_PAGES
+from v3.routers.sources.models.api_model import (
+    APIPaginationModel,
+    APIPaginationType,
+)
+from v3.routers.sources.utils.exceptions import ValidationError
+
+
+@dataclass
+class PageRequest:
+    """Request of one page. If params is None, url is complete (e.g. next link
+    returned by API) and no other query parameters are added to it"""
+
+    url: str
+    params: dict | None = field(default_factory=dict)
+    number: int = 0
+
+
+def get_by_path(data: Any, path: str | None) -> Any:
+    """Returns value of dot-separated path (e.g. 'data.items') in parsed JSON,
+    None if there is no such path"""
+    if not path:
+        return data
+    for key in path.split("."):
+        if isinstance(data, dict):
+            data = data.get(key)
+        elif isinstance(data, list) and key.isdigit() and int(key) < len(data):
+            data = data[int(key)]
+        else:
+            return None
+    return data
+
+
+class Paginator(ABC):
+    def __init__(
+        self,
+        pagination: dict,
+        get_json: Callable[[Response], Any] = Response.json,
+    ):
+        # returns parsed JSON of response, lets caller reuse parsed body
+        self.get_json = get_json
+        self.page_size = pagination.get("page_size")
+        self.size_param = pagination.get("size_param")
+        max_pages = pagination.get("max_pages")
+        self.max_pages = min(
+            max_pages or API_SOURCE_MAX_PAGES, API_SOURCE_MAX_PAGES
+        )
+        self.total_path = pagination.get("total_path")
+        self.pages_path = pagination.get("pages_path")
+        self._last_page_digest: bytes | None = None
+
+    @abstractmethod
+    def first_request(self, url: str) -> PageRequest:
+        pass
+
+    @abstractmethod
+    def _next_request(
+        self, request: PageRequest, response: Response, records: int
+    ) -> PageRequest | None:
+        pass
+
+    def next_request(
+        self, request: PageRequest, response: Response, records: int
+    ) -> PageRequest | None:
+        """Returns request of the page following request, None if it was
+        the last page. records is number of records in response.
+        Pagination also stops after max_pages pages"""
+        if records == 0:
+            return None
+        if request.number + 1 >= self.max_pages:
+            return None
+        next_request = self._next_request(request, response, records)
+        if next_request is not None:
+            next_request.number = request.number + 1
+        return next_request
+
+    def get_rest_requests(
+        self, request: PageRequest, response: Response
+    ) -> list[PageRequest] | None:
+        """Returns requests of all pages following the first page request,
+        if number of pages is known from its response (see total_path and
+        pages_path). None if pages have to be requested one by one"""
+        return None
+
+    def _get_pages_count(self, response: Response) -> int | None:
+        """Returns number of pages found in response, at most max_pages"""
+        if self.pages_path:
+            pages = get_by_path(self.get_json(response), self.pages_path)
+        elif self.total_path and self.page_size:
+            pages = get_by_path(self.get_json(response), self.total_path)
+            if isinstance(pages, (int, float, str)):
+                pages = math.ceil(float(pages) / self.page_size)
+        else:
+            return None
+        try:
+            return min(int(pages), self.max_pages)
+        except (TypeError, ValueError):
+            return None
+
+    def is_repeated(self, response: Response) -> bool:
+        """Returns True if response is the same as the previous page, e.g.
+        API ignores pagination parameters"""
+        digest = hashlib.sha256(response.content).digest()
+        is_repeated = digest == self._last_page_digest
+        self._last_page_digest = digest
+        return is_repeated
+
+    def _size_params(self) -> dict:
+        if self.size_param and self.page_size:
+            return {self.size_param: self.page_size}
+        return {}
+
+    def _is_last(self, records: int) -> bool:
+        return self.page_size is not None and records < self.page_size
+
+
+class SinglePagePaginator(Paginator):
+    """API is not paginated, the whole result is returned by one request"""
+
+    def first_request(self, url: str) -> PageRequest:
+        return PageRequest(url=url)
+
+    def _next_request(self, request, response, records):
+        return None
+
+
+class OffsetPaginator(Paginator):
+    """Pages are requested by offset of the first record and page size"""
+
+    def __init__(self, pagination: dict, **kwargs):
+        super().__init__(pagination, **kwargs)
+        self.offset_param = pagination.get("offset_param")
+
+    def first_request(self, url: str) -> PageRequest:
+        return PageRequest(
+            url=url, params={**self._size_params(), self.offset_param: 0}
+        )
+
+    def get_rest_requests(self, request, response):
+        pages = self._get_pages_count(response)
+        if pages is None or not self.page_size:
+            return None
+        return [
+            PageRequest(
+                url=request.url,
+                params={
+                    **request.params,
+                    self.offset_param: number * self.page_size,
+                },
+                number=number,
+            )
+            for number in range(1, pages)
+        ]
+
+    def _next_request(self, request, response, records):
+        if self._is_last(records):
+            return None
+        offset = request.params[self.offset_param] + records
+        return PageRequest(
+            url=request.url,
+            params={**request.params, self.offset_param: offset},
+        )
+
+
+class PageNumberPaginator(Paginator):
+    """Pages are requested by page number, starting from first_page"""
+
+    def __init__(self, pagination: dict, **kwargs):
+        super().__init__(pagination, **kwargs)
+        self.page_param = pagination.get("page_param")
+        self.first_page = pagination.get("first_page", 1)
+
+    def first_request(self, url: str) -> PageRequest:
+        return PageRequest(
+            url=url,
+            params={**self._size_params(), self.page_param: self.first_page},
+        )
+
+    def get_rest_requests(self, request, response):
+        pages = self._get_pages_count(response)
+        if pages is None:
+            return None
+        return [
+            PageRequest(
+                url=request.url,
+                params={
+                    **request.params,
+                    self.page_param: self.first_page + number,
+                },
+                number=number,
+            )
+            for number in range(1, pages)
+        ]
+
+    def _next_request(self, request, response, records):
+        if self._is_last(records):
+            return None
+        page = request.params[self.page_param] + 1
+        return PageRequest(
+            url=request.url, params={**request.params, self.page_param: page}
+        )
+
+
+class CursorPaginator(Paginator):
+    """Each response contains cursor (token) of the next page at cursor_path,
+    it is sent in cursor_param. Pages end when there is no cursor"""
+
+    def __init__(self, pagination: dict, **kwargs):
+        super().__init__(pagination, **kwargs)
+        self.cursor_param = pagination.get("cursor_param")
+        self.cursor_path = pagination.get("cursor_path")
+
+    def first_request(self, url: str) -> PageRequest:
+        return PageRequest(url=url, params=self._size_params())
+
+    def _next_request(self, request, response, records):
+        cursor = get_by_path(self.get_json(response), self.cursor_path)
+        if cursor in (None, ""):
+            return None
+        return PageRequest(
+            url=request.url,
+            params={**request.params, self.cursor_param: cursor},
+        )
+
+
+class LinkHeaderPaginator(Paginator):
+    """URL of the next page is sent in RFC 5988 'Link: <url>; rel="next"'
+    response header"""
+
+    def first_request(self, url: str) -> PageRequest:
+        return PageRequest(url=url, params=self._size_params())
+
+    def _next_request(self, request, response, records):
+        next_link = response.links.get("next", {}).get("url")
+        if not next_link:
+            return None
+        return PageRequest(url=urljoin(response.url, next_link), params=None)
+
+
+PAGINATORS = {
+    APIPaginationType.OFFSET.value: OffsetPaginator,
+    APIPaginationType.PAGE.value: PageNumberPaginator,
+    APIPaginationType.CURSOR.value: CursorPaginator,
+    APIPaginationType.LINK_HEADER.value: LinkHeaderPaginator,
+}
+
+
+def get_paginator(
+    pagination: dict | None,
+    get_json: Callable[[Response], Any] = Response.json,
+) -> Paginator:
+    """Returns paginator of pagination config, single page paginator if API
+    is not paginated. get_json is used to get parsed JSON of responses"""
+    if not pagination:
+        return SinglePagePaginator({}, get_json=get_json)
+    try:
+        # con_data may be stored before some defaults were added
+        pagination = APIPaginationModel.parse_obj(pagination).dict()
+    except PydanticValidationError as exc:
+        raise ValidationError(f"Wrong pagination config: {exc}")
+    return PAGINATORS[pagination["type"]](pagination, get_json=get_json)
@@ -0,0 +1,51 @@
+import json
+import weakref
+from typing import Any, Callable
+
+import pandas as pd
+from cachetools import LRUCache
+from requests import Response
+
+# responses kept by one source manager, enough for the first page requested
+# for columns and then for data, while pages of a load are not kept
+RESPONSE_MEMO_SIZE = 4
+
+
+class ResponseMemo:
+    """Responses of one source manager (one logical operation, e.g. load or
+    preview) keyed by request, with their parsed JSON and DataFrame. The same
+    resource is requested and parsed once per operation.
+
+    Parsed JSON and DataFrames are kept while their response exists and must
+    not be changed by callers"""
+
+    def __init__(self, maxsize: int = RESPONSE_MEMO_SIZE):
+        self._responses: LRUCache = LRUCache(maxsize=maxsize)
+        self._json = weakref.WeakKeyDictionary()
+        self._dataframes = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def get_key(method: str, url: str, options: dict) -> str:
+        return json.dumps([method, url, options], sort_keys=True, default=str)
+
+    def get_response(self, key: str, fetch: Callable[[], Response]) -> Response:
+        """Returns memoized response of request, responses of conditional
+        requests without body (304 Not Modified) are not kept"""
+        response = self._responses.get(key)
+        if response is None:
+            response = fetch()
+            if response.status_code != 304:
+                self._responses[key] = response
+        return response
+
+    def get_json(self, response: Response) -> Any:
+        if response not in self._json:
+            self._json[response] = response.json()
+        return self._json[response]
+
+    def get_dataframe(
+        self, response: Response, build: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        if response not in self._dataframes:
+            self._dataframes[response] = build()
+        return self._dataframes[response]
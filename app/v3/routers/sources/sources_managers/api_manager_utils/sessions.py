@@ -0,0 +1,126 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from cachetools import LRUCache
+from requests import Session
+
+# token is refreshed this number of seconds before it expires
+TOKEN_EXPIRY_MARGIN = 30
+
+
+def get_auth_key(auth_type: str, auth_data: dict | None) -> str:
+    """Returns sha256 of auth config, so secrets are not kept in keys"""
+    data = json.dumps([auth_type, auth_data], sort_keys=True, default=str)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+class SessionRegistry:
+    """Process-wide LRU cache of requests sessions of API sources.
+
+    Sessions are keyed by auth config (see get_auth_key), so TCP/TLS
+    connections and auth state (e.g. digest nonce) are reused between calls
+    of the same source. Evicted sessions are closed."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, factory: Callable[[], Session]) -> Session:
+        evicted = []
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+                return session
+
+            session = factory()
+            self._sessions[key] = session
+            while len(self._sessions) > self.maxsize:
+                evicted.append(self._sessions.popitem(last=False)[1])
+
+        for evicted_session in evicted:
+            evicted_session.close()
+        return session
+
+    def clear(self):
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def __len__(self):
+        return len(self._sessions)
+
+
+class OAuthTokenCache:
+    """Process-wide cache of OAuth2 tokens of API sources keyed by auth
+    config. Token is reused until TOKEN_EXPIRY_MARGIN seconds before it
+    expires (by expires_at or expires_in), then it is refreshed by refresh
+    token if there is one, otherwise a new token is fetched. Tokens without
+    expiration time are reused until they are invalidated"""
+
+    def __init__(self, maxsize: int, margin: float = TOKEN_EXPIRY_MARGIN):
+        self.margin = margin
+        self._tokens: LRUCache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        # one token request at a time, so concurrent loads of the same
+        # source do not request several tokens
+        self._fetch_lock = threading.Lock()
+
+    def is_valid(self, token: dict | None) -> bool:
+        if token is None:
+            return False
+        expires_at = token.get("expires_at")
+        return expires_at is None or time.time() < expires_at - self.margin
+
+    def _get(self, key: str) -> dict | None:
+        with self._lock:
+            return self._tokens.get(key)
+
+    def get(
+        self,
+        key: str,
+        fetch: Callable[[], dict],
+        refresh: Callable[[dict], dict],
+    ) -> dict:
+        token = self._get(key)
+        if self.is_valid(token):
+            return token
+
+        with self._fetch_lock:
+            token = self._get(key)
+            if self.is_valid(token):
+                return token
+
+            new_token = None
+            if token is not None and token.get("refresh_token"):
+                try:
+                    new_token = refresh(token)
+                except Exception:
+                    # refresh token may be expired or revoked too
+                    new_token = None
+            if new_token is None:
+                new_token = fetch()
+
+            new_token = dict(new_token)
+            if "expires_at" not in new_token and new_token.get("expires_in"):
+                new_token["expires_at"] = time.time() + float(
+                    new_token["expires_in"]
+                )
+            with self._lock:
+                self._tokens[key] = new_token
+            return new_token
+
+    def invalidate(self, key: str):
+        with self._lock:
+            self._tokens.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._tokens.clear()
@@ -1,26 +1,59 @@
 import datetime
 
 from sqlalchemy import (
+    Boolean,
     create_engine,
-    MetaData,
+    inspect,
     select,
     func,
     DATETIME,
     DATE,
     TIMESTAMP,
 )
-from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import NoSuchTableError, OperationalError
 from sqlalchemy.orm import Session
 
+from v3.config import (
+    DB_SOURCE_ENGINE_CACHE_SIZE,
+    DB_SOURCE_MAX_OVERFLOW,
+    DB_SOURCE_POOL_SIZE,
+    DB_SOURCE_POSTGRES_COPY,
+    DB_SOURCE_REFLECTION_TTL,
+)
 from v3.grpc_config.dataflow_to_dataview.proto.data_carrier_pb2 import (
     DataRequest,
 )
 from v3.routers.sources.models.db_model import DBDriverTypes
+from v3.routers.sources.models.general_model import FilterOperator
+from v3.routers.sources.sources_managers.db_manager_utils.engine_cache import (
+    EngineCache,
+)
+from v3.routers.sources.sources_managers.db_manager_utils.partitioning import (
+    PARTITION_MAX_CONNECTIONS,
+    PartitionedReader,
+    is_partition_column,
+)
+from v3.routers.sources.sources_managers.db_manager_utils.postgres_copy import (
+    PostgresCopyReader,
+    can_copy,
+)
+from v3.routers.sources.sources_managers.db_manager_utils.reflection import (
+    TableReflectionCache,
+)
+from v3.routers.sources.sources_managers.db_manager_utils.streaming import (
+    StreamingReader,
+)
+from v3.routers.sources.sources_managers.filters import FILTER_OPERATORS
 from v3.routers.sources.sources_managers.general import ABCSourceManager
+from v3.routers.sources.sources_managers.preview import (
+    get_preview_limit,
+    to_preview_rows,
+)
 from v3.routers.sources.utils.exceptions import (
     InternalError,
     ResourceNotFoundError,
     SourceConnectionError,
+    ValidationError,
 )
 
 DBConnectionDrivers = {
@@ -29,6 +62,9 @@ DBConnectionDrivers = {
     DBDriverTypes.ORACLE.value: "oracle+cx_oracle",
 }
 
+ENGINE_CACHE = EngineCache(maxsize=DB_SOURCE_ENGINE_CACHE_SIZE)
+TABLE_CACHE = TableReflectionCache(ttl=DB_SOURCE_REFLECTION_TTL)
+
 
 class DBSourceManager(ABCSourceManager):
     def __init__(self, con_data: dict):
@@ -42,6 +78,15 @@ class DBSourceManager(ABCSourceManager):
         self.source_data_columns = con_data.get("source_data_columns", None)
         self.date_column = con_data.get("date_column")
         self.offset = con_data.get("offset")
+        self.partitioning = con_data.get("partitioning")
+        self.pool_size = con_data.get("pool_size") or DB_SOURCE_POOL_SIZE
+        # incremental extraction selects rows with
+        # watermark < watermark_column <= watermark_upper_bound
+        self.watermark_column = con_data.get("watermark_column")
+        self.watermark = None
+        self.watermark_upper_bound = None
+        self.filters = con_data.get("filters") or []
+        self.limit = con_data.get("limit")
 
     @property
     def db_type(self):
@@ -111,39 +156,60 @@ class DBSourceManager(ABCSourceManager):
         self._source_data_columns = value
 
     def __get_engine_by_db_type(self):
+        """Returns cached engine, so connections are reused between calls"""
         url = f"{DBConnectionDrivers[self._db_type]}://{self.user}:{self.password}@{self.host}:{self.port}/{self.db_name}"
-        return create_engine(url)
+        pool_size = self.pool_size
+        if self.partitioning:
+            # all partitions read at the same time need own connection
+            pool_size = max(
+                pool_size,
+                min(
+                    self.partitioning["partitions"] + 1,
+                    PARTITION_MAX_CONNECTIONS,
+                ),
+            )
+        return ENGINE_CACHE.get(
+            url,
+            pool_size,
+            lambda: create_engine(
+                url,
+                pool_pre_ping=True,
+                pool_size=pool_size,
+                max_overflow=DB_SOURCE_MAX_OVERFLOW,
+            ),
+        )
+
+    def __get_table(self):
+        """Returns reflected db_table, cached for DB_SOURCE_REFLECTION_TTL"""
+        if self.db_table is None:
+            raise InternalError("Please set value for db_table attribute")
+
+        try:
+            return TABLE_CACHE.get(
+                self.__get_engine_by_db_type(), self.db_table
+            )
+        except NoSuchTableError:
+            raise ResourceNotFoundError(
+                f"Table with name '{self.db_table}' does not exist!"
+            )
+        except OperationalError as exc:
+            raise SourceConnectionError(str(exc))
 
     def check_connection(self):
         """Raises error if the connection failed."""
-        meta_data = MetaData()
         try:
-            meta_data.reflect(bind=self.__get_engine_by_db_type())
+            with self.__get_engine_by_db_type().connect():
+                pass
         except OperationalError as ex:
             raise ValueError(ex.orig.args[0].capitalize())
 
     def get_all_tables_from_db(self):
-        """Returns all db tables"""
-        meta_data = MetaData()
-        meta_data.reflect(bind=self.__get_engine_by_db_type())
-        return list(meta_data.tables.keys())
+        """Returns names of all db tables without reflecting their columns"""
+        return inspect(self.__get_engine_by_db_type()).get_table_names()
 
     def get_source_data_columns(self, only_datetime: bool = False):
         """Returns list of all db table columns"""
-        if self.db_table is None:
-            raise InternalError("Please set value for db_table attribute")
-
-        meta_data = MetaData()
-        try:
-            meta_data.reflect(bind=self.__get_engine_by_db_type())
-        except OperationalError as exc:
-            raise SourceConnectionError(str(exc))
-
-        table = meta_data.tables.get(self.db_table, None)
-        if table is None:
-            raise ResourceNotFoundError(
-                f"Table with name '{self.db_table}' does not exist!"
-            )
+        table = self.__get_table()
 
         if only_datetime:
             columns = [
@@ -160,16 +226,7 @@ class DBSourceManager(ABCSourceManager):
         return columns
 
     def get_columns_with_types(self) -> dict[str, str]:
-        if self.db_table is None:
-            raise InternalError("Please set value for db_table attribute")
-
-        meta_data = MetaData()
-        meta_data.reflect(bind=self.__get_engine_by_db_type())
-        table = meta_data.tables.get(self.db_table, None)
-        if table is None:
-            raise ResourceNotFoundError(
-                f"Table with name '{self.db_table}' does not exist!"
-            )
+        table = self.__get_table()
 
         columns = set(table.columns.keys())
         if (
@@ -217,38 +274,153 @@ class DBSourceManager(ABCSourceManager):
                 if x in set_of_columns_from_db
             ]
 
+    @staticmethod
+    def __get_filter_clause(table, source_filter: dict):
+        column = table.c.get(source_filter["column"])
+        if column is None:
+            raise ResourceNotFoundError(
+                f"Column with name '{source_filter['column']}' does not exist!"
+            )
+        value = source_filter.get("value")
+        if source_filter["operator"] == FilterOperator.IN.value:
+            return column.in_(value)
+        # == None and != None are compiled into IS NULL and IS NOT NULL
+        return FILTER_OPERATORS[source_filter["operator"]](column, value)
+
+    def __get_select_statement(self, session: Session, table, columns):
+        """Returns select of columns filtered by filters and date_column
+        window, limited to limit rows"""
+        columns = [getattr(table.c, column) for column in columns]
+        stmt = select(*columns)
+        for source_filter in self.filters:
+            stmt = stmt.where(self.__get_filter_clause(table, source_filter))
+        if self.date_column:
+            date_column = getattr(table.c, self.date_column)
+            query = select(func.max(date_column))
+            right_date = session.execute(query).scalar()
+            if right_date is None:
+                right_date = datetime.date.today() - datetime.timedelta(
+                    days=self.offset
+                )
+            left_date = right_date - datetime.timedelta(days=1)
+            stmt = stmt.where(
+                right_date > date_column, date_column >= left_date
+            )
+        if self.watermark_column:
+            watermark_column = getattr(table.c, self.watermark_column)
+            if self.watermark is not None:
+                stmt = stmt.where(watermark_column > self.watermark)
+            if self.watermark_upper_bound is not None:
+                stmt = stmt.where(
+                    watermark_column <= self.watermark_upper_bound
+                )
+        if self.limit is not None:
+            stmt = stmt.limit(self.limit)
+        return stmt
+
+    def get_watermark_upper_bound(self, watermark=None):
+        """Returns max value of watermark_column greater than watermark,
+        None if there are no such rows"""
+        table = self.__get_table()
+        column = table.c.get(self.watermark_column)
+        if column is None:
+            raise ResourceNotFoundError(
+                f"Column with name '{self.watermark_column}' does not exist!"
+            )
+        query = select(func.max(column))
+        if watermark is not None:
+            query = query.where(column > watermark)
+        with self.__get_engine_by_db_type().connect() as connection:
+            return connection.execute(query).scalar()
+
     def get_source_all_data(self):
         """Returns source data with only specified columns in self.source_data_columns"""
         columns = self.get_cleaned_columns()
-        meta_data = MetaData()
         engine = self.__get_engine_by_db_type()
-        meta_data.reflect(bind=engine)
-        table = meta_data.tables[self.db_table]
+        table = self.__get_table()
 
         with Session(engine) as session:
-            columns = [getattr(table.c, column) for column in columns]
-            stmt = select(*columns)
-            if self.date_column:
-                date_column = getattr(table.c, self.date_column)
-                query = select(func.max(date_column))
-                right_date = session.execute(query).scalar()
-                if right_date is None:
-                    right_date = datetime.date.today() - datetime.timedelta(
-                        days=self.offset
-                    )
-                left_date = right_date - datetime.timedelta(days=1)
-                stmt = stmt.where(
-                    right_date > date_column, date_column >= left_date
-                )
+            stmt = self.__get_select_statement(session, table, columns)
             res = session.execute(stmt).all()
 
             return res
 
+    def preview(self, limit: int) -> list[dict[str, str | None]]:
+        """Returns first rows of source data selected with LIMIT"""
+        columns = self.get_cleaned_columns()
+        engine = self.__get_engine_by_db_type()
+        table = self.__get_table()
+
+        with Session(engine) as session:
+            stmt = self.__get_select_statement(session, table, columns)
+            stmt = stmt.limit(get_preview_limit(limit, self.limit))
+            rows = session.execute(stmt).all()
+
+        return to_preview_rows(row._mapping for row in rows)
+
+    def get_source_data_reader(self) -> StreamingReader | PartitionedReader:
+        """Returns reader of source data that streams rows without loading
+        the whole result. PostgreSQL sources are read with COPY. With
+        partitioning set the table is split into ranges of partition column,
+        which are read in parallel on separate connections. Partitioning is
+        not used with limit, which can not be split between partitions"""
+        columns = self.get_cleaned_columns()
+        engine = self.__get_engine_by_db_type()
+        table = self.__get_table()
+
+        with Session(engine) as session:
+            stmt = self.__get_select_statement(session, table, columns)
+
+        if not self.partitioning or self.limit is not None:
+            if (
+                DB_SOURCE_POSTGRES_COPY
+                and engine.dialect.name == "postgresql"
+                and can_copy(stmt)
+            ):
+                bool_columns = [
+                    column.name
+                    for column in stmt.selected_columns
+                    if isinstance(column.type, Boolean)
+                ]
+                return PostgresCopyReader(
+                    engine=engine, stmt=stmt, bool_columns=bool_columns
+                )
+            return StreamingReader(engine=engine, stmt=stmt)
+
+        column_name = self.partitioning.get("column")
+        if column_name is None:
+            primary_key = list(table.primary_key.columns)
+            if len(primary_key) != 1:
+                raise ValidationError(
+                    f"Table '{self.db_table}' has no single-column primary key,"
+                    f" set partitioning column explicitly"
+                )
+            column = primary_key[0]
+        else:
+            column = table.c.get(column_name)
+            if column is None:
+                raise ResourceNotFoundError(
+                    f"Column with name '{column_name}' does not exist!"
+                )
+        if not is_partition_column(column):
+            raise ValidationError(
+                f"Partitioning column '{column.name}' must be numeric, date "
+                f"or timestamp, got {column.type}"
+            )
+
+        return PartitionedReader(
+            engine=engine,
+            stmt=stmt,
+            column=column,
+            partitions=self.partitioning["partitions"],
+            ordered=self.partitioning.get("ordered", True),
+        )
+
     def get_source_data_for_grpc(self, source_id: int):
         """Returns generator of data converted in grpc message DataRequest"""
-        res = self.get_source_all_data()
-        count = len(res)
-        for x in res:
+        reader = self.get_source_data_reader()
+        count = reader.probe()
+        for x in reader:
             data_row = {k: str(v) for k, v in dict(x).items()}
             yield DataRequest(
                 source_id=source_id, count=count, data_row=data_row
@@ -0,0 +1,53 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from sqlalchemy.engine import Engine
+
+
+class EngineCache:
+    """Process-wide LRU cache of SQLAlchemy engines of DB sources.
+
+    Engines are keyed by sha256 of connection URL and pool size, so warm
+    connection pools are reused between calls and plain passwords are not
+    kept in keys. Evicted engines are disposed."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._engines: OrderedDict[str, Engine] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(url: str, pool_size: int) -> str:
+        return hashlib.sha256(f"{pool_size}|{url}".encode()).hexdigest()
+
+    def get(
+        self, url: str, pool_size: int, factory: Callable[[], Engine]
+    ) -> Engine:
+        key = self.get_key(url, pool_size)
+        evicted = []
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is not None:
+                self._engines.move_to_end(key)
+                return engine
+
+            engine = factory()
+            self._engines[key] = engine
+            while len(self._engines) > self.maxsize:
+                evicted.append(self._engines.popitem(last=False)[1])
+
+        for evicted_engine in evicted:
+            evicted_engine.dispose()
+        return engine
+
+    def clear(self):
+        with self._lock:
+            engines = list(self._engines.values())
+            self._engines.clear()
+        for engine in engines:
+            engine.dispose()
+
+    def __len__(self):
+        return len(self._engines)
@@ -0,0 +1,175 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator
+
+from sqlalchemy import Date, DateTime, Integer, Numeric, func
+from sqlalchemy.engine import Engine, Row
+from sqlalchemy.sql import ColumnElement, Select
+
+PARTITION_FETCH_SIZE = 10_000
+# number of fetched chunks each partition may keep in memory
+PARTITION_QUEUE_SIZE = 4
+# partitions read at the same time, must not exceed engine pool capacity,
+# otherwise in ordered mode the first partition may wait for a connection
+# held by partitions blocked on their full queues
+PARTITION_MAX_CONNECTIONS = 10
+_PUT_TIMEOUT = 0.5
+
+_DONE = object()
+
+# column types which ranges can be split by get_partition_bounds
+PARTITION_COLUMN_TYPES = (Integer, Numeric, Date, DateTime)
+
+
+def is_partition_column(column: ColumnElement) -> bool:
+    """Returns True if column is numeric, date or timestamp"""
+    return isinstance(column.type, PARTITION_COLUMN_TYPES)
+
+
+def get_partition_bounds(
+    min_value: Any, max_value: Any, partitions: int
+) -> list[tuple[Any, Any]]:
+    """Splits [min_value, max_value] into at most partitions ranges of equal
+    width. Works for numbers, decimals, dates and timestamps"""
+    if min_value is None or max_value is None:
+        return []
+    if min_value == max_value:
+        return [(min_value, max_value)]
+
+    if isinstance(min_value, int) and isinstance(max_value, int):
+        step = max(-(-(max_value - min_value + 1) // partitions), 1)
+        bounds = list(range(min_value, max_value + 1, step))
+        if bounds[-1] != max_value:
+            bounds.append(max_value)
+    else:
+        step = (max_value - min_value) / partitions
+        bounds = [min_value + step * idx for idx in range(partitions)]
+        bounds.append(max_value)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+class PartitionedReader:
+    """Reads rows of select statement in parallel, one connection per range
+    of partition column values. Rows with NULL partition column are read by
+    an additional partition.
+
+    If ordered is True, rows are returned partition by partition in order of
+    ranges, otherwise in order they are fetched. Each partition keeps at most
+    PARTITION_QUEUE_SIZE chunks of fetch_size rows in memory. At most
+    max_connections partitions are read at the same time, the rest wait in
+    order"""
+
+    def __init__(
+        self,
+        engine: Engine,
+        stmt: Select,
+        column: ColumnElement,
+        partitions: int,
+        ordered: bool = True,
+        fetch_size: int = PARTITION_FETCH_SIZE,
+        max_connections: int = PARTITION_MAX_CONNECTIONS,
+    ):
+        self.engine = engine
+        self.stmt = stmt
+        self.column = column
+        self.partitions = partitions
+        self.ordered = ordered
+        self.fetch_size = fetch_size
+        self.max_connections = max_connections
+        self.count: int | None = None
+        self._predicates: list[ColumnElement] | None = None
+
+    def probe(self) -> int:
+        """Gets min/max of partition column and rows count, returns count"""
+        probe_stmt = self.stmt.with_only_columns(
+            func.min(self.column), func.max(self.column), func.count()
+        ).order_by(None)
+        with self.engine.connect() as connection:
+            min_value, max_value, count = connection.execute(probe_stmt).one()
+
+        bounds = get_partition_bounds(min_value, max_value, self.partitions)
+        predicates = []
+        for idx, (left, right) in enumerate(bounds):
+            if idx == len(bounds) - 1:
+                predicates.append(self.column.between(left, right))
+            else:
+                predicates.append((self.column >= left) & (self.column < right))
+        predicates.append(self.column.is_(None))
+
+        self.count = count
+        self._predicates = predicates
+        return count
+
+    def __iter__(self) -> Iterator[Row]:
+        if self._predicates is None:
+            self.probe()
+
+        predicates = self._predicates
+        stop = threading.Event()
+        if self.ordered:
+            queues = [
+                queue.Queue(maxsize=PARTITION_QUEUE_SIZE) for _ in predicates
+            ]
+        else:
+            shared = queue.Queue(maxsize=PARTITION_QUEUE_SIZE * len(predicates))
+            queues = [shared] * len(predicates)
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(predicates), self.max_connections),
+            thread_name_prefix="db-partition",
+        )
+        try:
+            for predicate, partition_queue in zip(predicates, queues):
+                executor.submit(
+                    self._read_partition, predicate, partition_queue, stop
+                )
+
+            if self.ordered:
+                for partition_queue in queues:
+                    yield from self._drain(partition_queue, 1)
+            else:
+                yield from self._drain(queues[0], len(predicates))
+        finally:
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _drain(partition_queue: queue.Queue, producers: int) -> Iterator[Row]:
+        finished = 0
+        while finished < producers:
+            item = partition_queue.get()
+            if item is _DONE:
+                finished += 1
+            elif isinstance(item, BaseException):
+                raise item
+            else:
+                yield from item
+
+    def _read_partition(
+        self,
+        predicate: ColumnElement,
+        partition_queue: queue.Queue,
+        stop: threading.Event,
+    ):
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    partition_queue.put(item, timeout=_PUT_TIMEOUT)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            with self.engine.connect() as connection:
+                result = connection.execution_options(
+                    stream_results=True
+                ).execute(self.stmt.where(predicate))
+                while chunk := result.fetchmany(self.fetch_size):
+                    if not put(chunk):
+                        return
+        except Exception as exc:
+            put(exc)
+            return
+        put(_DONE)
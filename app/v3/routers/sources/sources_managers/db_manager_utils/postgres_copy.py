@@ -0,0 +1,142 @@
+import logging
+import math
+import os
+import threading
+from typing import Iterator
+
+import pandas as pd
+from sqlalchemy import Boolean, Date, Float, Integer, Numeric, String
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import Select
+
+from v3.routers.sources.sources_managers.db_manager_utils.streaming import (
+    STREAM_FETCH_SIZE,
+    StreamingReader,
+)
+
+COPY_NULL = r"\N"
+COPY_BOOLEANS = {"t": "True", "f": "False"}
+# types which PostgreSQL text output equals str() of values returned by
+# psycopg2 (booleans are converted). Floats ('Infinity', 'NaN'), timestamps
+# (fractional seconds, time zones), intervals, arrays and JSON differ
+COPY_TEXT_TYPES = (Integer, String, Boolean, Date, Numeric)
+
+
+def can_copy(stmt: Select) -> bool:
+    """Returns True if all selected columns are read by COPY the same way
+    as by cursor"""
+    return all(
+        isinstance(column.type, COPY_TEXT_TYPES)
+        and not isinstance(column.type, Float)
+        for column in stmt.selected_columns
+    )
+
+
+class PostgresCopyReader(StreamingReader):
+    """Reads rows of select statement from PostgreSQL with
+    COPY (SELECT ...) TO STDOUT WITH CSV, which skips building Python
+    objects for every value. CSV output is streamed through a pipe into
+    pandas chunked CSV parser, so at most fetch_size rows are kept in memory.
+
+    Rows are returned as dicts of strings, NULL values are returned as None
+    and values of bool_columns are converted to 'True'/'False', like rows
+    read by cursor. Use only for statements accepted by can_copy.
+
+    If rows are not read to the end, running COPY is cancelled and the
+    connection is invalidated instead of being returned to the pool"""
+
+    def __init__(
+        self,
+        engine: Engine,
+        stmt: Select,
+        bool_columns: list[str] | None = None,
+        fetch_size: int = STREAM_FETCH_SIZE,
+    ):
+        super().__init__(engine=engine, stmt=stmt, fetch_size=fetch_size)
+        self.bool_columns = bool_columns or []
+
+    def get_copy_sql(self, cursor) -> str:
+        compiled = self.stmt.compile(dialect=self.engine.dialect)
+        query = cursor.mogrify(str(compiled), compiled.params).decode()
+        return (
+            f"COPY ({query}) TO STDOUT "
+            f"WITH (FORMAT csv, HEADER true, NULL '{COPY_NULL}')"
+        )
+
+    def _iter_chunks(self, reader) -> Iterator[pd.DataFrame]:
+        try:
+            yield from pd.read_csv(
+                reader,
+                chunksize=self.fetch_size,
+                dtype=str,
+                keep_default_na=False,
+                na_values=[COPY_NULL],
+            )
+        except pd.errors.EmptyDataError:
+            # COPY failed before header was written or returned nothing
+            return
+
+    def __iter__(self) -> Iterator[dict[str, str | None]]:
+        connection = self.engine.raw_connection()
+        errors = []
+        finished = False
+
+        def copy(cursor, sql: str, write_fd: int):
+            with os.fdopen(write_fd, "wb") as writer:
+                try:
+                    cursor.copy_expert(sql, writer)
+                except BrokenPipeError:
+                    # reader was closed before all rows were read
+                    pass
+                except Exception as exc:
+                    errors.append(exc)
+
+        try:
+            cursor = connection.cursor()
+            sql = self.get_copy_sql(cursor)
+            read_fd, write_fd = os.pipe()
+            thread = threading.Thread(
+                target=copy, args=(cursor, sql, write_fd), name="postgres-copy"
+            )
+            thread.start()
+            try:
+                with os.fdopen(
+                    read_fd, "r", encoding="utf-8", newline=""
+                ) as reader:
+                    for chunk in self._iter_chunks(reader):
+                        for column in self.bool_columns:
+                            if column in chunk.columns:
+                                chunk[column] = chunk[column].replace(
+                                    COPY_BOOLEANS
+                                )
+                        for record in chunk.to_dict("records"):
+                            yield {
+                                key: None
+                                if isinstance(value, float)
+                                and math.isnan(value)
+                                else value
+                                for key, value in record.items()
+                            }
+                finished = True
+            finally:
+                if not finished:
+                    # otherwise COPY keeps running until the pipe is written
+                    self._cancel(connection)
+                thread.join()
+            if errors:
+                finished = False
+                raise errors[0]
+        finally:
+            if finished:
+                connection.close()
+            else:
+                # connection may be left in the middle of COPY
+                connection.invalidate()
+
+    @staticmethod
+    def _cancel(connection):
+        try:
+            connection.connection.cancel()
+        except Exception as exc:
+            # connection is invalidated anyway
+            logging.warning("Can not cancel COPY: %s", exc)
@@ -0,0 +1,44 @@
+import hashlib
+import threading
+
+from cachetools import TTLCache
+from sqlalchemy import MetaData, Table
+from sqlalchemy.engine import Engine
+
+
+class TableReflectionCache:
+    """TTL cache of single reflected tables keyed by (database, table).
+
+    Only the requested table is reflected instead of the whole database,
+    which matters for databases with thousands of tables."""
+
+    def __init__(self, ttl: int, maxsize: int = 256):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(engine: Engine, table_name: str) -> tuple[str, str]:
+        url = engine.url.render_as_string(hide_password=False)
+        return hashlib.sha256(url.encode()).hexdigest(), table_name
+
+    def get(self, engine: Engine, table_name: str) -> Table:
+        """Returns reflected table, raises NoSuchTableError if it does not
+        exist"""
+        key = self.get_key(engine, table_name)
+        with self._lock:
+            table = self._cache.get(key)
+        if table is not None:
+            return table
+
+        table = Table(table_name, MetaData(), autoload_with=engine)
+        with self._lock:
+            self._cache[key] = table
+        return table
+
+    def invalidate(self, engine: Engine, table_name: str):
+        with self._lock:
+            self._cache.pop(self.get_key(engine, table_name), None)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
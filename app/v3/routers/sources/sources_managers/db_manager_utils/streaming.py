@@ -0,0 +1,41 @@
+from typing import Iterator
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Engine, Row
+from sqlalchemy.sql import Select
+
+STREAM_FETCH_SIZE = 10_000
+
+
+class StreamingReader:
+    """Reads rows of select statement through server-side cursor holding at
+    most fetch_size rows in memory. Rows count is got by a separate
+    COUNT(*) query over the same statement"""
+
+    def __init__(
+        self,
+        engine: Engine,
+        stmt: Select,
+        fetch_size: int = STREAM_FETCH_SIZE,
+    ):
+        self.engine = engine
+        self.stmt = stmt
+        self.fetch_size = fetch_size
+        self.count: int | None = None
+
+    def probe(self) -> int:
+        """Returns rows count of statement"""
+        count_stmt = select(func.count()).select_from(
+            self.stmt.order_by(None).subquery()
+        )
+        with self.engine.connect() as connection:
+            self.count = connection.execute(count_stmt).scalar()
+        return self.count
+
+    def __iter__(self) -> Iterator[Row]:
+        with self.engine.connect() as connection:
+            result = connection.execution_options(
+                stream_results=True, max_row_buffer=self.fetch_size
+            ).execute(self.stmt)
+            for partition in result.partitions(self.fetch_size):
+                yield from partition
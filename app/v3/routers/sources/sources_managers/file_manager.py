@@ -5,6 +5,7 @@ import ftplib
 import io
 import os
 import re
+from typing import Iterator
 
 import minio
 import numpy as np
@@ -31,9 +32,23 @@ from v3.routers.sources.sources_managers.file_manager_utils.handlers import (
     FileHandler,
 )
 from v3.routers.sources.sources_managers.file_manager_utils.utils import (
+    ObjectReader,
     get_csv_delimiter_by_one_line,
+    source_errors,
+)
+from v3.routers.sources.sources_managers.filters import (
+    filter_dataframe,
+    get_file_nrows,
+    get_file_usecols,
 )
 from v3.routers.sources.sources_managers.general import ABCSourceManager
+from v3.routers.sources.sources_managers.preview import (
+    PREVIEW_READ_SIZE,
+    cut_to_whole_lines,
+    dataframe_to_records,
+    get_preview_limit,
+    to_preview_rows,
+)
 import pandas as pd
 
 from v3.routers.sources.utils.exceptions import (
@@ -43,6 +58,18 @@ from v3.routers.sources.utils.exceptions import (
     SourceConnectionError,
 )
 
+# errors of reading file from SFTP, FTP or MinIO
+FILE_SOURCE_ERRORS = (
+    OSError,
+    ConnectionException,
+    SSHException,
+    FTPError,
+    minio.error.S3Error,
+)
+
+# rows of file converted to CSV at once by iter_csv_content
+CSV_CONTENT_CHUNK_ROWS = 10_000
+
 PANDAS_FILE_READER = {
     FileExtension.CSV.value: pd.read_csv,
     FileExtension.EXCEL.value: pd.read_excel,
@@ -92,6 +119,8 @@ class SFTPSourceManager(ABCSourceManager):
         self.offset = file_info.get("offset", None)
 
         self.source_data_columns = con_data.get("source_data_columns")
+        self.filters = con_data.get("filters")
+        self.limit = con_data.get("limit")
         self.file = None
         self.handler: FileHandler | None = None
 
@@ -256,11 +285,14 @@ class SFTPSourceManager(ABCSourceManager):
     def get_source_all_data(self):
         """Returns pandas DataFrame with only specified columns in self.source_data_columns"""
         self.get_file()
-        df = self.handler.parse()
-
-        if self.source_data_columns:
-            df = df[self.source_data_columns]
-        df.replace(np.nan, None, inplace=True)
+        df = self.handler.parse(
+            usecols=get_file_usecols(self.source_data_columns, self.filters),
+            nrows=get_file_nrows(self.filters, self.limit),
+        )
+        df = filter_dataframe(
+            df, self.filters, self.limit, self.source_data_columns
+        )
+        df = df.replace(np.nan, None)
 
         return df
 
@@ -276,11 +308,33 @@ class SFTPSourceManager(ABCSourceManager):
                 source_id=source_id, count=count, data_row=data_row
             )
 
-    def get_file(self) -> SFTPFile | io.StringIO:
-        if self.file:
-            self.file.seek(0)
-            return self.file
+    def preview(self, limit: int) -> list[dict[str, str | None]]:
+        """Returns first rows of file read only by first PREVIEW_READ_SIZE
+        bytes"""
+        limit = get_preview_limit(limit, self.limit)
+        with source_errors(FILE_SOURCE_ERRORS):
+            remote_file_name = self._get_remote_file_name()
+            with pysftp.Connection(
+                **self.__connection_data_dict()
+            ) as connection:
+                with connection.open(remote_file_name) as remote_file:
+                    content = remote_file.read(PREVIEW_READ_SIZE)
+            content = cut_to_whole_lines(content, PREVIEW_READ_SIZE)
+
+            handler = FileValidator(
+                io.StringIO(content.decode())
+            ).get_file_handler()
+            df = handler.parse(
+                usecols=get_file_usecols(
+                    self.source_data_columns, self.filters
+                ),
+                nrows=get_file_nrows(self.filters, limit),
+            )
+        df = filter_dataframe(df, self.filters, limit, self.source_data_columns)
+        return to_preview_rows(dataframe_to_records(df))
 
+    def _get_remote_file_name(self) -> str:
+        """Returns name of the latest modified remote file matching file_name"""
         remote_files = self.get_list_of_files_and_dirs()
         file_pattern = self._file_name
         if self.date_pattern:
@@ -299,8 +353,29 @@ class SFTPSourceManager(ABCSourceManager):
                     remote_files.items(), key=lambda item: item[1], reverse=True
                 )
             )
-            remote_file_name = list(remote_files.keys())[0]
+            return list(remote_files.keys())[0]
+
+    def get_data_validators(self, previous: dict | None) -> dict | None:
+        """Returns name, size and mtime of the latest remote file, so the file
+        is not downloaded if it was not changed"""
+        with source_errors(FILE_SOURCE_ERRORS):
+            remote_file_name = self._get_remote_file_name()
+            with pysftp.Connection(
+                **self.__connection_data_dict()
+            ) as connection:
+                stat = connection.stat(remote_file_name)
+        return {
+            "file": remote_file_name,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+        }
 
+    def get_file(self) -> SFTPFile | io.StringIO:
+        if self.file:
+            self.file.seek(0)
+            return self.file
+
+        remote_file_name = self._get_remote_file_name()
         print(remote_file_name)
         with pysftp.Connection(**self.__connection_data_dict()) as connection:
             connection.get(remote_file_name, f"./temp/{self.file_name}")
@@ -322,6 +397,8 @@ class ManualFileSourceManager(ABCSourceManager):
         self.source_id = source_id
         self.file_name = con_data.get("filename") or con_data.get("file_name")
         self.source_data_columns = con_data.get("source_data_columns")
+        self.filters = con_data.get("filters")
+        self.limit = con_data.get("limit")
         self.client = client
 
     @property
@@ -392,6 +469,15 @@ class ManualFileSourceManager(ABCSourceManager):
         finally:
             res.close()
 
+    def get_data_validators(self, previous: dict | None) -> dict | None:
+        """Returns ETag and size of the uploaded file object"""
+        with source_errors(FILE_SOURCE_ERRORS):
+            stat = self.client.stat_object(
+                bucket_name=MINIO_BUCKET,
+                object_name=f"{self.source_id}/{self.file_name}",
+            )
+        return {"etag": stat.etag, "size": stat.size}
+
     def get_source_data_columns(self) -> list:
         """
         Returns list of all file columns
@@ -455,15 +541,20 @@ class ManualFileSourceManager(ABCSourceManager):
                 if x in set_of_columns_from_db
             ]
 
-    def get_source_all_data(self):
-        """Returns pandas DataFrame with only specified columns in self.source_data_columns"""
-        self.check_connection()
+    def __read_dataframe(
+        self, limit: int | None, read_size: int | None = None
+    ) -> pd.DataFrame:
+        """Returns file data with only source_data_columns, filtered by filters
+        and limited to limit rows. If read_size is set, only first read_size
+        bytes of csv file are downloaded"""
+        pandas_file_reader = get_pandas_file_reader(self.file_name)
+        object_range = {}
+        # excel files can not be parsed partially
+        if read_size is not None and pandas_file_reader == pd.read_csv:
+            object_range = dict(offset=0, length=read_size)
+
+        response = self.__get_object(**object_range)
         try:
-            response = self.client.get_object(
-                bucket_name=MINIO_BUCKET,
-                object_name=f"{self.source_id}/{self.file_name}",
-            )
-            pandas_file_reader = get_pandas_file_reader(self.file_name)
             additional_data = {}
 
             # read_excel cannot read urllib3.response.HTTPResponse object,
@@ -471,24 +562,111 @@ class ManualFileSourceManager(ABCSourceManager):
             if pandas_file_reader == pd.read_excel:
                 file_object = response.data
             else:
-                content = io.BytesIO(response.read())
-                file_object = copy.deepcopy(content)
+                content = response.read()
+                if object_range:
+                    content = cut_to_whole_lines(content, read_size)
+                file_object = io.BytesIO(content)
                 additional_data = dict(
-                    delimiter=get_csv_delimiter_by_one_line(content.readline())
+                    delimiter=get_csv_delimiter_by_one_line(
+                        file_object.readline()
+                    )
                 )
                 file_object.seek(0)
 
             df = pandas_file_reader(
                 file_object,
                 dtype=str,
-                usecols=self.get_cleaned_columns(),
+                usecols=get_file_usecols(
+                    self.source_data_columns, self.filters
+                ),
+                nrows=get_file_nrows(self.filters, limit),
                 **additional_data,
             )
+        finally:
+            response.close()
+
+        df = filter_dataframe(df, self.filters, limit, self.source_data_columns)
+        return df.replace(np.nan, None)
+
+    def __get_object(self, **object_range):
+        """Returns response of file object, it must be closed"""
+        try:
+            return self.client.get_object(
+                bucket_name=MINIO_BUCKET,
+                object_name=f"{self.source_id}/{self.file_name}",
+                **object_range,
+            )
+        except minio.error.S3Error as e:
+            if e.code == "NoSuchKey":
+                raise ResourceNotFoundError(
+                    f"The file named '{self.file_name}' does not exist!"
+                )
+            raise
 
-            df.replace(np.nan, None, inplace=True)
+    def get_source_all_data(self):
+        """Returns pandas DataFrame with only specified columns in self.source_data_columns"""
+        self.check_connection()
+        return self.__read_dataframe(self.limit)
+
+    def iter_csv_content(
+        self, chunk_rows: int = CSV_CONTENT_CHUNK_ROWS
+    ) -> Iterator[bytes]:
+        """Yields source data as CSV (get_source_all_data written by
+        to_csv without index) in parts of at most chunk_rows rows. CSV files
+        are read from MinIO by chunks, so the whole file is never kept in
+        memory, excel files are read at once"""
+        if get_pandas_file_reader(self.file_name) != pd.read_csv:
+            df = self.get_source_all_data()
+            for start in range(0, max(len(df), 1), chunk_rows):
+                yield (
+                    df.iloc[start : start + chunk_rows]
+                    .to_csv(index=False, header=start == 0)
+                    .encode("utf-8")
+                )
+            return
+
+        response = self.__get_object()
+        try:
+            file_object = io.BufferedReader(
+                ObjectReader(response), buffer_size=PREVIEW_READ_SIZE
+            )
+            first_line = file_object.peek(PREVIEW_READ_SIZE).split(b"\n")[0]
+            chunks = pd.read_csv(
+                file_object,
+                dtype=str,
+                usecols=get_file_usecols(
+                    self.source_data_columns, self.filters
+                ),
+                nrows=get_file_nrows(self.filters, self.limit),
+                delimiter=get_csv_delimiter_by_one_line(first_line),
+                chunksize=chunk_rows,
+            )
+            remaining = self.limit
+            header = True
+            for chunk in chunks:
+                chunk = filter_dataframe(
+                    chunk, self.filters, remaining, self.source_data_columns
+                )
+                if chunk.empty and not header:
+                    continue
+                yield chunk.to_csv(index=False, header=header).encode("utf-8")
+                header = False
+                if remaining is not None:
+                    remaining -= len(chunk)
+                    if remaining <= 0:
+                        return
         finally:
             response.close()
-        return df
+
+    def preview(self, limit: int) -> list[dict[str, str | None]]:
+        """Returns first rows of file, csv files are read by range of first
+        PREVIEW_READ_SIZE bytes"""
+        with source_errors(FILE_SOURCE_ERRORS):
+            df = self.__read_dataframe(
+                get_preview_limit(limit, self.limit),
+                read_size=PREVIEW_READ_SIZE,
+            )
+        return to_preview_rows(dataframe_to_records(df))
 
     def get_columns_with_types(self) -> dict[str, str]:
         """Returns key-value pairs of all file columns names and types"""
@@ -585,6 +763,8 @@ class FTPSourceManager(ABCSourceManager):
         self.offset = file_info.get("offset", None)
 
         self.source_data_columns = con_data.get("source_data_columns")
+        self.filters = con_data.get("filters")
+        self.limit = con_data.get("limit")
         self.is_connected = False
         self._client: FTPHost | None = None
 
@@ -636,7 +816,9 @@ class FTPSourceManager(ABCSourceManager):
     def check_connection(self):
         self._connect()
 
-    def _download_file(self) -> io.StringIO:
+    def _get_remote_file_name(self) -> str:
+        """Returns path of remote file, the latest modified file matching
+        file_name if date_pattern is set"""
         remote_file_name = self.path
 
         # if search by date_pattern -> download last file
@@ -656,16 +838,40 @@ class FTPSourceManager(ABCSourceManager):
                 )
             )
             remote_file_name = list(remote_files.keys())[0]
+        return remote_file_name
 
+    def get_data_validators(self, previous: dict | None) -> dict | None:
+        """Returns name, size and mtime of remote file, so the file is not
+        downloaded if it was not changed"""
+        self._connect()
+        with source_errors(FILE_SOURCE_ERRORS):
+            remote_file_name = self._get_remote_file_name()
+            stat = self._client.stat(remote_file_name)
+        return {
+            "file": remote_file_name,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+        }
+
+    def _download_file(self, read_size: int | None = None) -> io.StringIO:
+        """Returns content of remote file, only first read_size characters
+        (cut to whole lines) if read_size is set"""
+        remote_file_name = self._get_remote_file_name()
         with self._client.open(remote_file_name) as remote_file:
             file = io.StringIO()
-            file.write(remote_file.read())
+            if read_size is None:
+                file.write(remote_file.read())
+            else:
+                content = remote_file.read(read_size)
+                file.write(cut_to_whole_lines(content, read_size))
             file.seek(0)
 
         return file
 
-    def _get_dataframe(self) -> pd.DataFrame:
-        file = self._download_file()
+    def _get_dataframe(
+        self, read_size: int | None = None, **read_options
+    ) -> pd.DataFrame:
+        file = self._download_file(read_size)
 
         pandas_file_reader = get_pandas_file_reader(self.file_name)
 
@@ -676,7 +882,7 @@ class FTPSourceManager(ABCSourceManager):
             )
             file.seek(0)
 
-        df = pandas_file_reader(file, **additional_data)
+        df = pandas_file_reader(file, **additional_data, **read_options)
 
         return df
 
@@ -738,12 +944,34 @@ class FTPSourceManager(ABCSourceManager):
     def get_source_all_data(self):
         """Returns pandas DataFrame with only specified columns in self.source_data_columns"""
         self._connect()
-        columns = self.get_cleaned_columns()
-        df = self._get_dataframe()
-        columns_to_drop = set(columns).symmetric_difference(df.columns)
-        df.drop(columns=columns_to_drop, axis=1, inplace=True)  # noqa
+        df = self._get_dataframe(
+            usecols=get_file_usecols(self.source_data_columns, self.filters),
+            nrows=get_file_nrows(self.filters, self.limit),
+        )
 
-        return df
+        return filter_dataframe(
+            df, self.filters, self.limit, self.source_data_columns
+        )
+
+    def preview(self, limit: int) -> list[dict[str, str | None]]:
+        """Returns first rows of file, csv files are read only by first
+        PREVIEW_READ_SIZE characters"""
+        self._connect()
+        limit = get_preview_limit(limit, self.limit)
+        read_size = None
+        # excel files can not be parsed partially
+        if get_pandas_file_reader(self.file_name) == pd.read_csv:
+            read_size = PREVIEW_READ_SIZE
+        with source_errors(FILE_SOURCE_ERRORS):
+            df = self._get_dataframe(
+                read_size,
+                usecols=get_file_usecols(
+                    self.source_data_columns, self.filters
+                ),
+                nrows=get_file_nrows(self.filters, limit),
+            )
+        df = filter_dataframe(df, self.filters, limit, self.source_data_columns)
+        return to_preview_rows(dataframe_to_records(df))
 
     def get_source_data_for_grpc(self, source_id: int):
         """Returns generator of data converted in grpc message DataRequest"""
@@ -14,7 +14,8 @@ class FileHandler(ABC):
         self.file = file
 
     @abstractmethod
-    def parse(self) -> pd.DataFrame:
+    def parse(self, usecols=None, nrows: int | None = None) -> pd.DataFrame:
+        """Returns file data, usecols and nrows are passed to pandas reader"""
         pass
 
     @abstractmethod
@@ -28,7 +29,7 @@ class StrictColumnFileHandler(FileHandler):
         self._delimiter_line_index = self._get_delimiter_line_index()
         self._delimiter_indices = self._get_delimiter_indices()
 
-    def parse(self) -> pd.DataFrame:
+    def parse(self, usecols=None, nrows: int | None = None) -> pd.DataFrame:
         buffer = io.StringIO()
         self.file.seek(0)
         for i in range(self._delimiter_line_index - 1):
@@ -44,7 +45,9 @@ class StrictColumnFileHandler(FileHandler):
                 break
         buffer.seek(0)
 
-        return pd.read_csv(buffer, sep=";").convert_dtypes()
+        return pd.read_csv(
+            buffer, sep=";", usecols=usecols, nrows=nrows
+        ).convert_dtypes()
 
     def parse_header(self) -> pd.DataFrame:
         buffer = io.StringIO()
@@ -106,8 +109,10 @@ class CSVFileHandler(FileHandler):
         self.delimiter = get_csv_delimiter_by_one_line(file.readline())
         self.file.seek(0)
 
-    def parse(self) -> pd.DataFrame:
-        return pd.read_csv(self.file, delimiter=self.delimiter).convert_dtypes()
+    def parse(self, usecols=None, nrows: int | None = None) -> pd.DataFrame:
+        return pd.read_csv(
+            self.file, delimiter=self.delimiter, usecols=usecols, nrows=nrows
+        ).convert_dtypes()
 
     def parse_header(self) -> pd.DataFrame:
         df = pd.read_csv(self.file, delimiter=self.delimiter).convert_dtypes()
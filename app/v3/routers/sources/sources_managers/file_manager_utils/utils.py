@@ -1,8 +1,16 @@
 import csv
 import io
+import zipfile
 from _csv import Error
+from contextlib import contextmanager
 from typing import Union
 
+from v3.routers.sources.utils.exceptions import (
+    CustomException,
+    SourceConnectionError,
+    ValidationError,
+)
+
 
 def get_csv_delimiter(file_data: bytes):
     """Returns csv delimiter"""
@@ -25,3 +33,36 @@ def get_csv_delimiter_by_one_line(line: Union[bytes, str]):
     if delimiter not in [",", ";"]:
         delimiter = ","
     return delimiter
+
+
+@contextmanager
+def source_errors(connection_errors: tuple[type[Exception], ...] = ()):
+    """Converts connection_errors of file source backend (reading of file,
+    its stat for load validators) into SourceConnectionError and errors of
+    parsing file into ValidationError"""
+    try:
+        yield
+    except CustomException:
+        raise
+    except connection_errors as exc:
+        raise SourceConnectionError(f"Can not read file: {exc}") from exc
+    except (ValueError, zipfile.BadZipFile) as exc:
+        # pandas parser and decoding errors are ValueError
+        raise ValidationError(f"Can not parse file: {exc}") from exc
+
+
+class ObjectReader(io.RawIOBase):
+    """Raw binary stream of object read by read(size) (e.g. MinIO response),
+    so it can be buffered by io.BufferedReader and read by pandas in chunks
+    without downloading the whole object"""
+
+    def __init__(self, response):
+        self._response = response
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._response.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
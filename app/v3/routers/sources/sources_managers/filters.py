@@ -0,0 +1,90 @@
+import operator
+from typing import Any, Callable
+
+import pandas as pd
+
+from v3.routers.sources.models.general_model import FilterOperator
+from v3.routers.sources.utils.exceptions import ResourceNotFoundError
+
+FILTER_OPERATORS = {
+    FilterOperator.EQ.value: operator.eq,
+    FilterOperator.NE.value: operator.ne,
+    FilterOperator.GT.value: operator.gt,
+    FilterOperator.GE.value: operator.ge,
+    FilterOperator.LT.value: operator.lt,
+    FilterOperator.LE.value: operator.le,
+}
+
+
+def get_filter_columns(filters: list[dict] | None) -> list[str]:
+    return [item["column"] for item in filters or []]
+
+
+def get_file_usecols(
+    columns: list[str] | None, filters: list[dict] | None
+) -> Callable[[str], bool] | None:
+    """Returns usecols for pandas readers with columns and columns used by
+    filters. Columns missing in file are skipped instead of raising error"""
+    if not columns:
+        return None
+    wanted = set(columns).union(get_filter_columns(filters))
+    return wanted.__contains__
+
+
+def get_file_nrows(filters: list[dict] | None, limit: int | None):
+    """Rows to read from file, limit can be applied while reading only if
+    there are no filters"""
+    return None if filters else limit
+
+
+def _coerce(series: pd.Series, value: Any) -> tuple[pd.Series, Any]:
+    """Files are often read as strings, so numbers are compared as numbers
+    and other values as strings"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return pd.to_numeric(series, errors="coerce"), value
+    if pd.api.types.is_string_dtype(series) or pd.api.types.is_object_dtype(
+        series
+    ):
+        return series.astype(str), str(value)
+    return series, value
+
+
+def filter_dataframe(
+    df: pd.DataFrame,
+    filters: list[dict] | None,
+    limit: int | None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Returns rows of df matching all filters, at most limit rows. If columns
+    are set, only these columns are kept (columns read only for filters are
+    dropped)"""
+    for item in filters or []:
+        if item["column"] not in df.columns:
+            raise ResourceNotFoundError(
+                f"Column with name '{item['column']}' does not exist!"
+            )
+        series = df[item["column"]]
+        value = item.get("value")
+        match item["operator"]:
+            case FilterOperator.IN.value:
+                mask = series.notna() & (
+                    series.isin(value)
+                    | series.astype(str).isin([str(x) for x in value])
+                )
+            case FilterOperator.EQ.value if value is None:
+                mask = series.isna()
+            case FilterOperator.NE.value if value is None:
+                mask = series.notna()
+            case filter_operator:
+                # like in SQL, comparison with null is never true
+                not_null = series.notna()
+                series, value = _coerce(series, value)
+                mask = FILTER_OPERATORS[filter_operator](series, value)
+                mask &= not_null
+        df = df[mask]
+
+    if limit is not None:
+        df = df.head(limit)
+    if columns:
+        df = df[[column for column in columns if column in df.columns]]
+    return df
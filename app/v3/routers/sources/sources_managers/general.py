@@ -27,6 +27,19 @@ class ABCSourceManager(ABC):
     def get_source_data_for_grpc(self, source_id: int):
         pass
 
+    @abstractmethod
+    def preview(self, limit: int) -> list[dict[str, str | None]]:
+        """Returns at most limit first rows of source data, reading as little
+        of the source as possible"""
+        pass
+
+    def get_data_validators(self, previous: dict | None) -> dict | None:
+        """Returns validators of current source data (e.g. ETag of response
+        or size and mtime of file), equal to previous validators if data was
+        not modified. None if source has no validators, so its data is
+        always loaded"""
+        return None
+
     # @abstractmethod
     # def check_data_loading(self):
     #     """Checks if data download is available."""
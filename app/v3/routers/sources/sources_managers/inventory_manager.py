@@ -1,8 +1,11 @@
+from typing import Iterator
+
 from v3.grpc_config.mo_info_client import MOInfoClient
 from v3.grpc_config.dataflow_to_dataview.proto.data_carrier_pb2 import (
     DataRequest,
 )
 from v3.routers.sources.sources_managers.general import ABCSourceManager
+from v3.routers.sources.sources_managers.preview import to_preview_rows
 
 
 class InventorySourceManager(ABCSourceManager):
@@ -35,19 +38,38 @@ class InventorySourceManager(ABCSourceManager):
 
         return set(all_columns).intersection(self.source_data_columns)
 
+    def iter_pages(self) -> Iterator[tuple[list, int | None]]:
+        columns = self.get_cleaned_columns()
+        return MOInfoClient.iter_data_pages(
+            tmo_id=self.tmo_id, columns=list(columns)
+        )
+
     def get_source_all_data(self):
         """get data"""
+        return [item for page, _ in self.iter_pages() for item in page]
+
+    def preview(self, limit: int) -> list[dict[str, str | None]]:
+        """Returns first page of limit objects"""
         columns = self.get_cleaned_columns()
-        return MOInfoClient.get_data(tmo_id=self.tmo_id, columns=columns)
+        return to_preview_rows(
+            MOInfoClient.get_data(
+                tmo_id=self.tmo_id, columns=list(columns), limit=limit
+            )
+        )
 
     def get_source_data_for_grpc(self, source_id: int):
-        """Pack data to grpc object"""
-        data = self.get_source_all_data()
-        count = len(data)
-        for item in data:
-            data_row = {
-                k: str(v) for k, v in dict(item).items() if v is not None
-            }
-            yield DataRequest(
-                source_id=source_id, count=count, data_row=data_row
-            )
+        """Pack data to grpc object page by page.
+        count is number of objects of TMO if inventory sends it with pages
+        (or TMO fits into one page), otherwise number of objects received
+        so far"""
+        received = 0
+        for page, total in self.iter_pages():
+            received += len(page)
+            count = received if total is None else total
+            for item in page:
+                data_row = {
+                    k: str(v) for k, v in dict(item).items() if v is not None
+                }
+                yield DataRequest(
+                    source_id=source_id, count=count, data_row=data_row
+                )
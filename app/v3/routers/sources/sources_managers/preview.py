@@ -0,0 +1,44 @@
+from typing import Iterable
+
+import pandas as pd
+
+from v3.routers.sources.utils.exceptions import ValidationError
+
+# bytes of text files read for preview, enough for thousands of rows
+PREVIEW_READ_SIZE = 1024 * 1024
+
+
+def get_preview_limit(limit: int, source_limit: int | None) -> int:
+    return limit if source_limit is None else min(limit, source_limit)
+
+
+def cut_to_whole_lines(content: bytes | str, size: int) -> bytes | str:
+    """Drops incomplete last line of content read by first size bytes of
+    file. Content shorter than size is the whole file and is returned as is.
+    Raises ValidationError if there is no whole line in content"""
+    if len(content) < size:
+        return content
+    newline = b"\n" if isinstance(content, bytes) else "\n"
+    end = content.rfind(newline) + 1
+    if end == 0:
+        raise ValidationError(
+            f"First line of file is longer than {size} bytes, "
+            f"preview is not available"
+        )
+    return content[:end]
+
+
+def dataframe_to_records(df: pd.DataFrame) -> list[dict]:
+    """Returns rows of df with NaN, NaT and NA replaced by None"""
+    return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+def to_preview_rows(records: Iterable[dict]) -> list[dict[str, str | None]]:
+    """Converts values to str the same way they are sent to dataview"""
+    return [
+        {
+            key: None if value is None else str(value)
+            for key, value in record.items()
+        }
+        for record in records
+    ]
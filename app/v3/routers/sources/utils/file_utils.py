@@ -1,6 +1,10 @@
+from typing import List
+
 from fastapi import HTTPException
+from pydantic import ValidationError as PydanticValidationError, parse_raw_as
 
 from v3.routers.sources.models.file_model import FileExtension
+from v3.routers.sources.models.general_model import SourceFilterModel
 
 
 def validate_file_extension(file_name: str):
@@ -11,3 +15,14 @@ def validate_file_extension(file_name: str):
             status_code=422,
             detail=f"There are no implemented file reader for extension '.{file_ext}'.",
         )
+
+
+def parse_filters_form(filters: str | None) -> list[dict] | None:
+    """Returns filters sent in form field as JSON list of filter objects"""
+    if filters is None:
+        return None
+    try:
+        parsed = parse_raw_as(List[SourceFilterModel], filters)
+    except PydanticValidationError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    return [item.dict() for item in parsed]
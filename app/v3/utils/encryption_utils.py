@@ -1,10 +1,23 @@
+import functools
+import hashlib
+import json
+import threading
+from typing import Any
+
+from cachetools import LRUCache
 from cryptography.fernet import Fernet
-from v3.config import CRYPTO_KEY
+from v3.config import CON_DATA_CACHE_SIZE, CRYPTO_KEY
+
+
+@functools.cache
+def get_fernet() -> Fernet:
+    """Returns Fernet of CRYPTO_KEY, created once per process"""
+    return Fernet(CRYPTO_KEY)
 
 
 def encrypt_data(data: str):
     """Returns  encrypted data"""
-    fernet = Fernet(CRYPTO_KEY)
+    fernet = get_fernet()
     res = fernet.encrypt(bytes(data, "utf-8"))
     return res.decode("utf-8")
 
@@ -14,6 +27,57 @@ def decrypt_data(data: str):
     Parameters:
                 data (str): string representation of bytes obtained by bytes_data.decode('utf-8')
     """
-    fernet = Fernet(CRYPTO_KEY)
+    fernet = get_fernet()
     res = fernet.decrypt(data)
     return res
+
+
+def get_data_digest(data: str) -> str:
+    """Returns sha256 of encrypted data. Data is encrypted with a new IV on
+    every update, so the digest identifies version of con_data of source or
+    destination"""
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class DecryptedDataCache:
+    """Process-wide LRU cache of decrypted JSON data (con_data of sources and
+    destinations) keyed by get_data_digest, so changed data is never taken
+    from the cache. Decrypted text is kept and parsed on every call, so
+    callers get their own copy and can not change the cache. Data is
+    decrypted on every call if maxsize is 0"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: LRUCache | None = (
+            LRUCache(maxsize=maxsize) if maxsize > 0 else None
+        )
+        self._lock = threading.Lock()
+
+    def loads(self, data: str) -> Any:
+        if self._data is None:
+            return json.loads(decrypt_data(data))
+
+        key = get_data_digest(data)
+        with self._lock:
+            text = self._data.get(key)
+        if text is None:
+            text = decrypt_data(data)
+            with self._lock:
+                self._data[key] = text
+        return json.loads(text)
+
+    def clear(self):
+        if self._data is not None:
+            with self._lock:
+                self._data.clear()
+
+    def __len__(self):
+        return 0 if self._data is None else len(self._data)
+
+
+CON_DATA_CACHE = DecryptedDataCache(maxsize=CON_DATA_CACHE_SIZE)
+
+
+def decrypt_json(data: str) -> Any:
+    """Returns decrypted JSON data parsed, see DecryptedDataCache"""
+    return CON_DATA_CACHE.loads(data)
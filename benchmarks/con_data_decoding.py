@@ -0,0 +1,131 @@
+"""Group sources listing benchmark.
+
+Lists sources of one group by read_group_sources against SQLite database
+with con_data decrypted on every call (cache off) and taken from the LRU
+cache of decrypted con_data (cache on, first listing fills the cache).
+
+Usage (from the repository root):
+    PYTHONPATH=app python -m benchmarks.con_data_decoding --sources 1000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from unittest import mock
+
+os.environ.setdefault(
+    "CRYPTO_KEY", "ZmDfcTF7_60GrrY167zsiPd67pEvs0aGOv2oasOM1Pg="
+)
+
+
+def generate_con_data(idx: int) -> dict:
+    return {
+        "db_type": "postgresql",
+        "host": f"db-{idx}.local",
+        "port": 5432,
+        "user": "dataflow",
+        "password": f"password-{idx}",
+        "db_name": "inventory",
+        "db_table": f"table_{idx}",
+        "source_data_columns": [f"column_{col}" for col in range(20)],
+        "filters": [{"column": "column_0", "operator": "eq", "value": idx}],
+    }
+
+
+async def list_sources(session_maker, group_id: int, repeat: int) -> list:
+    from v3.routers.groups.groups import read_group_sources
+
+    timings = []
+    for _ in range(repeat):
+        async with session_maker() as session:
+            started = time.perf_counter()
+            await read_group_sources(group_id, session)
+            timings.append(time.perf_counter() - started)
+    return timings
+
+
+async def run_async(sources: int, repeat: int, cache_size: int) -> list[dict]:
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from v3.database.schemas import Base, Source, SourceGroup
+    from v3.routers.groups.models import SourceMappingTypes
+    from v3.routers.sources.models.general_model import SourceType
+    from v3.utils import encryption_utils
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with session_maker() as session:
+        group = SourceGroup(
+            name="Benchmark", source_type=SourceMappingTypes.PM_DATA.value
+        )
+        session.add(group)
+        await session.commit()
+        for idx in range(sources):
+            session.add(
+                Source(
+                    name=f"Benchmark {idx}",
+                    con_type=SourceType.DB.value,
+                    con_data=generate_con_data(idx),
+                    group_id=group.id,
+                )
+            )
+        await session.commit()
+
+    results = []
+    for name, size in (("off", 0), ("on", cache_size)):
+        cache = encryption_utils.DecryptedDataCache(maxsize=size)
+        with mock.patch.object(encryption_utils, "CON_DATA_CACHE", cache):
+            timings = await list_sources(session_maker, group.id, repeat)
+        best = min(timings)
+        results.append(
+            {
+                "cache": name,
+                "sources": sources,
+                "first_seconds": round(timings[0], 4),
+                "best_seconds": round(best, 4),
+                "sources_per_sec": round(sources / best, 1),
+            }
+        )
+    await engine.dispose()
+    return results
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sources", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--cache-size", type=int, default=1024, help="LRU size of cache on"
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run_async(args.sources, args.repeat, args.cache_size))
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return
+
+    print(
+        f"{'cache':<6} {'sources':>8} {'first s':>8} {'best s':>8} "
+        f"{'sources/s':>11}"
+    )
+    for result in results:
+        print(
+            f"{result['cache']:<6} {result['sources']:>8} "
+            f"{result['first_seconds']:>8} {result['best_seconds']:>8} "
+            f"{result['sources_per_sec']:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
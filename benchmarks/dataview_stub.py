@@ -0,0 +1,96 @@
+"""In-process stand-in for MS DATAVIEW MANAGER DataCarrier service.
+
+Accepts every request, records what was received and discards the rows,
+so loads can be measured without a running dataview-manager.
+"""
+
+import time
+from dataclasses import dataclass, field
+
+import grpc
+
+from v3.grpc_config.dataflow_to_dataview.proto.data_carrier_pb2 import (
+    Response,
+    ResponseIsDestinationUsed,
+)
+from v3.grpc_config.dataflow_to_dataview.proto.data_carrier_pb2_grpc import (
+    DataCarrierServicer,
+    add_DataCarrierServicer_to_server,
+)
+
+
+@dataclass
+class ReceivedData:
+    rows: int = 0
+    bytes: int = 0
+    insert_calls: int = 0
+    # seconds between consecutive rows of the same InsertData call
+    row_gaps: list[float] = field(default_factory=list)
+    first_row_at: float | None = None
+    last_row_at: float | None = None
+
+
+class RecordingDataCarrierServicer(DataCarrierServicer):
+    def __init__(self):
+        self.groups: dict[int, str] = {}
+        self.sources: dict[int, str] = {}
+        self.columns: dict[int, list | dict] = {}
+        self.data: dict[int, ReceivedData] = {}
+
+    async def CreateSourceGroup(self, request, context):
+        self.groups[request.group_id] = request.name
+        return Response(status="OK")
+
+    async def CreateSource(self, request, context):
+        self.sources[request.source_id] = request.name
+        return Response(status="OK")
+
+    async def ConfigSource(self, request, context):
+        self.columns[request.source_id] = list(request.columns)
+        return Response(status="OK")
+
+    async def ConfigSourceWithTypes(self, request, context):
+        self.columns[request.source_id] = dict(request.columns)
+        return Response(status="OK")
+
+    async def InsertData(self, request_iterator, context):
+        previous = None
+        async for request in request_iterator:
+            now = time.perf_counter()
+            received = self.data.setdefault(request.source_id, ReceivedData())
+            if previous is None:
+                received.insert_calls += 1
+                if received.first_row_at is None:
+                    received.first_row_at = now
+            else:
+                received.row_gaps.append(now - previous)
+            received.rows += 1
+            received.bytes += request.ByteSize()
+            received.last_row_at = now
+            previous = now
+        return Response(status="OK")
+
+    async def DeleteGroup(self, request, context):
+        self.groups.pop(request.group_id, None)
+        return Response(status="OK")
+
+    async def DeleteSource(self, request, context):
+        self.sources.pop(request.source_id, None)
+        self.data.pop(request.source_id, None)
+        return Response(status="OK")
+
+    async def IsDestinationUsed(self, request, context):
+        return ResponseIsDestinationUsed(is_used=False)
+
+
+async def start_dataview_stub(
+    host: str = "127.0.0.1",
+) -> tuple[grpc.aio.Server, str, RecordingDataCarrierServicer]:
+    """Starts stand-in server on a free port, returns server, its address
+    and servicer with recorded data"""
+    servicer = RecordingDataCarrierServicer()
+    server = grpc.aio.server()
+    add_DataCarrierServicer_to_server(servicer, server)
+    port = server.add_insecure_port(f"{host}:0")
+    await server.start()
+    return server, f"{host}:{port}", servicer
@@ -0,0 +1,306 @@
+"""End-to-end load throughput benchmark.
+
+Runs load_data_process for Manual file, SFTP and DB sources against local
+stand-ins (in-memory MinIO, paramiko SFTP server, SQLite database) and the
+recording DataCarrier stub instead of MS DATAVIEW MANAGER.
+
+Each scenario runs in its own process so peak RSS is not shared.
+
+Usage (from the repository root):
+    PYTHONPATH=app python -m benchmarks.load_throughput --rows 100000
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+os.environ.setdefault(
+    "CRYPTO_KEY", "ZmDfcTF7_60GrrY167zsiPd67pEvs0aGOv2oasOM1Pg="
+)
+
+SCENARIOS = ("manual", "sftp", "db")
+BENCH_TABLE = "bench"
+BENCH_FILE = "bench.csv"
+
+
+def generate_dataframe(rows: int, columns: int) -> pd.DataFrame:
+    """Returns DataFrame with id column and mixed int/float/str columns"""
+    rng = np.random.default_rng(0)
+    data = {"id": np.arange(rows)}
+    for idx in range(columns - 1):
+        match idx % 3:
+            case 0:
+                data[f"int_{idx}"] = rng.integers(0, 1_000_000, rows)
+            case 1:
+                data[f"float_{idx}"] = rng.random(rows).round(6)
+            case 2:
+                data[f"str_{idx}"] = [f"value_{v}" for v in range(rows)]
+    return pd.DataFrame(data)
+
+
+class TimedSourceManager:
+    """Proxy recording time spent producing each DataRequest"""
+
+    def __init__(self, source_manager, extract_gaps: list[float]):
+        self._source_manager = source_manager
+        self._extract_gaps = extract_gaps
+
+    def __getattr__(self, item):
+        return getattr(self._source_manager, item)
+
+    def get_source_data_for_grpc(self, source_id: int):
+        iterator = self._source_manager.get_source_data_for_grpc(source_id)
+        while True:
+            started = time.perf_counter()
+            try:
+                request = next(iterator)
+            except StopIteration:
+                return
+            self._extract_gaps.append(time.perf_counter() - started)
+            yield request
+
+
+def percentiles(values: list[float]) -> dict[str, float]:
+    if len(values) < 2:
+        return {"p50_ms": 0.0, "p99_ms": 0.0}
+    quantiles = statistics.quantiles(values, n=100)
+    return {
+        "p50_ms": round(quantiles[49] * 1000, 4),
+        "p99_ms": round(quantiles[98] * 1000, 4),
+    }
+
+
+@contextlib.contextmanager
+def manual_source(df: pd.DataFrame, sources: int, work_dir: str):
+    from benchmarks.source_stubs import InMemoryMinio
+    from v3.config import MINIO_BUCKET
+
+    client = InMemoryMinio()
+    data = df.to_csv(index=False).encode()
+    for source_id in range(1, sources + 1):
+        client.objects[(MINIO_BUCKET, f"{source_id}/{BENCH_FILE}")] = data
+
+    with mock.patch(
+        "v3.routers.sources.sources_managers.utils.minio_client",
+        return_value=client,
+    ):
+        yield {"import_type": "Manual", "filename": BENCH_FILE}
+
+
+@contextlib.contextmanager
+def sftp_source(df: pd.DataFrame, sources: int, work_dir: str):
+    from benchmarks.source_stubs import LocalSFTPServer
+
+    root_dir = os.path.join(work_dir, "sftp")
+    os.makedirs(root_dir)
+    df.to_csv(os.path.join(root_dir, BENCH_FILE), index=False)
+    # SFTPSourceManager downloads files into ./temp
+    os.makedirs(os.path.join(work_dir, "temp"))
+    cwd = os.getcwd()
+    os.chdir(work_dir)
+    # pysftp warns about missing known_hosts, host keys are not checked
+    warnings.filterwarnings("ignore", module="pysftp")
+    try:
+        with LocalSFTPServer(root_dir) as server:
+            yield {
+                "import_type": "SFTP",
+                "host": server.host,
+                "port": server.port,
+                "login": "bench",
+                "password": "bench",
+                "file": {"file_path": "/", "file_name": BENCH_FILE},
+            }
+    finally:
+        os.chdir(cwd)
+
+
+@contextlib.contextmanager
+def db_source(df: pd.DataFrame, sources: int, work_dir: str):
+    from sqlalchemy import create_engine
+
+    engine = create_engine(
+        f"sqlite:///{os.path.join(work_dir, 'bench.db')}",
+        connect_args={"check_same_thread": False},
+    )
+    df.to_sql(BENCH_TABLE, engine, index=False)
+    with mock.patch(
+        "v3.routers.sources.sources_managers.db_manager.create_engine",
+        return_value=engine,
+    ):
+        yield {
+            "db_type": "postgresql",
+            "host": "localhost",
+            "port": 5432,
+            "user": "bench",
+            "password": "bench",
+            "db_name": "bench",
+            "db_table": BENCH_TABLE,
+        }
+    engine.dispose()
+
+
+async def run_scenario_async(
+    scenario: str, rows: int, columns: int, sources: int
+) -> dict:
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from benchmarks.dataview_stub import start_dataview_stub
+    from v3.database.schemas import Base, Source, SourceGroup
+    from v3.grpc_config import dataview_manager_utils
+    from v3.grpc_config.dataflow_to_dataview import client as dataview_client
+    from v3.routers.groups.models import SourceMappingTypes
+    from v3.routers.sources.models.general_model import SourceType
+
+    source_fixtures = {
+        "manual": (manual_source, SourceType.FILE),
+        "sftp": (sftp_source, SourceType.FILE),
+        "db": (db_source, SourceType.DB),
+    }
+    fixture, source_type = source_fixtures[scenario]
+    df = generate_dataframe(rows, columns)
+
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_maker = sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    server, address, servicer = await start_dataview_stub()
+    extract_gaps: list[float] = []
+    get_source_manager = dataview_manager_utils.get_source_manager
+
+    with (
+        tempfile.TemporaryDirectory() as work_dir,
+        fixture(df, sources, work_dir) as con_data,
+        mock.patch.object(dataview_client, "DATAVIEW_GRPC_URL", address),
+        mock.patch.object(
+            dataview_manager_utils,
+            "get_source_manager",
+            lambda source: TimedSourceManager(
+                get_source_manager(source), extract_gaps
+            ),
+        ),
+    ):
+        async with session_maker() as session:
+            group = SourceGroup(
+                name="Benchmark", source_type=SourceMappingTypes.PM_DATA.value
+            )
+            session.add(group)
+            await session.commit()
+            loaded_sources = []
+            for idx in range(sources):
+                source = Source(
+                    name=f"Benchmark {scenario} {idx}",
+                    con_type=source_type.value,
+                    con_data=con_data,
+                    group_id=group.id,
+                )
+                session.add(source)
+                loaded_sources.append(source)
+            await session.commit()
+
+            started = time.perf_counter()
+            for source in loaded_sources:
+                await dataview_manager_utils.load_data_process(
+                    group, source, session
+                )
+            elapsed = time.perf_counter() - started
+
+    await dataview_client.DataviewClient.close()
+    await server.stop(None)
+    await engine.dispose()
+
+    received_rows = sum(data.rows for data in servicer.data.values())
+    received_bytes = sum(data.bytes for data in servicer.data.values())
+    deliver_gaps = [
+        gap for data in servicer.data.values() for gap in data.row_gaps
+    ]
+    return {
+        "scenario": scenario,
+        "sources": sources,
+        "rows": received_rows,
+        "columns": columns,
+        "seconds": round(elapsed, 4),
+        "rows_per_sec": round(received_rows / elapsed, 1),
+        "bytes_per_sec": round(received_bytes / elapsed, 1),
+        "extract": percentiles(extract_gaps),
+        "deliver": percentiles(deliver_gaps),
+        # ru_maxrss is reported in kilobytes on Linux
+        "peak_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1
+        ),
+    }
+
+
+def run_scenario(scenario: str, rows: int, columns: int, sources: int):
+    return asyncio.run(run_scenario_async(scenario, rows, columns, sources))
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument(
+        "--sources", type=int, default=1, help="sources loaded per scenario"
+    )
+    parser.add_argument(
+        "--scenario", choices=SCENARIOS, action="append", dest="scenarios"
+    )
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    args = parser.parse_args(argv)
+
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for scenario in args.scenarios or SCENARIOS:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results.append(
+                pool.submit(
+                    run_scenario,
+                    scenario,
+                    args.rows,
+                    args.columns,
+                    args.sources,
+                ).result()
+            )
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return
+
+    header = (
+        f"{'scenario':<8} {'rows':>9} {'sec':>8} {'rows/s':>10} "
+        f"{'MB/s':>7} {'extract p50/p99 ms':>20} {'deliver p50/p99 ms':>20} "
+        f"{'RSS MB':>7}"
+    )
+    print(header)
+    for result in results:
+        extract, deliver = result["extract"], result["deliver"]
+        print(
+            f"{result['scenario']:<8} {result['rows']:>9} "
+            f"{result['seconds']:>8} {result['rows_per_sec']:>10} "
+            f"{result['bytes_per_sec'] / 2**20:>7.2f} "
+            f"{extract['p50_ms']:>9}/{extract['p99_ms']:<10} "
+            f"{deliver['p50_ms']:>9}/{deliver['p99_ms']:<10} "
+            f"{result['peak_rss_mb']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
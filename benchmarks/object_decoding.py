@@ -0,0 +1,130 @@
+"""Inventory object page decoding benchmark.
+
+Compares wire size and client-side decode time of one page of inventory
+objects sent as hex-pickle rows (MOInfoClient legacy format), JSON rows
+(DataflowManagerClient legacy format) and msgpack batches.
+
+Usage (from the repository root):
+    PYTHONPATH=app python -m benchmarks.object_decoding --objects 5000
+"""
+
+import argparse
+import datetime
+import json
+import pickle
+import sys
+import time
+
+from v3.grpc_config.mo_info.mo_info_pb2 import ResponseObjWithParamsLimited
+from v3.grpc_config.object_batch import (
+    MSGPACK_ENCODING,
+    decode_objects,
+    encode_msgpack_batch,
+    loads_hex_pickle,
+)
+
+
+def generate_objects(count: int, params: int) -> list[dict]:
+    created = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    objects = []
+    for idx in range(count):
+        obj = {
+            "id": idx,
+            "name": f"object_{idx}",
+            "tmo_id": 1,
+            "p_id": idx // 10 or None,
+            "active": True,
+            "creation_date": created + datetime.timedelta(seconds=idx),
+        }
+        for param in range(params):
+            obj[f"param_{param}"] = (
+                f"value_{idx}_{param}" if param % 2 else idx * 0.5 + param
+            )
+        objects.append(obj)
+    return objects
+
+
+def encode_page(objects: list[dict], encoding: str, batch_size: int):
+    """Returns serialized stream messages as they are received by client"""
+    match encoding:
+        case "hex-pickle":
+            messages = [
+                ResponseObjWithParamsLimited(data=pickle.dumps(obj).hex())
+                for obj in objects
+            ]
+        case "json":
+            messages = [
+                ResponseObjWithParamsLimited(data=json.dumps(obj, default=str))
+                for obj in objects
+            ]
+        case _:
+            messages = [
+                ResponseObjWithParamsLimited(
+                    encoding=MSGPACK_ENCODING,
+                    data_batch=encode_msgpack_batch(
+                        objects[idx : idx + batch_size]
+                    ),
+                )
+                for idx in range(0, len(objects), batch_size)
+            ]
+    return [message.SerializeToString() for message in messages]
+
+
+def measure(wire: list[bytes], encoding: str, repeat: int) -> float:
+    loads_single = json.loads if encoding == "json" else loads_hex_pickle
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        decode_objects(
+            (ResponseObjWithParamsLimited.FromString(raw) for raw in wire),
+            loads_single,
+        )
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=5000)
+    parser.add_argument("--params", type=int, default=10)
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="objects per msgpack batch"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    args = parser.parse_args(argv)
+
+    objects = generate_objects(args.objects, args.params)
+    results = []
+    for encoding in ("hex-pickle", "json", MSGPACK_ENCODING):
+        wire = encode_page(objects, encoding, args.batch_size)
+        seconds = measure(wire, encoding, args.repeat)
+        results.append(
+            {
+                "encoding": encoding,
+                "messages": len(wire),
+                "wire_bytes": sum(len(raw) for raw in wire),
+                "decode_seconds": round(seconds, 4),
+                "objects_per_sec": round(args.objects / seconds, 1),
+            }
+        )
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return
+
+    print(
+        f"{'encoding':<11} {'messages':>8} {'wire MB':>8} "
+        f"{'decode s':>9} {'objects/s':>11}"
+    )
+    for result in results:
+        print(
+            f"{result['encoding']:<11} {result['messages']:>8} "
+            f"{result['wire_bytes'] / 2**20:>8.2f} "
+            f"{result['decode_seconds']:>9} {result['objects_per_sec']:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
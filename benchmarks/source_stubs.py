@@ -0,0 +1,188 @@
+"""Local stand-ins for remote data sources used by benchmarks:
+in-memory MinIO client, paramiko SFTP server and SQLite database.
+"""
+
+import hashlib
+import io
+import os
+import socket
+import threading
+
+import paramiko
+from minio import Minio
+from minio.datatypes import Object
+from minio.error import S3Error
+
+
+class InMemoryObject:
+    """Mimics urllib3 response returned by Minio.get_object"""
+
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+        self.data = data
+
+    def read(self, amt: int | None = None) -> bytes:
+        return self._buffer.read(amt)
+
+    def stream(self, amt: int = 64 * 1024):
+        while chunk := self._buffer.read(amt):
+            yield chunk
+
+    def close(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+
+class InMemoryMinio(Minio):
+    """MinIO-compatible client keeping objects in memory"""
+
+    def __init__(self):
+        super().__init__("localhost:9000", "bench", "bench", secure=False)
+        self.objects: dict[tuple[str, str], bytes] = {}
+
+    def _no_such_key(self, bucket_name: str, object_name: str):
+        return S3Error(
+            "NoSuchKey",
+            "Object does not exist",
+            object_name,
+            None,
+            None,
+            None,
+            bucket_name=bucket_name,
+            object_name=object_name,
+        )
+
+    def get_object(
+        self,
+        bucket_name: str,
+        object_name: str,
+        offset: int = 0,
+        length: int = 0,
+        *args,
+        **kwargs,
+    ):
+        data = self.objects.get((bucket_name, object_name))
+        if data is None:
+            raise self._no_such_key(bucket_name, object_name)
+        end = offset + length if length else None
+        return InMemoryObject(data[offset:end])
+
+    def stat_object(self, bucket_name: str, object_name: str, **kwargs):
+        data = self.objects.get((bucket_name, object_name))
+        if data is None:
+            raise self._no_such_key(bucket_name, object_name)
+        return Object(
+            bucket_name,
+            object_name,
+            size=len(data),
+            etag=hashlib.md5(data, usedforsecurity=False).hexdigest(),
+        )
+
+    def put_object(
+        self, bucket_name: str, object_name: str, data, length: int, **kwargs
+    ):
+        self.objects[(bucket_name, object_name)] = data.read(length)
+
+    def remove_object(self, bucket_name: str, object_name: str, **kwargs):
+        self.objects.pop((bucket_name, object_name), None)
+
+
+class _SFTPServerAuth(paramiko.ServerInterface):
+    def check_auth_password(self, username, password):
+        return paramiko.AUTH_SUCCESSFUL
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_channel_request(self, kind, chanid):
+        return paramiko.OPEN_SUCCEEDED
+
+
+class _SFTPHandle(paramiko.SFTPHandle):
+    def stat(self):
+        return paramiko.SFTPAttributes.from_stat(
+            os.fstat(self.readfile.fileno())
+        )
+
+
+class _LocalDirSFTPServer(paramiko.SFTPServerInterface):
+    """Read-only SFTP server exposing local directory as its root"""
+
+    root: str = "/"
+
+    def _local_path(self, path: str) -> str:
+        path = self.canonicalize(path)
+        return os.path.join(self.root, path.lstrip("/"))
+
+    def canonicalize(self, path):
+        return os.path.normpath(os.path.join("/", path))
+
+    def list_folder(self, path):
+        local_path = self._local_path(path)
+        result = []
+        for name in os.listdir(local_path):
+            attrs = paramiko.SFTPAttributes.from_stat(
+                os.stat(os.path.join(local_path, name))
+            )
+            attrs.filename = name
+            result.append(attrs)
+        return result
+
+    def stat(self, path):
+        try:
+            return paramiko.SFTPAttributes.from_stat(
+                os.stat(self._local_path(path))
+            )
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+
+    lstat = stat
+
+    def open(self, path, flags, attr):
+        try:
+            file = open(self._local_path(path), "rb")
+        except OSError as e:
+            return paramiko.SFTPServer.convert_errno(e.errno)
+        handle = _SFTPHandle(flags)
+        handle.filename = path
+        handle.readfile = file
+        return handle
+
+
+class LocalSFTPServer:
+    """paramiko SFTP server on localhost serving files from root_dir"""
+
+    def __init__(self, root_dir: str, host: str = "127.0.0.1"):
+        self.root_dir = root_dir
+        self.host_key = paramiko.RSAKey.generate(2048)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((host, 0))
+        self._socket.listen(16)
+        self.host, self.port = self._socket.getsockname()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._socket.close()
+
+    def _serve(self):
+        server_class = type(
+            "SFTPServer", (_LocalDirSFTPServer,), {"root": self.root_dir}
+        )
+        while True:
+            try:
+                client, _ = self._socket.accept()
+            except OSError:
+                return
+            transport = paramiko.Transport(client)
+            transport.add_server_key(self.host_key)
+            transport.set_subsystem_handler(
+                "sftp", paramiko.SFTPServer, server_class
+            )
+            transport.start_server(server=_SFTPServerAuth())
@@ -0,0 +1,34 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from v3.database.schemas import Source, SourceGroup
+from v3.routers.groups.models import SourceMappingTypes
+
+
+@pytest_asyncio.fixture(name="group")
+async def group_fixture(session: AsyncSession):
+    group = SourceGroup(
+        name="Test group", source_type=SourceMappingTypes.PM_DATA.value
+    )
+    session.add(group)
+    await session.commit()
+    return group
+
+
+@pytest.fixture(name="create_source")
+def create_source_fixture(session: AsyncSession, group: SourceGroup):
+    """Returns coroutine function saving source of the test group"""
+
+    async def create_source(
+        con_type: str, con_data: dict, name: str = "Test source"
+    ) -> Source:
+        source = Source(
+            name=name, con_type=con_type, con_data=con_data, group_id=group.id
+        )
+        session.add(source)
+        await session.commit()
+        await session.refresh(source)
+        return source
+
+    return create_source
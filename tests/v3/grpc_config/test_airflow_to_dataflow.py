@@ -0,0 +1,93 @@
+import json
+
+import grpc
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from v3.database.schemas import Destination
+from v3.grpc_config.airflow_to_dataflow import servicer
+from v3.grpc_config.airflow_to_dataflow.config_cache import ConfigCache
+from v3.grpc_config.airflow_to_dataflow.proto.airflow_to_dataflow_pb2 import (
+    RequestGetConfigurationCacheStats,
+    RequestGetConfigurations,
+    RequestGetSourceConfiguration,
+)
+from v3.routers.sources.models.general_model import SourceType
+
+from ..conftest import ENGINE
+from .utils import FakeContext
+
+
+@pytest_asyncio.fixture(name="configs")
+async def configs_fixture(session: AsyncSession, create_source, monkeypatch):
+    monkeypatch.setattr(servicer, "engine", ENGINE)
+    monkeypatch.setattr(servicer, "CONFIG_CACHE", ConfigCache(maxsize=16))
+    source = await create_source(
+        SourceType.FILE.value,
+        {"import_type": "Manual", "file_name": "data.csv"},
+        name="File source",
+    )
+    destination = Destination(
+        name="Destination", con_type="SFTP", con_data={"host": "sftp.local"}
+    )
+    session.add(destination)
+    await session.commit()
+    return source, destination
+
+
+async def get_configurations(source_ids, destination_ids) -> tuple:
+    response = await servicer.AirflowToDataflowManager().GetConfigurations(
+        RequestGetConfigurations(
+            source_ids=source_ids, destination_ids=destination_ids
+        ),
+        FakeContext(),
+    )
+    return (
+        {key: json.loads(data) for key, data in response.source_data.items()},
+        {
+            key: json.loads(data)
+            for key, data in response.destination_data.items()
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_configurations_are_cached_by_version(configs, session):
+    """TEST Configurations are returned in one call, taken from cache until
+    con_data is updated or deleted"""
+    source, destination = configs
+    manager = servicer.AirflowToDataflowManager()
+
+    for _ in range(2):
+        source_data, destination_data = await get_configurations(
+            [source.id], [destination.id]
+        )
+        assert source_data == {
+            source.id: {
+                "import_type": "Manual",
+                "file_name": f"{source.id}/data.csv",
+            }
+        }
+        assert destination_data == {destination.id: {"host": "sftp.local"}}
+    stats = servicer.CONFIG_CACHE.stats
+    assert (stats.hits, stats.misses, stats.size) == (2, 2, 2)
+
+    source.con_data = {"import_type": "Manual", "file_name": "new.csv"}
+    await session.commit()
+    response = await manager.GetSourceConfiguration(
+        RequestGetSourceConfiguration(source_id=source.id), FakeContext()
+    )
+    assert json.loads(response.source_data)["file_name"] == (
+        f"{source.id}/new.csv"
+    )
+
+    await session.delete(destination)
+    await session.commit()
+    with pytest.raises(grpc.RpcError):
+        await get_configurations([source.id], [destination.id])
+
+    stats = await manager.GetConfigurationCacheStats(
+        RequestGetConfigurationCacheStats(), FakeContext()
+    )
+    assert (stats.hits, stats.invalidations, stats.size) == (3, 2, 1)
@@ -0,0 +1,74 @@
+import pytest
+import pytest_asyncio
+import requests
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from v3.database.schemas import Source, SourceGroup
+from v3.grpc_config import dataview_manager_utils
+from v3.routers.sources.models.general_model import SourceType
+from v3.routers.sources.sources_managers import api_manager
+
+from ..sources_managers.utils import ITEMS, make_response
+from .utils import FakeDataviewClient
+
+CON_DATA = {
+    "end_point": "http://api.local/items",
+    "auth_type": "No authentication",
+    "auth_data": {},
+    "source_data_columns": ["id", "name"],
+}
+
+
+@pytest_asyncio.fixture(name="source")
+async def source_fixture(create_source):
+    return await create_source(SourceType.RESTAPI.value, CON_DATA)
+
+
+@pytest.fixture(name="api")
+def api_fixture(monkeypatch):
+    """API returning ITEMS with ETag, 304 if ETag is sent in If-None-Match"""
+    api = {"etag": '"v1"', "sent": []}
+
+    def request(session, method, url, headers=None, **kwargs):
+        headers = headers or {}
+        api["sent"].append(headers)
+        response = make_response(ITEMS, headers={"ETag": api["etag"]})
+        if headers.get("If-None-Match") == api["etag"]:
+            response.status_code = 304
+            response._content = b""
+        return response
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    yield api
+    api_manager.SESSIONS.clear()
+
+
+async def load(session, source, monkeypatch, force: bool = False) -> int:
+    client = FakeDataviewClient()
+    monkeypatch.setattr(dataview_manager_utils, "DataviewClient", client)
+    group = await session.get(SourceGroup, source.group_id)
+    loaded = await dataview_manager_utils.load_data_process(
+        group, source, session, force
+    )
+    assert loaded == bool(client.rows)
+    return len(client.rows)
+
+
+@pytest.mark.asyncio
+async def test_not_modified_source_is_not_loaded(
+    session: AsyncSession, source: Source, api, monkeypatch
+):
+    """TEST Load is skipped while API responds 304 to conditional request"""
+    assert await load(session, source, monkeypatch) == len(ITEMS)
+    # modified response is requested once for the check and the load
+    assert api["sent"] == [{}]
+
+    assert await load(session, source, monkeypatch) == 0
+    assert api["sent"][-1] == {"If-None-Match": '"v1"'}
+
+    api["etag"] = '"v2"'
+    assert await load(session, source, monkeypatch) == len(ITEMS)
+    assert await load(session, source, monkeypatch) == 0
+
+    assert await load(session, source, monkeypatch, force=True) == len(ITEMS)
+    assert api["sent"][-1] == {}
@@ -0,0 +1,99 @@
+import base64
+import io
+import pickle
+
+import grpc
+import pytest
+import pytest_asyncio
+from minio import Minio
+
+from v3.grpc_config.dag_manager import servicer
+from v3.grpc_config.dag_manager.proto.dag_manager_pb2 import (
+    RequestSourceConData,
+    RequestSourceFileContent,
+)
+from v3.routers.sources.models.general_model import SourceType
+
+from ..conftest import ENGINE
+from .utils import FakeContext
+
+FILE_DATA = b"id;name\n" + b"".join(
+    f"{idx};name_{idx}\n".encode() for idx in range(100)
+)
+CSV_CONTENT = FILE_DATA.replace(b";", b",")
+
+
+class FakeMinio(Minio):
+    def __init__(self):
+        super().__init__("localhost:9000", secure=False)
+
+    def get_object(self, bucket_name, object_name, **kwargs):
+        return io.BytesIO(FILE_DATA)
+
+
+@pytest_asyncio.fixture(name="sources")
+async def sources_fixture(create_source, monkeypatch):
+    monkeypatch.setattr(servicer, "engine", ENGINE)
+    monkeypatch.setattr(servicer, "minio_client", FakeMinio)
+    file_source = await create_source(
+        SourceType.FILE.value,
+        {"import_type": "Manual", "file_name": "data.csv"},
+        name="File source",
+    )
+    db_source = await create_source(
+        SourceType.DB.value, {"db_table": "events"}, name="DB source"
+    )
+    return file_source.id, db_source.id
+
+
+async def get_con_data(source_ids, without_content: bool = False) -> dict:
+    response = await servicer.DagManager().GetSourceConData(
+        RequestSourceConData(
+            sources=source_ids, without_content=without_content
+        ),
+        FakeContext(),
+    )
+    return {
+        source_id: pickle.loads(bytes.fromhex(data))
+        for source_id, data in response.con_data.items()
+    }
+
+
+@pytest.mark.asyncio
+async def test_con_data_of_sources_is_returned(sources):
+    """TEST con_data of all sources is returned, file content is added
+    unless it is requested separately"""
+    file_id, db_id = sources
+    con_data = await get_con_data([file_id, db_id])
+
+    assert con_data[db_id] == {
+        "db_table": "events",
+        "con_type": SourceType.DB.value,
+    }
+    assert base64.b64decode(con_data[file_id]["content"]) == CSV_CONTENT
+    assert "content" not in (await get_con_data([file_id], True))[file_id]
+
+    with pytest.raises(grpc.RpcError):
+        await get_con_data([file_id, db_id + 100])
+
+
+@pytest.mark.asyncio
+async def test_file_content_is_streamed_by_parts(sources, monkeypatch):
+    """TEST File content is streamed as CSV in limited messages"""
+    monkeypatch.setattr(servicer, "FILE_CONTENT_MESSAGE_SIZE", 64)
+    file_id, db_id = sources
+
+    messages = [
+        message.content
+        async for message in servicer.DagManager().GetSourceFileContent(
+            RequestSourceFileContent(source_id=file_id), FakeContext()
+        )
+    ]
+    assert b"".join(messages) == CSV_CONTENT
+    assert max(len(content) for content in messages) == 64
+
+    with pytest.raises(grpc.RpcError):
+        async for _ in servicer.DagManager().GetSourceFileContent(
+            RequestSourceFileContent(source_id=db_id), FakeContext()
+        ):
+            pass
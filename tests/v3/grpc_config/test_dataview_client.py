@@ -0,0 +1,70 @@
+import grpc
+import pytest
+import pytest_asyncio
+
+from v3.grpc_config.dataflow_to_dataview import client as client_module
+from v3.grpc_config.dataflow_to_dataview.client import DataviewClient
+from v3.grpc_config.dataflow_to_dataview.proto.data_carrier_pb2 import (
+    Response,
+)
+from v3.grpc_config.dataflow_to_dataview.proto.data_carrier_pb2_grpc import (
+    DataCarrierServicer,
+    add_DataCarrierServicer_to_server,
+)
+
+
+class RecordingServicer(DataCarrierServicer):
+    def __init__(self):
+        self.calls = []
+
+    async def CreateSourceGroup(self, request, context):
+        self.calls.append(("CreateSourceGroup", request.group_id))
+        return Response(status="OK")
+
+    async def DeleteSource(self, request, context):
+        self.calls.append(("DeleteSource", request.source_id))
+        return Response(status="OK")
+
+
+@pytest_asyncio.fixture(name="servicer")
+async def servicer_fixture(monkeypatch):
+    servicer = RecordingServicer()
+    server = grpc.aio.server()
+    add_DataCarrierServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    monkeypatch.setattr(client_module, "DATAVIEW_GRPC_URL", f"127.0.0.1:{port}")
+    yield servicer
+    await DataviewClient.close()
+    await server.stop(None)
+
+
+@pytest.mark.asyncio
+async def test_calls_share_one_channel_closed_on_shutdown(
+    servicer, monkeypatch
+):
+    """TEST All calls reuse one channel, close() closes and drops it"""
+    channels = []
+    insecure_channel = grpc.aio.insecure_channel
+
+    def create_channel(*args, **kwargs):
+        channels.append(insecure_channel(*args, **kwargs))
+        return channels[-1]
+
+    monkeypatch.setattr(grpc.aio, "insecure_channel", create_channel)
+
+    await DataviewClient.create_source_group(group_id=1, name="group")
+    await DataviewClient.delete_source(source_id=2)
+    await DataviewClient.delete_source(source_id=3)
+
+    assert len(channels) == 1
+    assert servicer.calls == [
+        ("CreateSourceGroup", 1),
+        ("DeleteSource", 2),
+        ("DeleteSource", 3),
+    ]
+
+    await DataviewClient.close()
+
+    assert DataviewClient._channel is None
+    assert channels[0].get_state() == grpc.ChannelConnectivity.SHUTDOWN
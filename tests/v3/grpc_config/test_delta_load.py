@@ -0,0 +1,135 @@
+import pytest
+
+from v3.grpc_config.dataflow_to_dataview.proto.data_carrier_pb2 import (
+    DataRequest,
+)
+from v3.grpc_config.delta_load import (
+    DeltaLoadFilter,
+    RowHashSnapshot,
+    RowOperation,
+)
+from v3.routers.sources.utils.exceptions import ValidationError
+
+SOURCE_ID = 1
+KEY_COLUMNS = ["id"]
+
+
+def get_requests(rows: list[dict]):
+    for row in rows:
+        yield DataRequest(source_id=SOURCE_ID, data_row=row)
+
+
+def run_load(rows: list[dict], previous: RowHashSnapshot | None):
+    delta_filter = DeltaLoadFilter(
+        SOURCE_ID, KEY_COLUMNS, previous, chunk_size=2
+    )
+    sent = [
+        (request.operation, dict(request.data_row))
+        for request in delta_filter.filter(get_requests(rows))
+    ]
+    return sent, delta_filter.snapshot
+
+
+def test_first_load_sends_all_rows_as_inserts():
+    """TEST Without previous snapshot every row is inserted"""
+    rows = [{"id": str(idx), "value": "a"} for idx in range(5)]
+    sent, snapshot = run_load(rows, previous=None)
+
+    assert sent == [(RowOperation.INSERT.value, row) for row in rows]
+    assert len(snapshot) == len(rows)
+
+
+def test_reload_sends_only_changed_rows():
+    """TEST Reload sends inserted, updated and deleted rows only"""
+    rows = [{"id": str(idx), "value": "a"} for idx in range(5)]
+    _, snapshot = run_load(rows, previous=None)
+    snapshot = RowHashSnapshot.from_bytes(snapshot.to_bytes())
+
+    new_rows = [
+        {"id": "0", "value": "a"},
+        {"id": "1", "value": "b"},
+        {"id": "2", "value": "a"},
+        {"id": "4", "value": "a"},
+        {"id": "5", "value": "a"},
+    ]
+    sent, new_snapshot = run_load(new_rows, previous=snapshot)
+
+    assert sent == [
+        (RowOperation.UPDATE.value, {"id": "1", "value": "b"}),
+        (RowOperation.INSERT.value, {"id": "5", "value": "a"}),
+        (RowOperation.DELETE.value, {"id": "3"}),
+    ]
+    assert len(new_snapshot) == len(new_rows)
+
+
+def test_unchanged_reload_sends_nothing():
+    """TEST Reload of the same rows in another order sends nothing"""
+    rows = [{"id": str(idx), "value": str(idx)} for idx in range(5)]
+    _, snapshot = run_load(rows, previous=None)
+
+    sent, _ = run_load(list(reversed(rows)), previous=snapshot)
+    assert sent == []
+
+
+def test_delta_is_streamed_with_running_count():
+    """TEST Delta rows are passed as their chunk is hashed, count is number
+    of delta requests sent so far"""
+    rows = [{"id": str(idx), "value": "a"} for idx in range(5)]
+    _, snapshot = run_load(rows, previous=None)
+
+    delta_filter = DeltaLoadFilter(
+        SOURCE_ID, KEY_COLUMNS, snapshot, chunk_size=2
+    )
+    new_rows = [{"id": "0", "value": "b"}] + [
+        {"id": str(idx), "value": "a"} for idx in range(1, 100)
+    ]
+    pulled = []
+    sent = delta_filter.filter(
+        pulled.append(request) or request for request in get_requests(new_rows)
+    )
+
+    assert next(sent).data_row["id"] == "0"
+    assert len(pulled) == 2
+    assert [request.count for request in sent] == list(range(2, 97))
+
+
+def test_full_load_is_tracked_for_next_delta():
+    """TEST Full load passes all rows unchanged and keeps their snapshot"""
+    rows = [{"id": str(idx), "value": "a"} for idx in range(5)]
+    delta_filter = DeltaLoadFilter(SOURCE_ID, KEY_COLUMNS, previous=None)
+
+    sent = list(delta_filter.track(get_requests(rows)))
+    assert [dict(request.data_row) for request in sent] == rows
+    assert not any(request.HasField("operation") for request in sent)
+
+    unchanged, _ = run_load(rows, previous=delta_filter.snapshot)
+    assert unchanged == []
+
+
+def test_long_and_null_keys_are_kept():
+    """TEST Keys of any length and null keys are restored for deletes"""
+    delta_filter = DeltaLoadFilter(SOURCE_ID, ["id", "part"], previous=None)
+    rows = [
+        {"id": "x" * 1000, "part": "1"},
+        {"id": "short"},
+    ]
+    list(delta_filter.filter(get_requests(rows)))
+    snapshot = RowHashSnapshot.from_bytes(delta_filter.snapshot.to_bytes())
+
+    delta_filter = DeltaLoadFilter(SOURCE_ID, ["id", "part"], snapshot)
+    sent = [
+        dict(request.data_row)
+        for request in delta_filter.filter(get_requests([]))
+    ]
+    assert sorted(sent, key=len) == [{"id": "short"}, rows[0]]
+
+
+def test_duplicated_keys_are_rejected():
+    """TEST Delta load with non-unique key fails when the source is read,
+    no snapshot is built"""
+    rows = [{"id": "1", "value": "a"}, {"id": "1", "value": "b"}]
+    delta_filter = DeltaLoadFilter(SOURCE_ID, KEY_COLUMNS, previous=None)
+
+    with pytest.raises(ValidationError):
+        list(delta_filter.filter(get_requests(rows)))
+    assert delta_filter.snapshot is None
@@ -0,0 +1,120 @@
+import grpc
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from v3.database.schemas import Source, SourceLoadState
+from v3.grpc_config import dataview_manager_utils
+from v3.grpc_config.dataflow_to_dataview.proto.data_carrier_pb2 import (
+    DataRequest,
+)
+from v3.routers.sources.models.general_model import SourceType
+
+from .utils import FakeDataviewClient
+
+ROWS_COUNT = 25
+SEGMENT_SIZE = 10
+
+
+def get_requests(source_id: int):
+    for idx in range(ROWS_COUNT):
+        yield DataRequest(
+            source_id=source_id, count=ROWS_COUNT, data_row={"idx": str(idx)}
+        )
+
+
+@pytest_asyncio.fixture(name="source")
+async def source_fixture(create_source):
+    return await create_source(SourceType.DB.value, {})
+
+
+@pytest.mark.asyncio
+async def test_load_resumes_from_last_acknowledged_segment(
+    session: AsyncSession, source: Source, monkeypatch
+):
+    """TEST Retry of failed load sends only rows after the last checkpoint"""
+    failing_client = FakeDataviewClient(fail_after=SEGMENT_SIZE + 5)
+    monkeypatch.setattr(
+        dataview_manager_utils, "DataviewClient", failing_client
+    )
+    with pytest.raises(grpc.RpcError):
+        await dataview_manager_utils.load_data_with_checkpoints(
+            session, source, get_requests(source.id), SEGMENT_SIZE
+        )
+
+    state = await session.get(SourceLoadState, source.id)
+    assert state.acked_offset == SEGMENT_SIZE
+    assert state.is_finished is False
+
+    client = FakeDataviewClient()
+    monkeypatch.setattr(dataview_manager_utils, "DataviewClient", client)
+    await dataview_manager_utils.load_data_with_checkpoints(
+        session, source, get_requests(source.id), SEGMENT_SIZE
+    )
+
+    assert [row.sequence for row in client.rows] == list(
+        range(SEGMENT_SIZE, ROWS_COUNT)
+    )
+    assert {row.load_id for row in client.rows} == {state.load_id}
+    assert client.rows[0].data_row["idx"] == str(SEGMENT_SIZE)
+
+    state = await session.get(SourceLoadState, source.id)
+    assert state.acked_offset == ROWS_COUNT
+    assert state.is_finished is True
+
+
+@pytest.mark.asyncio
+async def test_finished_load_starts_from_first_row(
+    session: AsyncSession, source: Source, monkeypatch
+):
+    """TEST Load after finished one sends all rows with new load id"""
+    client = FakeDataviewClient()
+    monkeypatch.setattr(dataview_manager_utils, "DataviewClient", client)
+    await dataview_manager_utils.load_data_with_checkpoints(
+        session, source, get_requests(source.id), SEGMENT_SIZE
+    )
+    first_load_id = client.rows[0].load_id
+
+    client = FakeDataviewClient()
+    monkeypatch.setattr(dataview_manager_utils, "DataviewClient", client)
+    await dataview_manager_utils.load_data_with_checkpoints(
+        session, source, get_requests(source.id), SEGMENT_SIZE
+    )
+
+    assert len(client.rows) == ROWS_COUNT
+    assert client.rows[0].sequence == 0
+    assert client.rows[0].load_id != first_load_id
+
+
+@pytest.mark.asyncio
+async def test_load_is_sent_by_one_call_without_segmented_insert(
+    session: AsyncSession, source: Source, monkeypatch
+):
+    """TEST Without DATAVIEW_SEGMENTED_INSERT all rows are sent by one call"""
+    monkeypatch.setattr(
+        dataview_manager_utils, "DATAVIEW_SEGMENTED_INSERT", False
+    )
+    client = FakeDataviewClient()
+    monkeypatch.setattr(dataview_manager_utils, "DataviewClient", client)
+    await dataview_manager_utils.load_data_with_checkpoints(
+        session, source, get_requests(source.id)
+    )
+
+    assert client.calls == 1
+    assert len(client.rows) == ROWS_COUNT
+
+
+@pytest.mark.asyncio
+async def test_empty_source_sends_nothing(
+    session: AsyncSession, source: Source, monkeypatch
+):
+    """TEST Load without rows does not call InsertData and is finished"""
+    client = FakeDataviewClient()
+    monkeypatch.setattr(dataview_manager_utils, "DataviewClient", client)
+    await dataview_manager_utils.load_data_with_checkpoints(
+        session, source, iter(()), SEGMENT_SIZE
+    )
+
+    assert client.calls == 0
+    state = await session.get(SourceLoadState, source.id)
+    assert state.is_finished is True
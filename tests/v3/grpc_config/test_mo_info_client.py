@@ -0,0 +1,110 @@
+import functools
+import pickle
+
+import pytest
+
+from v3.grpc_config.mo_info.mo_info_pb2 import ResponseObjWithParamsLimited
+from v3.grpc_config.mo_info_client import MOInfoClient
+from v3.grpc_config.object_batch import (
+    MSGPACK_ENCODING,
+    decode_objects,
+    encode_msgpack_batch,
+    loads_hex_pickle,
+)
+from v3.routers.sources.sources_managers.inventory_manager import (
+    InventorySourceManager,
+)
+from v3.routers.sources.utils.exceptions import InternalError
+
+OBJECTS_COUNT = 12
+PAGE_SIZE = 5
+
+
+@pytest.fixture(name="send_total", params=[False])
+def send_total_fixture(request):
+    return request.param
+
+
+@pytest.fixture(name="requested_offsets")
+def requested_offsets_fixture(monkeypatch, send_total):
+    requested_offsets = []
+
+    def get_page(stub, tmo_id, columns, limit, offset):
+        requested_offsets.append(offset)
+        end = min(offset + limit, OBJECTS_COUNT)
+        total = OBJECTS_COUNT if send_total and offset == 0 else None
+        return [{"id": idx} for idx in range(offset, end)], total
+
+    monkeypatch.setattr(MOInfoClient, "_get_page", staticmethod(get_page))
+    monkeypatch.setattr(MOInfoClient, "get_columns", lambda tmo_id: ["id"])
+    return requested_offsets
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_data_pages_returns_all_objects(requested_offsets, prefetch):
+    """TEST All objects are returned when TMO has more objects than page size"""
+    pages = [
+        page
+        for page, _ in MOInfoClient.iter_data_pages(
+            tmo_id=1, columns=[], page_size=PAGE_SIZE, prefetch=prefetch
+        )
+    ]
+
+    assert [len(page) for page in pages] == [5, 5, 2]
+    assert [item["id"] for page in pages for item in page] == list(
+        range(OBJECTS_COUNT)
+    )
+    assert requested_offsets == [0, 5, 10]
+
+
+@pytest.mark.parametrize(
+    "send_total, counts",
+    [
+        (True, [OBJECTS_COUNT] * OBJECTS_COUNT),
+        (False, [5] * 5 + [10] * 5 + [12] * 2),
+    ],
+    indirect=["send_total"],
+)
+def test_inventory_requests_are_streamed(
+    requested_offsets, monkeypatch, counts
+):
+    """TEST Requests of paged inventory source are sent as pages arrive,
+    count is total if inventory sends it"""
+    monkeypatch.setattr(
+        MOInfoClient,
+        "iter_data_pages",
+        functools.partial(
+            MOInfoClient.iter_data_pages, page_size=PAGE_SIZE, prefetch=False
+        ),
+    )
+    manager = InventorySourceManager(
+        con_data={"tmo_id": 1, "source_data_columns": None}
+    )
+
+    requests = manager.get_source_data_for_grpc(source_id=1)
+    next(requests)
+    assert requested_offsets == [0]
+
+    assert [counts[0]] + [request.count for request in requests] == counts
+
+
+def test_decode_objects_reads_msgpack_batches_and_legacy_rows():
+    """TEST Objects are decoded from msgpack batches and hex-pickle rows"""
+    objects = [{"id": 1, "name": "first"}, {"id": 2, "name": None}]
+    responses = [
+        ResponseObjWithParamsLimited(
+            encoding=MSGPACK_ENCODING,
+            data_batch=encode_msgpack_batch(objects),
+        ),
+        ResponseObjWithParamsLimited(data=pickle.dumps({"id": 3}).hex()),
+    ]
+
+    assert decode_objects(responses, loads_hex_pickle) == objects + [{"id": 3}]
+
+
+def test_decode_objects_raises_error_on_unknown_encoding():
+    """TEST Error is raised when server answers with unsupported encoding"""
+    responses = [ResponseObjWithParamsLimited(encoding="arrow", data_batch=b"")]
+
+    with pytest.raises(InternalError):
+        decode_objects(responses, loads_hex_pickle)
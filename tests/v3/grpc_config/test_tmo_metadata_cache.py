@@ -0,0 +1,47 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from v3.grpc_config.tmo_metadata_cache import TMOMetadataCache
+
+
+def test_concurrent_misses_call_loader_once():
+    """TEST Concurrent misses of the same key are served by one loader call"""
+    cache = TMOMetadataCache(ttl=60)
+    calls = []
+    lock = threading.Lock()
+
+    def loader():
+        with lock:
+            calls.append(1)
+        time.sleep(0.05)
+        return ["name", "tmo_id"]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda _: cache.get_or_load((1, "columns"), loader), range(8)
+            )
+        )
+
+    assert len(calls) == 1
+    assert all(result == ["name", "tmo_id"] for result in results)
+    assert cache.stats.misses == 8
+    assert cache.get_or_load((1, "columns"), loader) == ["name", "tmo_id"]
+    assert cache.stats.hits == 1
+
+
+def test_invalidate_drops_only_given_tmo_and_returns_copies():
+    """TEST Invalidation of tmo drops its keys, cached values are copied"""
+    cache = TMOMetadataCache(ttl=60)
+    first = cache.get_or_load((1, "columns"), lambda: {"name": "str"})
+    first["tmo_id"] = "int"
+    cache.get_or_load((2, "columns"), lambda: {"name": "str"})
+
+    cache.invalidate(1)
+
+    assert cache.stats.size == 1
+    assert cache.get_or_load((1, "columns"), lambda: {"id": "int"}) == {
+        "id": "int"
+    }
+    assert cache.get_or_load((2, "columns"), lambda: {}) == {"name": "str"}
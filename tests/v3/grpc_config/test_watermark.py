@@ -0,0 +1,113 @@
+import pytest
+import pytest_asyncio
+from pydantic import ValidationError
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from v3.database.schemas import Source, SourceLoadState
+from v3.grpc_config import dataview_manager_utils
+from v3.grpc_config.load_state import dump_watermark
+from v3.routers.sources.models.db_model import DBConnectionModelCreate
+from v3.routers.sources.models.general_model import SourceType
+from v3.routers.sources.sources_managers import db_manager
+from v3.routers.sources.sources_managers.db_manager import DBSourceManager
+
+from .utils import FakeDataviewClient
+
+CON_DATA = {
+    "db_type": "postgresql",
+    "host": "localhost",
+    "port": 5432,
+    "user": "user",
+    "password": "password",
+    "db_name": "db",
+    "db_table": "events",
+    "watermark_column": "id",
+}
+
+
+@pytest.fixture(name="events")
+def events_fixture(tmp_path, monkeypatch):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'source.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    meta_data = MetaData()
+    table = Table(
+        "events",
+        meta_data,
+        Column("id", Integer, primary_key=True),
+        Column("name", String),
+    )
+    meta_data.create_all(engine)
+    monkeypatch.setattr(db_manager, "create_engine", lambda *_, **__: engine)
+
+    def insert(ids):
+        with engine.begin() as connection:
+            connection.execute(
+                table.insert(), [{"id": idx, "name": str(idx)} for idx in ids]
+            )
+
+    yield insert
+    db_manager.ENGINE_CACHE.clear()
+    db_manager.TABLE_CACHE.clear()
+
+
+@pytest_asyncio.fixture(name="source")
+async def source_fixture(create_source):
+    return await create_source(SourceType.DB.value, CON_DATA)
+
+
+async def load(session, source, monkeypatch, full=False) -> list[int]:
+    client = FakeDataviewClient()
+    monkeypatch.setattr(dataview_manager_utils, "DataviewClient", client)
+    requests = await dataview_manager_utils.get_incremental_data(
+        session, source, DBSourceManager(CON_DATA), "id", full=full
+    )
+    await dataview_manager_utils.load_data_with_checkpoints(
+        session, source, requests
+    )
+    rows = [int(row.data_row["id"]) for row in client.rows]
+    # nothing is sent to dataview if there are no new rows
+    assert client.calls == (1 if rows else 0)
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_incremental_loads_send_only_new_rows(
+    session: AsyncSession, source: Source, events, monkeypatch
+):
+    """TEST Each load sends rows after watermark and advances it"""
+    events(range(10))
+    assert await load(session, source, monkeypatch) == list(range(10))
+
+    events(range(10, 15))
+    assert await load(session, source, monkeypatch) == list(range(10, 15))
+
+    assert await load(session, source, monkeypatch) == []
+    state = await session.get(SourceLoadState, source.id)
+    assert state.watermark == dump_watermark(14)
+    assert state.pending_watermark is None
+
+
+@pytest.mark.asyncio
+async def test_full_loads_advance_watermark(
+    session: AsyncSession, source: Source, events, monkeypatch
+):
+    """TEST Full load (dataview without row operations) sends all rows and
+    advances watermark for the next incremental load"""
+    events(range(10))
+    await load(session, source, monkeypatch)
+    events(range(10, 15))
+    assert await load(session, source, monkeypatch, full=True) == list(
+        range(15)
+    )
+
+    events(range(15, 17))
+    assert await load(session, source, monkeypatch) == [15, 16]
+
+
+def test_watermark_can_not_be_used_with_delta_load():
+    """TEST Incremental load can not be combined with delta load"""
+    with pytest.raises(ValidationError):
+        DBConnectionModelCreate(**CON_DATA, delta_load={"key_columns": ["id"]})
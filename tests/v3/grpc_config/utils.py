@@ -0,0 +1,43 @@
+import grpc
+
+from v3.grpc_config.dataflow_to_dataview.proto.data_carrier_pb2 import (
+    DataRequest,
+    Response,
+)
+
+
+class FakeContext:
+    async def abort(self, code, details):
+        raise grpc.RpcError(code, details)
+
+
+class FakeDataviewClient:
+    """Stores received rows, fails the call after fail_after rows"""
+
+    def __init__(self, fail_after: int | None = None):
+        self.rows: list[DataRequest] = []
+        self.fail_after = fail_after
+        self.calls = 0
+
+    async def create_source(self, group_id, source_id, source_name):
+        return Response(status="OK")
+
+    async def config_source(self, source_id, columns):
+        return Response(status="OK")
+
+    async def insert_data(self, request_iterator):
+        self.calls += 1
+        async for request in request_iterator:
+            if (
+                self.fail_after is not None
+                and len(self.rows) >= self.fail_after
+            ):
+                raise grpc.aio.AioRpcError(
+                    grpc.StatusCode.UNAVAILABLE,
+                    grpc.aio.Metadata(),
+                    grpc.aio.Metadata(),
+                )
+            copied = DataRequest()
+            copied.CopyFrom(request)
+            self.rows.append(copied)
+        return Response(status="OK")
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from v3.database.schemas import Source, SourceGroup
 from v3.routers.groups.models import SourceMappingTypes
 from v3.routers.sources.models.general_model import SourceType
+from v3.utils import encryption_utils
 
 SOURCE_DATA = {
     "name": "Test source",
@@ -78,3 +79,28 @@ async def test_creating_source_raises_cant_create_without_group(
     session.add(source)
     with pytest.raises(IntegrityError):
         await session.commit()
+
+
+def test_decoded_con_data_is_cached_and_copied(monkeypatch):
+    """TEST con_data is decrypted once per ciphertext, callers get copies"""
+    cache = encryption_utils.DecryptedDataCache(maxsize=2)
+    monkeypatch.setattr(encryption_utils, "CON_DATA_CACHE", cache)
+    decrypted = []
+    decrypt_data = encryption_utils.decrypt_data
+
+    def count_decrypt(data):
+        decrypted.append(data)
+        return decrypt_data(data)
+
+    monkeypatch.setattr(encryption_utils, "decrypt_data", count_decrypt)
+    source = Source(**SOURCE_DATA)
+    source.con_data = {"host": "localhost", "columns": ["a"]}
+
+    first = source.decoded_data()["con_data"]
+    first["columns"].append("b")
+    assert source.decoded_data()["con_data"]["columns"] == ["a"]
+    assert len(decrypted) == 1
+
+    source.con_data = {"host": "remote"}
+    assert source.decoded_data()["con_data"] == {"host": "remote"}
+    assert len(decrypted) == 2
@@ -0,0 +1,347 @@
+import asyncio
+import io
+import json
+import threading
+import time
+
+import httpx
+import pytest
+from requests import Response
+
+from v3.routers.sources.sources_managers import api_manager
+from v3.routers.sources.sources_managers.api_manager import APISourceManager
+from v3.routers.sources.sources_managers.api_manager_utils.async_fetch import (
+    AsyncHTTPClient,
+)
+from v3.routers.sources.sources_managers.api_manager_utils.utils import (
+    RESTAPIResponseTypes,
+)
+
+from .utils import END_POINT, ITEMS, make_response, patch_get
+
+
+def get_manager(**con_data) -> APISourceManager:
+    return APISourceManager(
+        {
+            "end_point": END_POINT,
+            "auth_type": "No authentication",
+            "auth_data": {},
+            **con_data,
+        }
+    )
+
+
+@pytest.fixture(name="calls")
+def calls_fixture(monkeypatch):
+    calls = []
+
+    def get(url, params=None, **kwargs):
+        calls.append((url, dict(params or {})))
+        params = params or {}
+        if "offset" in params:
+            offset, limit = params["offset"], params["limit"]
+            return make_response(ITEMS[offset : offset + limit])
+        if "page" in params:
+            start = (params["page"] - 1) * params["limit"]
+            return make_response(ITEMS[start : start + params["limit"]])
+        if url.endswith("/cursor"):
+            start = int(params.get("cursor", 0))
+            next_cursor = start + 3 if start + 3 < len(ITEMS) else None
+            return make_response(
+                {
+                    "data": {"items": ITEMS[start : start + 3]},
+                    "meta": {"next": next_cursor},
+                },
+                url=url,
+            )
+        start = int(url.rsplit("=", 1)[-1]) if "start=" in url else 0
+        headers = {}
+        if start + 3 < len(ITEMS):
+            headers["Link"] = f'<?start={start + 3}>; rel="next"'
+        return make_response(ITEMS[start : start + 3], url=url, headers=headers)
+
+    patch_get(monkeypatch, get)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "pagination",
+    [
+        {"type": "offset", "page_size": 3},
+        {"type": "page", "page_size": 3},
+        {"type": "link_header", "size_param": None},
+    ],
+)
+def test_all_pages_are_loaded(calls, pagination):
+    """TEST Pages are requested until the short (or last linked) page"""
+    manager = get_manager(pagination=pagination)
+
+    df = manager.get_source_all_data()
+
+    assert df.to_dict("records") == ITEMS
+    assert len(calls) == 3
+
+
+def test_cursor_pages_are_streamed(calls):
+    """TEST Cursor is taken from response, records are found by path"""
+    manager = get_manager(
+        end_point=END_POINT + "/cursor",
+        obj_name_from_resp="data.items",
+        pagination={
+            "type": "cursor",
+            "size_param": None,
+            "cursor_path": "meta.next",
+        },
+        source_data_columns=["id"],
+    )
+
+    requests_ = list(manager.get_source_data_for_grpc(source_id=1))
+
+    assert [r.data_row.get("id", "0") for r in requests_] == [
+        str(item["id"]) for item in ITEMS
+    ]
+    # count is number of rows received so far
+    assert [r.count for r in requests_] == [3, 3, 3, 6, 6, 6, 7]
+    assert [params for _, params in calls] == [{}, {"cursor": 3}, {"cursor": 6}]
+
+
+def test_pages_stop_at_limit(calls):
+    """TEST Pages after the one reaching limit are not requested"""
+    manager = get_manager(
+        pagination={"type": "offset", "page_size": 3}, limit=4
+    )
+
+    df = manager.get_source_all_data()
+
+    assert list(df["id"]) == [0, 1, 2, 3]
+    assert len(calls) == 2
+
+
+def test_pagination_stops_when_api_ignores_params(monkeypatch):
+    """TEST Pagination stops when API returns the same page again"""
+    calls = []
+
+    def get(url, params=None, **kwargs):
+        calls.append(params)
+        return make_response(ITEMS)
+
+    patch_get(monkeypatch, get)
+    manager = get_manager(pagination={"type": "page", "page_size": 3})
+
+    pages = list(manager.iter_pages())
+
+    assert len(calls) == 2
+    assert [len(page) for page in pages] == [len(ITEMS)]
+
+
+@pytest.mark.parametrize(
+    "pagination",
+    [
+        {"type": "offset", "page_size": 2, "total_path": "total"},
+        {"type": "page", "page_size": 2, "pages_path": "pages"},
+    ],
+)
+def test_pages_are_requested_concurrently_in_order(monkeypatch, pagination):
+    """TEST Pages after the first one are requested concurrently when number
+    of pages is known, rows are returned in order of pages"""
+
+    def get_body(params):
+        if "offset" in params:
+            start = int(params["offset"])
+        else:
+            start = (int(params["page"]) - 1) * 2
+        return {"items": ITEMS[start : start + 2], "total": 7, "pages": 4}
+
+    patch_get(
+        monkeypatch,
+        lambda url, params=None, **kwargs: make_response(get_body(params)),
+    )
+    lock = threading.Lock()
+    active, max_active = 0, 0
+
+    async def handler(request: httpx.Request):
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        params = dict(request.url.params)
+        # the second page is the slowest one
+        is_second = params.get("offset") == "2" or params.get("page") == "2"
+        await asyncio.sleep(0.1 if is_second else 0.01)
+        with lock:
+            active -= 1
+        return httpx.Response(200, json=get_body(params))
+
+    monkeypatch.setattr(
+        api_manager,
+        "HTTP_CLIENT",
+        AsyncHTTPClient(transport=httpx.MockTransport(handler)),
+    )
+    manager = get_manager(
+        obj_name_from_resp="items",
+        pagination={**pagination, "concurrency": 3},
+    )
+
+    df = manager.get_source_all_data()
+
+    assert df.to_dict("records") == ITEMS
+    assert max_active > 1
+
+
+def test_rate_limit_spaces_requests(monkeypatch):
+    """TEST Concurrent requests are started at most rate_limit per second"""
+    patch_get(
+        monkeypatch,
+        lambda url, params=None, **kwargs: make_response(
+            {"items": ITEMS[:1], "total": 4}
+        ),
+    )
+    started = []
+
+    def handler(request: httpx.Request):
+        started.append(time.monotonic())
+        return httpx.Response(200, json={"items": ITEMS[:1], "total": 4})
+
+    monkeypatch.setattr(
+        api_manager,
+        "HTTP_CLIENT",
+        AsyncHTTPClient(transport=httpx.MockTransport(handler)),
+    )
+    manager = get_manager(
+        obj_name_from_resp="items",
+        pagination={
+            "type": "offset",
+            "page_size": 1,
+            "total_path": "total",
+            "rate_limit": 20,
+        },
+    )
+
+    list(manager.iter_pages())
+
+    assert len(started) == 3
+    assert started[-1] - started[0] >= 0.09
+
+
+def test_response_is_fetched_and_parsed_once(calls, monkeypatch):
+    """TEST Columns, response type and data of one manager are got by one
+    request and one JSON parsing"""
+    parsed = []
+    response_json = Response.json
+
+    def count_json(response, **kwargs):
+        parsed.append(response)
+        return response_json(response, **kwargs)
+
+    monkeypatch.setattr(Response, "json", count_json)
+    manager = get_manager()
+
+    assert manager.get_source_data_columns() == ["id", "name"]
+    assert (
+        manager.get_response_type()
+        == RESTAPIResponseTypes.LIST_OF_OBJECTS.value
+    )
+    requests_ = list(manager.get_source_data_for_grpc(source_id=1))
+
+    assert len(requests_) == 3
+    assert len(calls) == 1
+    assert len(parsed) == 1
+
+
+def test_response_is_streamed_by_chunks(monkeypatch):
+    """TEST Records are parsed from response body as it is received and
+    returned by chunks of stream_chunk_size rows"""
+    body = {"meta": {"skipped": ITEMS}, "data": {"items": ITEMS}}
+    streamed = []
+
+    def get(url, stream=False, **kwargs):
+        streamed.append(stream)
+        response = make_response(None)
+        response._content = False
+        response.raw = io.BytesIO(json.dumps(body).encode())
+        return response
+
+    def fail_json(response, **kwargs):
+        raise AssertionError("response must not be parsed at once")
+
+    patch_get(monkeypatch, get)
+    monkeypatch.setattr(Response, "json", fail_json)
+    con_data = {"obj_name_from_resp": "data.items", "stream_chunk_size": 3}
+
+    pages = list(get_manager(**con_data).iter_pages())
+    assert [len(df) for df in pages] == [3, 3, 1]
+    assert (
+        get_manager(**con_data).get_source_all_data().to_dict("records")
+        == ITEMS
+    )
+    assert [len(df) for df in get_manager(**con_data).iter_pages(4)] == [3, 1]
+    assert get_manager(**con_data).get_source_data_columns() == ["id", "name"]
+    assert all(streamed)
+
+
+def test_streamed_load_holds_one_chunk(monkeypatch):
+    """TEST Load sends rows of each chunk before the rest of response body
+    is read, so at most one chunk is kept in memory"""
+    items = [{"id": idx, "name": f"item_{idx}"} for idx in range(1000)]
+    body = io.BytesIO(json.dumps(items).encode())
+    chunk_sizes = []
+
+    def get(url, **kwargs):
+        response = make_response(None)
+        response._content = False
+        response.raw = body
+        return response
+
+    records_to_data_frame = (
+        APISourceManager._APISourceManager__records_to_data_frame
+    )
+
+    def count_chunk(manager, records):
+        chunk_sizes.append(len(records))
+        return records_to_data_frame(manager, records)
+
+    patch_get(monkeypatch, get)
+    monkeypatch.setattr(api_manager, "STREAM_READ_SIZE", 256)
+    monkeypatch.setattr(
+        APISourceManager,
+        "_APISourceManager__records_to_data_frame",
+        count_chunk,
+    )
+    manager = get_manager(stream_chunk_size=10)
+
+    requests_ = manager.get_source_data_for_grpc(source_id=1)
+    first = next(requests_)
+    assert first.count == 10
+    assert chunk_sizes == [10]
+    assert body.tell() < len(body.getvalue()) / 10
+
+    assert len(list(requests_)) == len(items) - 1
+    assert max(chunk_sizes) == 10
+    assert len(chunk_sizes) == 100
+
+
+def test_nested_records_are_flattened(monkeypatch):
+    """TEST Nested objects become dotted columns, arrays are exploded or
+    joined"""
+    orders = [
+        {
+            "id": 1,
+            "customer": {"name": "A", "address": {"city": "X"}},
+            "tags": ["new", "paid"],
+            "lines": [{"sku": "S1"}, {"sku": "S2"}],
+        },
+        {"id": 2, "customer": {"name": "B"}, "tags": [], "lines": []},
+    ]
+    patch_get(monkeypatch, lambda url, **kwargs: make_response(orders))
+    manager = get_manager(flatten={"explode": ["lines"]})
+
+    assert manager.get_source_data_columns() == [
+        "id",
+        "tags",
+        "customer.name",
+        "customer.address.city",
+        "lines.sku",
+    ]
+    df = manager.get_source_all_data()
+    assert df["lines.sku"].tolist()[:2] == ["S1", "S2"]
+    assert df["tags"].tolist() == ["new,paid", "new,paid", ""]
@@ -0,0 +1,127 @@
+import time
+
+import pytest
+import requests
+from requests_oauthlib import OAuth2Session
+
+from v3.routers.sources.sources_managers import api_manager
+from v3.routers.sources.sources_managers.api_manager import APISourceManager
+
+from .utils import make_response
+
+REVOKED_TOKEN = "revoked"  # noqa: S105
+OPENID_AUTH_DATA = {
+    "client_id": "client",
+    "client_secret": "secret",
+    "token_url": "http://auth.local/token",
+    "username": "user",
+    "password": "password",
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    yield
+    api_manager.SESSIONS.clear()
+    api_manager.TOKENS.clear()
+
+
+@pytest.fixture(name="sent")
+def sent_fixture(monkeypatch):
+    """Tokens and sessions of sent requests, 401 is returned for
+    REVOKED_TOKEN"""
+    sent = []
+
+    def request(session, method, url, auth=None, **kwargs):
+        token = getattr(auth, "token", None)
+        sent.append((session, token))
+        response = make_response([{"id": 1}])
+        if token == REVOKED_TOKEN:
+            response.status_code = 401
+        return response
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    return sent
+
+
+@pytest.fixture(name="token_requests")
+def token_requests_fixture(monkeypatch):
+    token_requests = []
+    tokens = iter(["first", "second", "third"])
+
+    def fetch_token(self, **kwargs):
+        token_requests.append("fetch")
+        return {"access_token": next(tokens), "expires_in": 3600}
+
+    def refresh_token(self, token_url, refresh_token=None, **kwargs):
+        token_requests.append(("refresh", refresh_token))
+        return {"access_token": next(tokens), "expires_in": 3600}
+
+    monkeypatch.setattr(OAuth2Session, "fetch_token", fetch_token)
+    monkeypatch.setattr(OAuth2Session, "refresh_token", refresh_token)
+    return token_requests
+
+
+def get_manager(auth_type: str, auth_data: dict) -> APISourceManager:
+    return APISourceManager(
+        {
+            "end_point": "http://api.local/items",
+            "auth_type": auth_type,
+            "auth_data": auth_data,
+        }
+    )
+
+
+def test_session_is_reused_by_source(sent):
+    """TEST Requests of the same source are sent by one pooled session"""
+    auth_data = {"username": "user", "password": "password"}
+    get_manager("Basic Authentication", auth_data).check_connection()
+    get_manager("Basic Authentication", auth_data).check_connection()
+    get_manager("No authentication", {}).check_connection()
+
+    assert sent[0][0] is sent[1][0]
+    assert sent[0][0] is not sent[2][0]
+    assert isinstance(sent[0][0].auth, requests.auth.HTTPBasicAuth)
+    assert len(api_manager.SESSIONS) == 2
+
+
+def test_oauth_token_is_fetched_once(sent, token_requests):
+    """TEST OpenID token is fetched once and reused until it expires"""
+    for _ in range(3):
+        get_manager("OpenID", OPENID_AUTH_DATA).check_connection()
+
+    assert token_requests == ["fetch"]
+    assert [token for _, token in sent] == ["first"] * 3
+
+
+def test_expired_oauth_token_is_refreshed(sent, token_requests, monkeypatch):
+    """TEST Expired token is refreshed with refresh token"""
+    manager = get_manager("OpenID", OPENID_AUTH_DATA)
+    key = api_manager.get_auth_key("OpenID", OPENID_AUTH_DATA)
+    api_manager.TOKENS.get(
+        key,
+        fetch=lambda: {
+            "access_token": "expired",
+            "refresh_token": "refresh",
+            "expires_at": time.time() - 1,
+        },
+        refresh=None,
+    )
+
+    manager.check_connection()
+
+    assert token_requests == [("refresh", "refresh")]
+    assert sent[-1][1] == "first"
+
+
+def test_revoked_oauth_token_is_fetched_again(sent, token_requests):
+    """TEST Request is repeated with new token if cached token is rejected"""
+    key = api_manager.get_auth_key("OpenID", OPENID_AUTH_DATA)
+    api_manager.TOKENS.get(
+        key, fetch=lambda: {"access_token": REVOKED_TOKEN}, refresh=None
+    )
+
+    get_manager("OpenID", OPENID_AUTH_DATA).check_connection()
+
+    assert token_requests == ["fetch"]
+    assert [token for _, token in sent] == [REVOKED_TOKEN, "first"]
@@ -0,0 +1,198 @@
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine
+
+from v3.routers.sources.sources_managers import db_manager
+from v3.routers.sources.sources_managers.db_manager import DBSourceManager
+from v3.routers.sources.sources_managers.db_manager_utils.engine_cache import (
+    EngineCache,
+)
+from v3.routers.sources.utils.exceptions import ValidationError
+
+ROWS_COUNT = 1000
+
+
+@pytest.fixture(name="engine")
+def engine_fixture(tmp_path, monkeypatch):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'source.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    meta_data = MetaData()
+    table = Table(
+        "objects",
+        meta_data,
+        Column("id", Integer, primary_key=True),
+        Column("name", String),
+        Column("weight", Integer, nullable=True),
+    )
+    meta_data.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            table.insert(),
+            [
+                {
+                    "id": idx,
+                    "name": f"object_{idx}",
+                    "weight": None if idx % 10 == 0 else idx % 97,
+                }
+                for idx in range(ROWS_COUNT)
+            ],
+        )
+    monkeypatch.setattr(db_manager, "create_engine", lambda *_, **__: engine)
+    yield engine
+    db_manager.ENGINE_CACHE.clear()
+    db_manager.TABLE_CACHE.clear()
+
+
+def get_con_data(**kwargs) -> dict:
+    con_data = {
+        "db_type": "postgresql",
+        "host": "localhost",
+        "port": 5432,
+        "user": "user",
+        "password": "password",
+        "db_name": "db",
+        "db_table": "objects",
+    }
+    con_data.update(kwargs)
+    return con_data
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_partitioned_extraction_returns_all_rows(engine, ordered):
+    """TEST Partitioned read by primary key returns every row once"""
+    manager = DBSourceManager(
+        get_con_data(partitioning={"partitions": 4, "ordered": ordered})
+    )
+
+    requests = list(manager.get_source_data_for_grpc(source_id=1))
+
+    ids = [int(request.data_row["id"]) for request in requests]
+    assert sorted(ids) == list(range(ROWS_COUNT))
+    assert {request.count for request in requests} == {ROWS_COUNT}
+    if ordered:
+        assert ids == list(range(ROWS_COUNT))
+
+
+def test_partitioned_extraction_rejects_text_column(engine):
+    """TEST Partitioning by text column raises validation error"""
+    manager = DBSourceManager(
+        get_con_data(partitioning={"column": "name", "partitions": 3})
+    )
+
+    with pytest.raises(ValidationError):
+        manager.get_source_data_reader()
+
+
+def test_partitioned_extraction_reads_null_partition(engine):
+    """TEST Rows with NULL partition column value are not lost"""
+    manager = DBSourceManager(
+        get_con_data(partitioning={"column": "weight", "partitions": 3})
+    )
+
+    requests = list(manager.get_source_data_for_grpc(source_id=1))
+
+    assert len(requests) == ROWS_COUNT
+    nulls = [r for r in requests if r.data_row["weight"] == "None"]
+    assert len(nulls) == ROWS_COUNT // 10
+
+
+def test_streaming_extraction_counts_rows(engine):
+    """TEST Rows are read by chunks, count is got by COUNT(*) query"""
+    manager = DBSourceManager(get_con_data())
+    reader = manager.get_source_data_reader()
+    reader.fetch_size = 100
+
+    assert reader.probe() == ROWS_COUNT
+    assert [row.id for row in reader] == list(range(ROWS_COUNT))
+
+
+def test_engine_cache_reuses_engines_and_disposes_evicted(monkeypatch):
+    """TEST Engine is created once per URL, least recently used is disposed"""
+    cache = EngineCache(maxsize=2)
+    disposed = []
+    monkeypatch.setattr(
+        "sqlalchemy.engine.Engine.dispose",
+        lambda self: disposed.append(str(self.url)),
+    )
+
+    def get(name: str):
+        url = f"sqlite:///{name}.db"
+        return cache.get(url, 1, lambda: create_engine(url))
+
+    first = get("first")
+    get("second")
+    assert get("first") is first
+
+    get("third")
+
+    assert len(cache) == 2
+    assert disposed == ["sqlite:///second.db"]
+
+
+def test_table_is_reflected_once_and_tables_are_listed(engine, monkeypatch):
+    """TEST Only source table is reflected, reflection result is cached"""
+    manager = DBSourceManager(get_con_data())
+
+    assert manager.get_all_tables_from_db() == ["objects"]
+    assert manager.get_source_data_columns() == ["id", "name", "weight"]
+
+    monkeypatch.setattr(
+        "v3.routers.sources.sources_managers.db_manager_utils.reflection.Table",
+        lambda *_, **__: pytest.fail("table is reflected again"),
+    )
+    assert manager.get_columns_with_types() == {
+        "id": "int",
+        "name": "str",
+        "weight": "int",
+    }
+
+
+def test_filters_and_limit_are_pushed_down_to_query(engine):
+    """TEST Filters and limit are applied by WHERE and LIMIT of query"""
+    manager = DBSourceManager(
+        get_con_data(
+            source_data_columns=["id"],
+            filters=[
+                {"column": "weight", "operator": "ge", "value": 90},
+                {"column": "name", "operator": "ne", "value": "object_91"},
+            ],
+            limit=5,
+            partitioning={"partitions": 4},
+        )
+    )
+    reader = manager.get_source_data_reader()
+
+    assert "LIMIT" in str(reader.stmt)
+    assert reader.probe() == 5
+    assert [dict(row) for row in reader] == [
+        {"id": 92},
+        {"id": 93},
+        {"id": 94},
+        {"id": 95},
+        {"id": 96},
+    ]
+
+
+def test_null_filter_is_pushed_down_as_is_null(engine):
+    """TEST eq filter with null value selects rows with NULL column"""
+    manager = DBSourceManager(
+        get_con_data(filters=[{"column": "weight", "operator": "eq"}])
+    )
+
+    rows = list(manager.get_source_data_reader())
+
+    assert len(rows) == ROWS_COUNT // 10
+    assert all(row.weight is None for row in rows)
+
+
+def test_preview_selects_first_rows_with_limit(engine):
+    """TEST Preview returns first rows as strings, source limit is kept"""
+    manager = DBSourceManager(
+        get_con_data(source_data_columns=["id", "weight"], limit=2)
+    )
+
+    assert manager.preview(limit=5) == [
+        {"id": "0", "weight": None},
+        {"id": "1", "weight": "1"},
+    ]
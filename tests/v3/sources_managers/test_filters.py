@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+
+from v3.routers.sources.sources_managers.filters import (
+    filter_dataframe,
+    get_file_nrows,
+    get_file_usecols,
+)
+from v3.routers.sources.utils.exceptions import ResourceNotFoundError
+
+
+@pytest.fixture(name="df")
+def df_fixture():
+    # files are read with dtype=str
+    return pd.DataFrame(
+        {
+            "id": ["1", "2", "3", "4", None],
+            "name": ["a", "b", "c", "d", "e"],
+            "status": ["on", "off", "on", None, "on"],
+        }
+    )
+
+
+def test_filters_compare_numbers_of_string_columns(df):
+    """TEST Numeric filter values are compared with numeric column values"""
+    result = filter_dataframe(
+        df,
+        filters=[
+            {"column": "id", "operator": "ge", "value": 2},
+            {"column": "status", "operator": "in", "value": ["on", "off"]},
+        ],
+        limit=None,
+        columns=["name"],
+    )
+
+    assert result.to_dict("records") == [{"name": "b"}, {"name": "c"}]
+
+
+def test_null_filters_and_limit(df):
+    """TEST ne with null value keeps rows with values, limit is applied last"""
+    result = filter_dataframe(
+        df,
+        filters=[{"column": "status", "operator": "ne", "value": None}],
+        limit=2,
+    )
+
+    assert list(result["name"]) == ["a", "b"]
+
+
+def test_filter_of_missing_column_raises_error(df):
+    """TEST Filter of column missing in source raises error"""
+    with pytest.raises(ResourceNotFoundError):
+        filter_dataframe(
+            df, [{"column": "weight", "operator": "eq", "value": 1}], None
+        )
+
+
+def test_file_read_options_include_filter_columns():
+    """TEST Filter columns are read, rows are limited only without filters"""
+    filters = [{"column": "status", "operator": "eq", "value": "on"}]
+    usecols = get_file_usecols(["name"], filters)
+
+    assert usecols("name") and usecols("status") and not usecols("id")
+    assert get_file_usecols(None, filters) is None
+    assert get_file_nrows(filters, 10) is None
+    assert get_file_nrows(None, 10) == 10
@@ -0,0 +1,56 @@
+import pandas as pd
+import pytest
+
+from v3.routers.sources.sources_managers.file_manager_utils.utils import (
+    source_errors,
+)
+from v3.routers.sources.sources_managers.preview import (
+    cut_to_whole_lines,
+    dataframe_to_records,
+    to_preview_rows,
+)
+from v3.routers.sources.utils.exceptions import (
+    SourceConnectionError,
+    ValidationError,
+)
+
+
+def test_incomplete_last_line_is_dropped():
+    """TEST Content read by range ends with the last whole line"""
+    assert cut_to_whole_lines(b"a;b\n1;2\n3;", 10) == b"a;b\n1;2\n"
+    assert cut_to_whole_lines("a;b\n1;2\n3;", 10) == "a;b\n1;2\n"
+    # whole file is shorter than range
+    assert cut_to_whole_lines(b"a;b\n1;2", 10) == b"a;b\n1;2"
+
+
+def test_header_longer_than_read_size_raises_error():
+    """TEST Preview of file without whole line in read range is rejected"""
+    with pytest.raises(ValidationError):
+        cut_to_whole_lines(b"a;b;c;d;e;f", 10)
+
+
+def test_source_errors_are_converted():
+    """TEST Backend and parser errors of file sources become custom
+    exceptions"""
+    with pytest.raises(SourceConnectionError):
+        with source_errors((ConnectionError,)):
+            raise ConnectionResetError("reset")
+    with pytest.raises(ValidationError):
+        with source_errors():
+            raise pd.errors.ParserError("bad line")
+
+
+def test_missing_values_are_returned_as_none():
+    """TEST NaN, NaT and NA values of preview rows are None"""
+    df = pd.DataFrame(
+        {
+            "id": pd.array([1, None], dtype="Int64"),
+            "date": pd.to_datetime(["2024-01-01", None]),
+            "value": [0.5, float("nan")],
+        }
+    )
+
+    assert to_preview_rows(dataframe_to_records(df)) == [
+        {"id": "1", "date": "2024-01-01 00:00:00", "value": "0.5"},
+        {"id": None, "date": None, "value": None},
+    ]
@@ -0,0 +1,25 @@
+import json
+
+import requests
+from requests import Response
+
+END_POINT = "http://api.local/items"
+ITEMS = [{"id": idx, "name": f"item_{idx}"} for idx in range(7)]
+
+
+def make_response(body, url: str = END_POINT, headers: dict | None = None):
+    response = Response()
+    response.status_code = 200
+    response.url = url
+    response._content = json.dumps(body).encode()
+    response.headers.update(headers or {})
+    return response
+
+
+def patch_get(monkeypatch, get):
+    """Replaces requests of pooled sessions by get(url, params, **kwargs)"""
+    monkeypatch.setattr(
+        requests.Session,
+        "request",
+        lambda session, method, url, **kwargs: get(url, **kwargs),
+    )